@@ -0,0 +1,343 @@
+"""
+Micro-benchmarks for every resource and type method against a mock transport.
+
+Each case is run ``--iterations`` times against :class:`fixtures.MockAPI`, and
+the client-side overhead (wall time minus the time spent inside the mock
+handler) is reported as calls/sec, p50 and p99.  A second, shorter pass under
+``tracemalloc`` reports the peak memory allocated per call.
+
+Usage::
+
+    python -m benchmarks.bench
+    python -m benchmarks.bench -k swap_history -n 200
+    python -m benchmarks.bench -k feed --csv-feed
+    python -m benchmarks.bench --json bench.json
+    python -m benchmarks.bench --baseline bench.json --tolerance 0.25
+
+With ``--baseline`` the process exits non-zero if any case's p50 regresses by
+more than ``--tolerance`` relative to the baseline file.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import tracemalloc
+from dataclasses import asdict, dataclass
+from time import perf_counter_ns
+from typing import Awaitable, Callable, Optional
+from uuid import UUID
+
+from empyrealSDK import EmpyrealSDK
+from empyrealSDK.types import DexPair, Token, UniswapV2, User, Wallet
+from empyrealSDK.types.application import Application
+from empyrealSDK.types.network import Network
+from empyrealSDK.types.token import TokenAmount
+from empyrealSDK.types.vault import VaultType
+
+from . import fixtures as fx
+
+Case = Callable[[EmpyrealSDK], Awaitable]
+
+
+def _token() -> Token:
+    return Token(**fx.TOKEN_JSON)
+
+
+def _wallet() -> Wallet:
+    return Wallet(**fx.WALLET_JSON)
+
+
+def _application() -> Application:
+    return Application(**fx.APP_JSON)
+
+
+def _user() -> User:
+    return User(**fx.USER_JSON)
+
+
+def _pair() -> DexPair:
+    return DexPair(
+        factory_address=fx.FACTORY,
+        token0=Token(**fx.TOKEN_JSON),
+        token1=Token(**fx.WETH_JSON),
+        address=fx.PAIR,
+        index=154_123,
+        fee=0.003,
+        network=Network.Ethereum,
+        block_number=17_046_833,
+        transaction_hash=fx.TX_HASH,
+        factory=UniswapV2,
+    )
+
+
+def _uncached(case: Case, cache: str = "cache") -> Case:
+    """Clear one of the SDK's caches before each call, to time the request not a hit"""
+
+    def run(sdk: EmpyrealSDK) -> Awaitable:
+        getattr(sdk, cache).clear()
+        return case(sdk)
+
+    return run
+
+
+TOKEN_ID = UUID(fx.TOKEN_ID)
+WALLET_ID = UUID(fx.WALLET_ID)
+USER_ID = UUID(fx.USER_ID)
+
+CASES: dict[str, Case] = {
+    # resources
+    "token.lookup": lambda sdk: sdk.token.lookup(fx.TOKEN),
+    "token.transfer": lambda sdk: sdk.token.transfer(
+        TOKEN_ID, WALLET_ID, fx.WALLET_ADDRESS, 10**18
+    ),
+    "token.security": lambda sdk: sdk.token.security(TOKEN_ID, 1),
+    "token.balance_of": lambda sdk: sdk.token.balance_of(fx.TOKEN, fx.WALLET_ADDRESS),
+    "token.allowance": lambda sdk: sdk.token.allowance(
+        fx.TOKEN, fx.WALLET_ADDRESS, fx.ROUTER
+    ),
+    "token.approve": lambda sdk: sdk.token.approve(TOKEN_ID, WALLET_ID, fx.ROUTER),
+    "prices.get_taxes": lambda sdk: sdk.prices.get_taxes(fx.TOKEN, fx.WETH),
+    "prices.get_routes": lambda sdk: sdk.prices.get_routes(fx.TOKEN),
+    "prices.get_pair_info": lambda sdk: sdk.prices.get_pair_info(fx.PAIR),
+    "prices.get_token_pairs": lambda sdk: sdk.prices.get_token_pairs(fx.TOKEN),
+    "prices.get_liquidity": lambda sdk: sdk.prices.get_liquidity(fx.PAIR),
+    "prices.load_feed": lambda sdk: sdk.prices.load_feed(fx.PAIR),
+    "swap.ath": lambda sdk: sdk.swap.ath(fx.PAIR),
+    "swap.swap": lambda sdk: sdk.swap.swap([fx.WETH, fx.TOKEN], 10**17, WALLET_ID),
+    "swap.simulate": lambda sdk: sdk.swap.simulate(
+        [fx.WETH, fx.TOKEN], 10**17, fx.WALLET_ADDRESS
+    ),
+    "wallet.info": lambda sdk: sdk.wallet.info(WALLET_ID),
+    "wallet.load": lambda sdk: sdk.wallet.load(fx.WALLET_ADDRESS),
+    "wallet.get_app_wallets": lambda sdk: sdk.wallet.get_app_wallets(),
+    "wallet.get_user_wallets": lambda sdk: sdk.wallet.get_user_wallets(USER_ID),
+    "wallet.archive": lambda sdk: sdk.wallet.archive(WALLET_ID),
+    "wallet.make_app_wallet": lambda sdk: sdk.wallet.make_app_wallet("bench"),
+    "wallet.make_user_wallet": lambda sdk: sdk.wallet.make_user_wallet(
+        USER_ID, "bench"
+    ),
+    "wallet.update_wallet_data": lambda sdk: sdk.wallet.update_wallet_data(
+        WALLET_ID, notes={"tier": "gold"}
+    ),
+    "wallet.get_wallet_data": lambda sdk: sdk.wallet.get_wallet_data(WALLET_ID),
+    "vault.get_all": lambda sdk: sdk.vault.get_all(),
+    "vault.get_user_positions": lambda sdk: sdk.vault.get_user_positions(USER_ID),
+    "vault.make_new_app_vault": lambda sdk: sdk.vault.make_new_app_vault(
+        TOKEN_ID, VaultType.bank, "UserFunds", "bench"
+    ),
+    # types
+    "Application.load": lambda sdk: Application.load(),
+    "Application.update_swap_fee": lambda sdk: _application().update_swap_fee(0.005),
+    "Application.update_app_wallet": lambda sdk: _application().update_app_wallet(
+        _wallet()
+    ),
+    "Application.update_app_wallet(str)": lambda sdk: (
+        _application().update_app_wallet(fx.WALLET_ADDRESS)
+    ),
+    "Application.refresh_api_key": lambda sdk: _application().refresh_api_key(),
+    "Token.load": _uncached(lambda sdk: Token.load(fx.TOKEN)),
+    "Token.allowance": lambda sdk: _token().allowance(fx.WALLET_ADDRESS, fx.ROUTER),
+    "Token.approve": lambda sdk: _token().approve(_wallet(), fx.ROUTER),
+    "Token.transfer": lambda sdk: _token().transfer(
+        _wallet(), fx.WALLET_ADDRESS, TokenAmount(amount=10**18)
+    ),
+    "Token.balance_of": lambda sdk: _token().balance_of(_wallet()),
+    "Token.balance_of(str)": lambda sdk: _token().balance_of(fx.WALLET_ADDRESS),
+    "Token.security": _uncached(lambda sdk: _token().security()),
+    "User.load": _uncached(lambda sdk: User.load("123456789"), "user_cache"),
+    "User.create": lambda sdk: User.create("bench"),
+    "User.get_app_wallets": lambda sdk: _user().get_app_wallets(),
+    "User.make_wallet": lambda sdk: _user().make_wallet("bench"),
+    "Wallet.get_all": lambda sdk: Wallet.get_all(),
+    "Wallet.create": lambda sdk: Wallet.create("bench"),
+    "Wallet.load": lambda sdk: Wallet.load(fx.WALLET_ADDRESS),
+    "Wallet.load_private_key": lambda sdk: _wallet().load_private_key(),
+    "Wallet.get_data": lambda sdk: _wallet().get_data(),
+    "Wallet.update_data": lambda sdk: _wallet().update_data(notes={"tier": "gold"}),
+    "DexFactory.get_taxes": _uncached(lambda sdk: UniswapV2.get_taxes(fx.TOKEN)),
+    "DexFactory.get_price": lambda sdk: UniswapV2.get_price(fx.TOKEN),
+    "DexFactory.get_pair_info": _uncached(lambda sdk: UniswapV2.get_pair_info(fx.PAIR)),
+    "DexFactory.get_pairs": lambda sdk: UniswapV2.get_pairs(_token()),
+    "DexFactory.simulate_swap": lambda sdk: UniswapV2.simulate_swap(
+        [fx.WETH, fx.TOKEN], 10**17, fx.WALLET_ADDRESS
+    ),
+    "DexFactory.swap": lambda sdk: UniswapV2.swap(
+        [fx.WETH, fx.TOKEN], _wallet(), 10**17, 0.01
+    ),
+    "DexPair.all_time_high": lambda sdk: _pair().all_time_high(),
+    "DexPair.get_liquidity": lambda sdk: _pair().get_liquidity(),
+    "DexPair.get_taxes": _uncached(lambda sdk: _pair().get_taxes()),
+    "DexPair.swap_history": lambda sdk: _pair().swap_history(),
+    "DexPair.swap_columns": lambda sdk: _pair().swap_columns(),
+    "prices.load_feed_columns": lambda sdk: sdk.prices.load_feed_columns(fx.PAIR),
+}
+
+
+@dataclass
+class Result:
+    name: str
+    calls: int
+    calls_per_sec: float
+    p50_us: float
+    p99_us: float
+    peak_kib: float
+    error: Optional[str] = None
+
+
+def _percentile(samples: list[int], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct * (len(ordered) - 1))))
+    return ordered[index] / 1_000
+
+
+async def run_case(
+    name: str,
+    case: Case,
+    api: fx.MockAPI,
+    sdk: EmpyrealSDK,
+    iterations: int,
+    warmup: int,
+    alloc_iterations: int,
+) -> Result:
+    try:
+        for _ in range(warmup):
+            await case(sdk)
+    except Exception as e:
+        return Result(name, 0, 0.0, 0.0, 0.0, 0.0, error=f"{type(e).__name__}: {e}")
+
+    samples = []
+    for _ in range(iterations):
+        server_ns = api.server_ns
+        start = perf_counter_ns()
+        await case(sdk)
+        elapsed = perf_counter_ns() - start
+        samples.append(elapsed - (api.server_ns - server_ns))
+
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(alloc_iterations):
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            await case(sdk)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - baseline)
+    finally:
+        tracemalloc.stop()
+
+    total_s = sum(samples) / 1e9
+    return Result(
+        name=name,
+        calls=iterations,
+        calls_per_sec=iterations / total_s if total_s else 0.0,
+        p50_us=_percentile(samples, 0.50),
+        p99_us=_percentile(samples, 0.99),
+        peak_kib=(sum(peaks) / len(peaks) / 1024) if peaks else 0.0,
+    )
+
+
+async def run(
+    pattern: Optional[str] = None,
+    iterations: int = 500,
+    warmup: int = 20,
+    alloc_iterations: int = 20,
+    feed_rows: int = 1440,
+    columnar_feed: bool = True,
+) -> list[Result]:
+    api = fx.MockAPI(feed_rows=feed_rows, columnar_feed=columnar_feed)
+    sdk = EmpyrealSDK("bench-api-key", transport=api.transport())
+    results = []
+    for name, case in CASES.items():
+        if pattern and pattern not in name:
+            continue
+        # history decoding is orders of magnitude slower than the rest
+        n = (
+            max(1, iterations // 20)
+            if "feed" in name or "history" in name
+            else iterations
+        )
+        results.append(
+            await run_case(name, case, api, sdk, n, warmup, alloc_iterations)
+        )
+    return results
+
+
+def format_table(results: list[Result]) -> str:
+    width = max([30] + [len(r.name) for r in results])
+    header = (
+        f"{'case':<{width}} {'calls/s':>10} {'p50 us':>10} "
+        f"{'p99 us':>10} {'peak KiB':>10}"
+    )
+    lines = [header, "-" * len(header)]
+    for r in results:
+        if r.error:
+            lines.append(f"{r.name:<{width}} ERROR {r.error}")
+            continue
+        lines.append(
+            f"{r.name:<{width}} {r.calls_per_sec:>10.0f} {r.p50_us:>10.1f} "
+            f"{r.p99_us:>10.1f} {r.peak_kib:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def compare(
+    results: list[Result], baseline: dict[str, dict], tolerance: float
+) -> list[str]:
+    """Return a description of every case whose p50 regressed past ``tolerance``"""
+    regressions = []
+    for r in results:
+        previous = baseline.get(r.name)
+        if r.error or not previous or previous.get("error"):
+            continue
+        if r.p50_us > previous["p50_us"] * (1 + tolerance):
+            regressions.append(
+                f"{r.name}: p50 {previous['p50_us']:.1f}us -> {r.p50_us:.1f}us"
+            )
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-k", dest="pattern", help="only run cases containing this")
+    parser.add_argument("-n", "--iterations", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--alloc-iterations", type=int, default=20)
+    parser.add_argument("--feed-rows", type=int, default=1440)
+    parser.add_argument(
+        "--csv-feed",
+        action="store_true",
+        help="serve the price feed as CSV only, to compare against columnar",
+    )
+    parser.add_argument("--json", dest="json_path", help="write results to a file")
+    parser.add_argument("--baseline", help="results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(
+        run(
+            args.pattern,
+            iterations=args.iterations,
+            warmup=args.warmup,
+            alloc_iterations=args.alloc_iterations,
+            feed_rows=args.feed_rows,
+            columnar_feed=not args.csv_feed,
+        )
+    )
+    print(format_table(results))
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump({r.name: asdict(r) for r in results}, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print("\nregressions:\n  " + "\n  ".join(regressions))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,303 @@
+"""
+Canned API payloads and an in-process mock transport for the benchmarks.
+
+The payloads mirror the shapes returned by the production API closely enough
+that every resource and type method decodes them the same way it would a live
+response, so the numbers measure request building, decoding and model
+construction without any network noise.
+"""
+
+import gzip
+from datetime import datetime, timedelta, timezone
+from time import perf_counter_ns
+from typing import Any, Callable, Optional
+from uuid import UUID
+
+import httpx
+
+from empyrealSDK.utils.feed import FEED_MEDIA_TYPE, encode_feed, parse_feed_csv
+
+APP_ID = "8f9a4a7e-4c1f-4a39-9b48-1f0f3f0d7a11"
+USER_ID = "2c6d0a41-0a5b-4bd6-a7a2-57c4c7cbb1e2"
+WALLET_ID = "a3f1c1de-64a4-4a25-9d2b-1c0a9c2f6a55"
+TOKEN_ID = "5e2d8b9c-0e6f-4d0b-8e0c-2f7ad41b8f10"
+WETH_ID = "0b6a4c1e-3d2f-4c4b-9a11-7e8d9f0a1b2c"
+
+WETH = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+USDC = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+TOKEN = "0x6982508145454Ce325dDbE47a25d4ec3d2311933"
+PAIR = "0xA43fe16908251ee70EF74718545e4FE6C5cCEc9f"
+FACTORY = "0x5C69bEe701ef814a2B6a3EDD4B1652CB9cc5aA6f"
+ROUTER = "0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D"
+WALLET_ADDRESS = "0x95222290DD7278Aa3Ddd389Cc1E1d165CC4BAfe5"
+TX_HASH = "0x" + "ab" * 32
+
+TOKEN_JSON = {
+    "id": TOKEN_ID,
+    "address": TOKEN,
+    "name": "Pepe",
+    "symbol": "PEPE",
+    "decimals": 18,
+    "chainId": 1,
+}
+
+WETH_JSON = {
+    "id": WETH_ID,
+    "address": WETH,
+    "name": "Wrapped Ether",
+    "symbol": "WETH",
+    "decimals": 18,
+    "chainId": 1,
+}
+
+USER_JSON = {
+    "id": USER_ID,
+    "type": 1,
+    "name": "alice",
+    "telegramId": "123456789",
+    "isNewUser": False,
+    "metadata": {},
+}
+
+WALLET_JSON = {
+    "id": WALLET_ID,
+    "name": "main",
+    "address": WALLET_ADDRESS,
+    "type": "mnemonic",
+    "privateKey": None,
+    "groupId": None,
+    "ownerId": USER_ID,
+    "creatorAppId": APP_ID,
+}
+
+APP_JSON = {
+    "id": APP_ID,
+    "name": "bench-app",
+    "type": "bot",
+    "tier": "pro",
+    "apiKey": "bench-api-key",
+    "swapFee": 5000,
+    "feeCollectionAmount": 0,
+    "requestCount": 1234,
+    "owner": USER_JSON,
+    "appWallet": WALLET_JSON,
+}
+
+PAIR_JSON = {
+    "factoryAddress": FACTORY,
+    "token0": TOKEN_JSON,
+    "token1": WETH_JSON,
+    "pairAddress": PAIR,
+    "index": 154_123,
+    "feePercentage": 0.003,
+    "chainId": 1,
+    "blockNumber": 17_046_833,
+    "transactionHash": TX_HASH,
+}
+
+ROUTE_JSON = {
+    "path": [TOKEN, WETH],
+    "pair_addresses": [PAIR],
+    "eth_price": 0.000000000512,
+    "usdc_price": 0.00000123,
+}
+
+LIQUIDITY_JSON = {
+    "balances": {
+        "token0": {"amount": 152_345_678_901_234_567_890_123_456_789, "price": 1.2e-6},
+        "token1": {"amount": 7_123_456_789_012_345_678_901, "price": 2401.55},
+    },
+}
+
+SECURITY_JSON = {
+    "antiWhaleModifiable": False,
+    "buyTax": 0.0,
+    "sellTax": 0.0,
+    "canTakeBackOwnership": False,
+    "cannotBuy": False,
+    "cannotSellAll": False,
+    "creatorAddress": WALLET_ADDRESS,
+    "creatorBalance": 0,
+    "creatorPercent": 0.0,
+    "holderCount": 152_000,
+    "honeypotWithSameCreator": False,
+    "isAntiWhale": False,
+    "isBlacklisted": False,
+    "isHoneypot": False,
+    "isMintable": False,
+    "isOpenSource": True,
+    "isProxy": False,
+    "isWhitelisted": False,
+    "lpHolderCount": 12,
+    "lpTotalSupply": 1.5e21,
+    "ownerAddress": "0x0000000000000000000000000000000000000000",
+    "ownerBalance": 0,
+    "ownerChangeBalance": False,
+    "ownerPercent": 0.0,
+    "total_supply": 4.2e32,
+    "tradingCooldown": False,
+    "transferPausable": False,
+}
+
+VAULT_JSON = {
+    "appId": APP_ID,
+    "walletId": WALLET_ID,
+    "token": WETH_JSON,
+    "name": "UserFunds",
+    "description": "allows users to wrap funds into app",
+    "type": "bank",
+    "balance": 12.5,
+    "shares": 12.5,
+}
+
+ATH_JSON = {
+    "allTimeHigh": {
+        "reserve0Raw": 98_765_432_109_876_543_210_987_654_321,
+        "reserve1Raw": 9_876_543_210_987_654_321_098,
+        "date": "2023-05-05T12:00:00",
+        "block": 17_190_000,
+    },
+    "token0": {"decimals": 18},
+    "token1": {"decimals": 18},
+}
+
+SIMULATE_JSON = {
+    "token": TOKEN_JSON,
+    "amountOut": "1953125000000000000000000000",
+}
+
+
+def make_feed_csv(rows: int = 1440, start_block: int = 17_046_833) -> str:
+    """
+    Build a price feed CSV with ``rows`` minute intervals.
+
+    Rows are ``interval,open,close,min,max,min_block,max_block,num_tx,prev_close``
+    and newline terminated, matching the ``price/`` endpoint.
+    """
+    start = datetime(2023, 4, 14, tzinfo=timezone.utc)
+    lines = []
+    price = 1.0e-6
+    prev_close: Optional[float] = None
+    for i in range(rows):
+        interval = (start + timedelta(minutes=i)).strftime("%Y-%m-%d %H:%M:%S+00:00")
+        open_ = price
+        close = price * (1 + ((i * 7919) % 201 - 100) / 10_000)
+        low = min(open_, close) * 0.995
+        high = max(open_, close) * 1.005
+        block = start_block + i * 5
+        lines.append(
+            f"{interval},{open_},{close},{low},{high},{block},{block + 4},"
+            f"{(i * 31) % 97 + 1},{prev_close if prev_close is not None else 'None'}"
+        )
+        prev_close = close
+        price = close
+    return "".join(line + "\n" for line in lines)
+
+
+def _json(payload: Any, status_code: int = 200) -> httpx.Response:
+    return httpx.Response(status_code, json=payload)
+
+
+def make_routes(
+    feed_rows: int = 1440, columnar_feed: bool = True
+) -> dict[tuple[str, str], Callable]:
+    """
+    Map ``(method, path)`` to a function building the canned response.
+
+    With ``columnar_feed`` the ``price/`` route negotiates like the production
+    API would, returning the columnar encoding to clients which accept it.
+    """
+    csv = make_feed_csv(feed_rows)
+    feed = gzip.compress(csv.encode("utf-8"))
+    columns = encode_feed(parse_feed_csv(csv))
+
+    def price_feed(request: httpx.Request) -> httpx.Response:
+        if columnar_feed and FEED_MEDIA_TYPE in request.headers.get("accept", ""):
+            return httpx.Response(
+                200, content=columns, headers={"Content-Type": FEED_MEDIA_TYPE}
+            )
+        return httpx.Response(
+            200, content=feed, headers={"Content-Type": "application/gzip"}
+        )
+
+    return {
+        ("GET", "app/"): lambda r: _json(APP_JSON),
+        ("PUT", "app/"): lambda r: _json({"updates": {"swap_fee": 5000}}),
+        ("PUT", "app/apikey"): lambda r: _json({"apiKey": "rotated-api-key"}),
+        ("GET", "infrastructure/ping"): lambda r: _json({"message": "hi"}),
+        ("GET", "token/lookup"): lambda r: _json(TOKEN_JSON),
+        ("GET", "token/transfer"): lambda r: _json(TX_HASH),
+        ("GET", "security/"): lambda r: _json({"report": SECURITY_JSON}),
+        ("PUT", "token/balance"): lambda r: _json({"balance": 10**21}),
+        ("GET", "token/allowance"): lambda r: _json({"allowance": 2**256 - 1}),
+        ("POST", "token/approve"): lambda r: _json({"txHash": TX_HASH}),
+        ("PUT", "token/taxes"): lambda r: _json({"buy": 0.0, "sell": 0.0}),
+        ("GET", "dex/routes"): lambda r: _json([ROUTE_JSON, ROUTE_JSON]),
+        ("GET", "dex/pair"): lambda r: _json(PAIR_JSON),
+        ("GET", "dex/pairs"): lambda r: _json({"pairs": [PAIR_JSON] * 8}),
+        ("PUT", "dex/liquidity"): lambda r: _json(LIQUIDITY_JSON),
+        ("GET", "dex/ath"): lambda r: _json(ATH_JSON),
+        ("POST", "dex/swap"): lambda r: _json(TX_HASH),
+        ("PUT", "dex/simulate"): lambda r: _json(SIMULATE_JSON),
+        ("GET", "price/"): price_feed,
+        ("POST", "users/"): lambda r: _json(USER_JSON),
+        ("GET", "users/telegram"): lambda r: _json(USER_JSON),
+        ("GET", "wallets/"): lambda r: _json(WALLET_JSON),
+        ("POST", "wallets/noncustodial"): lambda r: _json(
+            {**WALLET_JSON, "type": "noncustodial"}
+        ),
+        ("GET", "wallets/app"): lambda r: _json([WALLET_JSON] * 4),
+        ("GET", "wallets/user"): lambda r: _json([WALLET_JSON] * 4),
+        ("PUT", "wallets/archive"): lambda r: _json({"archived": True}),
+        ("PUT", "wallets/data"): lambda r: _json({"archived": False, "notes": {}}),
+        ("GET", f"wallets/data/{WALLET_ID}"): lambda r: _json(
+            {"archived": False, "notes": {"tier": "gold"}}
+        ),
+        ("POST", "wallets/mnemonic"): lambda r: _json(WALLET_JSON),
+        ("POST", "wallets/pk"): lambda r: _json({**WALLET_JSON, "type": "private_key"}),
+        ("GET", "vault/"): lambda r: _json({"vaults": [VAULT_JSON] * 4}),
+        ("GET", "vault/positions"): lambda r: _json([]),
+        ("POST", "vault/"): lambda r: _json({"vaultId": str(UUID(int=1))}),
+    }
+
+
+class MockAPI:
+    """
+    An in-process stand-in for the Empyreal API.
+
+    Use :meth:`transport` to get an ``httpx.MockTransport`` which can be passed
+    to :class:`empyrealSDK.EmpyrealSDK`.  The time spent inside the handler is
+    accumulated in ``server_ns`` so it can be subtracted from measured latency.
+    """
+
+    def __init__(
+        self, feed_rows: int = 1440, version: str = "v1", columnar_feed: bool = True
+    ):
+        self.routes = make_routes(feed_rows, columnar_feed)
+        self.prefix = f"/{version}/"
+        self.server_ns = 0
+        self.calls = 0
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        start = perf_counter_ns()
+        path = request.url.path
+        if path.startswith(self.prefix):
+            path = path[len(self.prefix) :]
+        handler = self.routes.get((request.method, path))
+        if handler is None:
+            response = _json({"detail": f"no route {request.method} {path}"}, 400)
+        else:
+            response = handler(request)
+        self.calls += 1
+        self.server_ns += perf_counter_ns() - start
+        return response
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+
+__all__ = [
+    "MockAPI",
+    "make_feed_csv",
+    "make_routes",
+]
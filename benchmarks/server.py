@@ -0,0 +1,78 @@
+"""
+Serve :class:`fixtures.MockAPI` over HTTP, as a local stand-in for the API.
+
+Point the SDK at it with ``EmpyrealSDK(api_key, env="local")`` to exercise the
+real network stack, e.g. content negotiation of the ``price/`` feed, without
+touching production.
+
+Usage::
+
+    python -m benchmarks.server
+    python -m benchmarks.server --port 8080 --feed-rows 10000 --csv-feed
+"""
+
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import sys
+from typing import Optional
+
+import httpx
+
+from . import fixtures as fx
+
+
+def make_handler(api: fx.MockAPI) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _serve(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            request = httpx.Request(
+                self.command,
+                f"http://{self.headers.get('Host', 'localhost')}{self.path}",
+                headers=list(self.headers.items()),
+                content=self.rfile.read(length),
+            )
+            response = api.handle(request)
+            body = response.content
+            self.send_response(response.status_code)
+            for key, value in response.headers.items():
+                if key.lower() not in ("content-length", "transfer-encoding"):
+                    self.send_header(key, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if self.command != "HEAD":
+                self.wfile.write(body)
+
+        do_GET = do_POST = do_PUT = do_DELETE = do_HEAD = _serve
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--feed-rows", type=int, default=1440)
+    parser.add_argument(
+        "--csv-feed", action="store_true", help="serve the price feed as CSV only"
+    )
+    args = parser.parse_args(argv)
+
+    api = fx.MockAPI(feed_rows=args.feed_rows, columnar_feed=not args.csv_feed)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(api))
+    print(f"serving the mock API on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
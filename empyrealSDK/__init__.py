@@ -1,9 +1,11 @@
 from .sdk import EmpyrealSDK
+from .sync import SyncEmpyrealSDK
 from .types import Application, Network, Token, TokenAmount, User, Wallet
 
 
 __all__ = [
     "EmpyrealSDK",
+    "SyncEmpyrealSDK",
     "Application",
     "Network",
     "Token",
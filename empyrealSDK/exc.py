@@ -5,6 +5,10 @@ class RateLimitError(Exception):
     """Raised when hitting rate limit"""
 
 
+class QuotaExhaustedError(RateLimitError):
+    """The request budget is used up for this priority class"""
+
+
 class NotFoundError(Exception):
     """Information was not found during execution"""
 
@@ -13,6 +17,18 @@ class UnknownError(Exception):
     """Unknown Error.  Please contact Empyreal Team"""
 
 
+class ReplayMissError(LookupError):
+    """A replayed session has no recorded response for a request"""
+
+
+class DeadlineExceeded(TimeoutError):
+    """A request did not complete before its deadline"""
+
+
+class CircuitOpenError(Exception):
+    """An endpoint is failing, so the request was not sent"""
+
+
 def handle_response_error(response: Response):
     if response.status_code == 429:
         raise RateLimitError(response.json()["detail"])
@@ -23,6 +39,10 @@ def handle_response_error(response: Response):
 
 
 __all__ = [
+    "CircuitOpenError",
+    "DeadlineExceeded",
+    "QuotaExhaustedError",
     "RateLimitError",
+    "ReplayMissError",
     "UnknownError",
 ]
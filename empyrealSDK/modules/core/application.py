@@ -18,7 +18,8 @@ class ApplicationResource(RequestHelpers):
         response = await self._get("app/")
         if not response.status_code == 200:
             raise ValueError(response.json()["detail"])
-        return Application(**response.json())
+        self.sdk.application = Application(**response.json())
+        return self.sdk.application
 
     async def update(
         self,
@@ -36,7 +37,9 @@ class ApplicationResource(RequestHelpers):
             json={
                 "swapFee": swap_fee,
                 "feeCollectionAmount": fee_collection_amount,
-                "appWalletId": app_wallet_id,
+                "appWalletId": (
+                    str(app_wallet_id) if app_wallet_id is not None else None
+                ),
             },
         )
         return response
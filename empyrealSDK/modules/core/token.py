@@ -119,8 +119,8 @@ class TokenResource(RequestHelpers):
         response = await self._post(
             "token/approve",
             json={
-                "tokenId": token_id,
-                "walletId": wallet_id,
+                "tokenId": str(token_id),
+                "walletId": str(wallet_id),
                 "spender": spender_address,
                 "chainId": chain_id,
                 "amount": amount,
@@ -33,17 +33,17 @@ class WalletResource(RequestHelpers):
 
     async def get_app_wallets(self) -> Response:
         response = await self._get("wallets/app")
-        return response.json()
+        return await self._json(response)
 
     async def get_user_wallets(self, user_id: UUID) -> Response:
         response = await self._get("wallets/user", params={"userId": str(user_id)})
-        return response.json()
+        return await self._json(response)
 
     async def archive(self, wallet_id: UUID):
         response = await self._put(
             "wallets/archive",
             json={
-                "walletId": wallet_id,
+                "walletId": str(wallet_id),
             },
         )
         return response
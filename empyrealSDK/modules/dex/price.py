@@ -1,11 +1,17 @@
-import gzip
 from typing import Optional
 
 from eth_typing import HexAddress, ChecksumAddress
-from eth_utils.address import to_checksum_address
 
 from empyrealSDK.exc import handle_response_error
 from empyrealSDK.utils import RequestHelpers
+from empyrealSDK.utils.address import checksum_address
+from empyrealSDK.utils.feed import (
+    FEED_MEDIA_TYPE,
+    FeedColumns,
+    decode_feed,
+    decompress_feed,
+    parse_gzip_feed,
+)
 
 
 class PriceResource(RequestHelpers):
@@ -52,7 +58,7 @@ class PriceResource(RequestHelpers):
         """
 
         if force_checksum:
-            pair_address = to_checksum_address(pair_address)
+            pair_address = checksum_address(pair_address)
         response = await self._get(
             "dex/pair",
             params={
@@ -69,7 +75,7 @@ class PriceResource(RequestHelpers):
         force_checksum: bool = True,
     ):
         if force_checksum:
-            token_address = to_checksum_address(token_address)
+            token_address = checksum_address(token_address)
         response = await self._get(
             "dex/pairs",
             params={
@@ -77,7 +83,7 @@ class PriceResource(RequestHelpers):
                 "chainId": chain_id,
             },
         )
-        return response.json()["pairs"]
+        return (await self._json(response))["pairs"]
 
     async def get_liquidity(
         self,
@@ -87,7 +93,7 @@ class PriceResource(RequestHelpers):
         block_number: Optional[int] = None,
     ):
         if force_checksum:
-            token_address = to_checksum_address(token_address)
+            token_address = checksum_address(token_address)
         response = await self._put(
             "dex/liquidity",
             json={
@@ -114,4 +120,32 @@ class PriceResource(RequestHelpers):
             },
         )
         handle_response_error(response)
-        return gzip.decompress(response.content).decode("utf-8")
+        return await self.sdk.offload(
+            len(response.content), decompress_feed, response.content
+        )
+
+    async def load_feed_columns(
+        self,
+        pair_address: ChecksumAddress,
+        use_token0: bool = True,
+    ) -> FeedColumns:
+        """
+        Load a pair's price feed as columns.  The compact columnar encoding is
+        requested, and the CSV encoding is parsed instead if the API does not
+        support it.
+        """
+        response = await self._get(
+            "price/",
+            params={
+                "pairAddress": pair_address,
+                "useToken0": use_token0,
+            },
+            headers={"Accept": f"{FEED_MEDIA_TYPE}, application/gzip;q=0.5"},
+        )
+        handle_response_error(response)
+        if response.headers.get("content-type", "").startswith(FEED_MEDIA_TYPE):
+            # a copy per column, cheaper inline than handing off to a worker
+            return decode_feed(response.content)
+        return await self.sdk.offload(
+            len(response.content), parse_gzip_feed, response.content
+        )
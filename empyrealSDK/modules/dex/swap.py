@@ -39,7 +39,7 @@ class SwapResource(RequestHelpers):
             json={
                 "path": path,
                 "amountIn": amount_in,
-                "walletId": wallet_id,
+                "walletId": str(wallet_id),
                 "slippage": slippage_percent,
                 "priorityFee": priority_fee,
                 "isPrivate": is_private,
@@ -1,7 +1,43 @@
-from typing import Literal
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+import os
+import time
+from typing import (
+    TYPE_CHECKING,
+    AsyncGenerator,
+    Callable,
+    Literal,
+    Optional,
+    TypeVar,
+    Union,
+)
+import weakref
+
+import httpx
 
 from .modules import core, dex
+from .utils.budget import RequestBudget
+from .utils.cache import CacheBackend, LRUCache
+from .utils.circuit import CircuitBreaker
 from .utils.client import _set_global_client
+from .utils.hedging import HedgePolicy
+from .utils.priority import PriorityLimiter
+from .utils.snapshot import load_snapshot, save_snapshot
+
+if TYPE_CHECKING:
+    from .types import Application, Wallet
+
+T = TypeVar("T")
+
+
+async def _close_with_loop(client: httpx.AsyncClient) -> AsyncGenerator[None, None]:
+    # parked at `yield` until its loop shuts down async generators, as
+    # `asyncio.run` does before closing the loop, then closes the client
+    try:
+        yield
+    finally:
+        await client.aclose()
 
 ENVIRONMENTS = {
     "local": "http://localhost:8080",
@@ -31,14 +67,74 @@ class EmpyrealSDK:
 
     rpc_url: str
     api_key: str
+    transport: Optional[httpx.AsyncBaseTransport]
 
-    def __init__(self, api_key: str, env: Literal["local", "prod"] = "prod"):
+    def __init__(
+        self,
+        api_key: str,
+        env: Literal["local", "prod"] = "prod",
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        limits: Optional[httpx.Limits] = None,
+        hedging: Optional[HedgePolicy] = None,
+        timeout: Optional[float] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        limiter: Optional[PriorityLimiter] = None,
+        budget: Optional[RequestBudget] = None,
+        executor: Optional[Executor] = None,
+        offload_threshold: Optional[int] = 64 * 1024,
+        cache: Optional[CacheBackend] = None,
+        user_cache_ttl: Optional[float] = 3600,
+    ):
         if env not in ENVIRONMENTS:
             raise ValueError(
                 "Invalid Environment.  Must provide one of ['local', 'prod']"
             )
         self.rpc_url = ENVIRONMENTS[env]
         self.api_key = api_key
+        # optional httpx transport, e.g. ``httpx.MockTransport`` for offline runs
+        self.transport = transport
+        self.limits = limits or httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=20,
+        )
+        self._clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncClient
+        ] = weakref.WeakKeyDictionary()
+        self._closers: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, AsyncGenerator[None, None]
+        ] = weakref.WeakKeyDictionary()
+        self._keep_warm: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Task
+        ] = weakref.WeakKeyDictionary()
+        # default total seconds per request, narrowed further by `utils.deadline`
+        self.timeout = timeout
+        # opt in duplicate requests for slow idempotent reads
+        self.hedging = hedging
+        # opt in fail fast for endpoints with a spiking error rate
+        self.circuit_breaker = circuit_breaker
+        # opt in queue which serves trades ahead of bulk reads, see `utils.priority`
+        self.limiter = limiter
+        # opt in quota tracking, see `RequestBudget.from_app`
+        self.budget = budget
+        # decoding of payloads over `offload_threshold` bytes runs on `executor`,
+        # or the loop's default thread pool, see `offload`
+        self.executor = executor
+        self.offload_threshold = offload_threshold
+        # tokens, pair info, taxes and security reports, which a backend such as
+        # `utils.cache.SQLiteCache` can share between worker processes
+        self.cache = LRUCache(maxsize=10_000) if cache is None else cache
+        # (chain_id, token, owner, spender) -> allowance, see `Token.ensure_allowance`
+        self.allowance_cache = LRUCache(maxsize=10_000, ttl=300)
+        # (chain_id, pair, block) -> historical reserves, see `DexPair.liquidity_series`
+        self.liquidity_cache = LRUCache(maxsize=50_000)
+        # telegram id -> user, see `User.load`, a `user_cache_ttl` of None keeps
+        # users cached until evicted or invalidated
+        self.user_cache = LRUCache(maxsize=10_000, ttl=user_cache_ttl)
+        # last loaded application and app wallets, see `save_snapshot`
+        self.application: Optional["Application"] = None
+        self.app_wallets: Optional[list["Wallet"]] = None
+        # unix time of the snapshot this instance was restored from
+        self.snapshot_created_at: Optional[float] = None
 
         self.app = core.ApplicationResource(self)
         self.infra = core.PingResource(self)
@@ -49,3 +145,201 @@ class EmpyrealSDK:
         self.prices = dex.price.PriceResource(self)
         self.swap = dex.swap.SwapResource(self)
         _set_global_client(self)
+
+    def http_client(self) -> httpx.AsyncClient:
+        """
+        The pooled HTTP client shared by every resource.
+
+        httpx connections are bound to the event loop that opened them, so a
+        client is kept per running loop and reused for every request made on it.
+        Each client is closed by :meth:`aclose` on its loop, or else when the
+        loop shuts down its async generators, e.g. at the end of `asyncio.run`.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(transport=self.transport, limits=self.limits)
+            self._clients[loop] = client
+            closer = _close_with_loop(client)
+            self._closers[loop] = closer
+            asyncio.ensure_future(closer.asend(None))
+        return client
+
+    async def _open_connections(self, connections: int, staggered: bool = False):
+        # an unauthenticated HEAD is the cheapest request, and each holds on to
+        # its connection until all are open so that none is shared.  Staggered,
+        # each starts once the previous holds a connection, as the pool may
+        # otherwise hand one idle connection to several queued requests and open
+        # new ones while the rest of the idle connections expire.
+        client = self.http_client()
+        holding = [asyncio.Event() for _ in range(connections)]
+        opened = 0
+        ready = asyncio.Event()
+
+        async def hold(i: int):
+            nonlocal opened
+            try:
+                if staggered and i:
+                    await holding[i - 1].wait()
+                async with client.stream("HEAD", self.rpc_url) as response:
+                    holding[i].set()
+                    opened += 1
+                    if opened == connections:
+                        ready.set()
+                    await ready.wait()
+                    # the connection returns to the pool once the response is read,
+                    # an unread response closes it instead
+                    await response.aread()
+            finally:
+                holding[i].set()
+                ready.set()
+
+        await asyncio.gather(*(hold(i) for i in range(connections)))
+
+    async def warmup(
+        self,
+        connections: int = 4,
+        ping: bool = True,
+        keep_warm: bool = False,
+        interval: Optional[float] = None,
+    ):
+        """
+        Open pooled connections ahead of the first real request, so that a
+        trade doesn't pay for DNS, TCP and TLS setup.
+
+        ```python
+        sdk = EmpyrealSDK(api_key)
+        await sdk.warmup(connections=8, keep_warm=True)
+        ```
+
+        :param connections: connections to open, capped at the pool's
+            ``max_connections`` and ``max_keepalive_connections``
+        :param ping: also send ``infrastructure/ping`` with the API key, which
+            checks the key and the request path end to end
+        :param keep_warm: refresh the connections every ``interval`` seconds in
+            a background task until :meth:`aclose`, so idle connections aren't
+            dropped from the pool
+        :param interval: seconds between refreshes, by default shortly before the
+            pool's ``keepalive_expiry``
+        """
+        # every request holds its connection until all are open, so asking for
+        # more than the pool allows would wait forever
+        for limit in (
+            self.limits.max_connections,
+            self.limits.max_keepalive_connections,
+        ):
+            if limit is not None:
+                connections = min(connections, limit)
+        await self._open_connections(connections)
+        if ping:
+            await self.infra.say_hi()
+        if keep_warm:
+            if interval is None:
+                expiry = self.limits.keepalive_expiry
+                interval = 30.0 if expiry is None else expiry * 0.8
+            self.stop_keep_warm()
+            self._keep_warm[asyncio.get_running_loop()] = asyncio.create_task(
+                self._keep_connections_warm(connections, interval)
+            )
+
+    async def _keep_connections_warm(self, connections: int, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self._open_connections(connections, staggered=True)
+            except httpx.HTTPError:
+                # the next real request reconnects, and so does the next refresh
+                pass
+
+    def stop_keep_warm(self):
+        """Stop refreshing the connections of the running event loop"""
+        task = self._keep_warm.pop(asyncio.get_running_loop(), None)
+        if task is not None:
+            task.cancel()
+
+    async def offload(self, size: int, fn: Callable[..., T], *args) -> T:
+        """
+        Run ``fn(*args)`` off the event loop if it processes at least
+        ``offload_threshold`` bytes, so decoding a large payload doesn't stall
+        other coroutines.  Smaller work runs inline, where it is cheaper than a
+        round trip to the executor.  With a process pool, ``fn``, its arguments
+        and its result must be picklable.
+        """
+        if self.offload_threshold is None or size < self.offload_threshold:
+            return fn(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(fn, *args))
+
+    def save_snapshot(self, path: Union[str, os.PathLike]):
+        """
+        Save the last loaded application and app wallets, and the cached tokens
+        and pairs, so :meth:`from_snapshot` can start a new worker warm.  The
+        API key and wallet private keys are not written.
+
+        ```python
+        sdk = EmpyrealSDK(api_key)
+        await Application.load()
+        await Wallet.get_all()
+        await asyncio.gather(*(Token.load(address) for address in watchlist))
+        sdk.save_snapshot("/var/cache/empyreal.snapshot")
+        ```
+        """
+        save_snapshot(self, path)
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        path: Union[str, os.PathLike],
+        api_key: str,
+        max_age: Optional[float] = None,
+        **kwargs,
+    ) -> "EmpyrealSDK":
+        """
+        Create an SDK instance warmed from a :meth:`save_snapshot` file, without
+        any requests.  ``Application.load(cached=True)`` and
+        ``Wallet.get_all(cached=True)`` then return the restored state.
+
+        ```python
+        sdk = EmpyrealSDK.from_snapshot(
+            "/var/cache/empyreal.snapshot", api_key, max_age=3600
+        )
+        app = await Application.load(cached=True)
+        ```
+
+        :param api_key: the key of the app the snapshot was saved for
+        :param max_age: seconds after which the application and wallets are
+            considered stale and loaded from the API instead.  Tokens and pairs
+            never change and are restored at any age.
+        :param kwargs: passed on to :class:`EmpyrealSDK`
+        """
+        sdk = cls(api_key, **kwargs)
+        sdk.snapshot_created_at = load_snapshot(sdk, path, max_age=max_age)
+        return sdk
+
+    @property
+    def snapshot_age(self) -> Optional[float]:
+        """Seconds since the snapshot this instance was restored from was saved"""
+        if self.snapshot_created_at is None:
+            return None
+        return time.time() - self.snapshot_created_at
+
+    async def aclose(self):
+        """
+        Close the pooled connections opened on the running event loop.  Clients
+        on other loops are closed on their own loop, by calling this there or
+        when that loop shuts down.
+        """
+        self.stop_keep_warm()
+        loop = asyncio.get_running_loop()
+        client = self._clients.pop(loop, None)
+        closer = self._closers.pop(loop, None)
+        if closer is not None:
+            await closer.aclose()
+        if client is not None:
+            await client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
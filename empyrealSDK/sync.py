@@ -0,0 +1,128 @@
+import asyncio
+import functools
+import inspect
+import threading
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from .sdk import EmpyrealSDK
+from .utils import RequestHelpers
+from .utils.client import _set_global_client
+
+T = TypeVar("T")
+
+
+class _SyncResource:
+    """Wraps a resource so each coroutine method blocks on the SDK's loop"""
+
+    def __init__(self, sdk: "SyncEmpyrealSDK", resource: RequestHelpers):
+        self._sdk = sdk
+        self._resource = resource
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._resource, name)
+        if not inspect.iscoroutinefunction(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def call(*args, **kwargs):
+            return self._sdk.run(attr(*args, **kwargs))
+
+        return call
+
+
+class SyncEmpyrealSDK:
+    """
+    A blocking facade over :class:`empyrealSDK.EmpyrealSDK` for synchronous code,
+    such as celery workers or thread pools.
+
+    A single event loop runs on a background thread for the lifetime of the
+    facade, so every call shares one connection pool, and calls made from many
+    threads at once are multiplexed concurrently on that loop.
+
+    Examples
+    --------
+    >>> sdk = SyncEmpyrealSDK("<api_key>")
+    >>> token = sdk.run(Token.load("0x6982508145454Ce325dDbE47a25d4ec3d2311933"))
+    >>> balance = sdk.token.balance_of(token.address, wallet.address)
+    >>> sdk.close()
+
+    Resources are available under the same names as on ``EmpyrealSDK``, with
+    their coroutine methods made blocking.  Any other coroutine, including the
+    ``empyrealSDK.types`` methods, can be executed with :meth:`run`.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        *args,
+        sdk: Optional[EmpyrealSDK] = None,
+        **kwargs,
+    ):
+        if sdk is None:
+            if api_key is None:
+                raise ValueError("Must provide either an api_key or an EmpyrealSDK")
+            sdk = EmpyrealSDK(api_key, *args, **kwargs)
+        self.sdk = sdk
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_loop,
+            name="empyrealSDK-loop",
+            daemon=True,
+        )
+        self._thread.start()
+
+        for name, value in vars(sdk).items():
+            if isinstance(value, RequestHelpers):
+                setattr(self, name, _SyncResource(self, value))
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    async def _bind(self, awaitable: Awaitable[T]) -> T:
+        # each task gets its own context, so set the client for `types` methods
+        _set_global_client(self.sdk)
+        return await awaitable
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    def run(self, awaitable: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """
+        Run a coroutine on the background loop and block until it completes.
+
+        Safe to call from any thread except the loop's own thread.
+
+        :param timeout: seconds to wait before raising ``TimeoutError``
+        """
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("Cannot block on the SDK loop from inside the loop")
+        if self._loop.is_closed():
+            raise RuntimeError("SyncEmpyrealSDK has been closed")
+        future = asyncio.run_coroutine_threadsafe(self._bind(awaitable), self._loop)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def call(self, fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """Call a coroutine function with the provided arguments and block on it"""
+        return self.run(fn(*args, **kwargs))
+
+    def close(self):
+        """Close the connection pool and stop the background loop"""
+        if self._loop.is_closed():
+            return
+        self.run(self.sdk.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -1,16 +1,15 @@
 # from enum import Enum, auto
+from .address import Address
 from .application import Application
 from .dex import Liquidity, DexFactory, DexPair, DexRoute, SwapHistory, UniswapV2
 from .network import Network
+from .orders import LimitOrder, LimitOrderType, OrderBook, OrderEngine, OrderFill
+from .pretrade import PretradeReport, pretrade_check
+from .series import LiquiditySeries, LiquiditySnapshot
 from .token import Token, TokenAmount
 from .user import User
 from .wallet import Wallet
-
-
-# class LimitOrderType(Enum):
-#     TrailingStopLoss = auto()
-#     StopLoss = auto()
-#     TakeProfit = auto()
+from .watch import PriceWatcher, WatchEvent
 
 
 # class Dex(Enum):
@@ -21,18 +20,29 @@ from .wallet import Wallet
 
 
 __all__ = [
+    "Address",
     "Application",
     # "Dex",
     "Liquidity",
     "DexFactory",
     "DexPair",
     "DexRoute",
-    # "LimitOrderType",
+    "LimitOrder",
+    "LimitOrderType",
+    "LiquiditySeries",
+    "LiquiditySnapshot",
     "Network",
+    "OrderBook",
+    "OrderEngine",
+    "OrderFill",
+    "PretradeReport",
+    "PriceWatcher",
     "SwapHistory",
     "Token",
     "TokenAmount",
     "UniswapV2",
     "User",
     "Wallet",
+    "WatchEvent",
+    "pretrade_check",
 ]
@@ -0,0 +1,113 @@
+from typing import Any, Union
+
+from eth_typing import ChecksumAddress
+from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import core_schema
+
+from ..utils.address import checksum_address
+
+# each address is its own key, so an entry costs one object plus its slot
+_interned: dict["Address", "Address"] = {}
+
+
+class Address(bytes):
+    """
+    An ethereum address as its 20 raw bytes, for indexes holding many of them.
+
+    Every address is interned, so the same token or pair across many routes and
+    pairs is stored once and each repeat costs only a reference.  A distinct
+    address costs about 100 to 125 bytes with its intern table entry, against
+    91 for a checksummed string, so the saving comes from addresses which
+    repeat, as they do across routes, pairs and snapshots.  Hashing and
+    equality are those of ``bytes``, the checksummed string is only computed
+    when asked for.
+
+    The intern table is not bounded: addresses are kept alive for the life of
+    the process, like interned strings.  That is what an index wants, but use
+    plain strings for one-off lookups of many distinct addresses.
+
+    ```python
+    weth = Address("0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2")
+    assert weth is Address(weth.checksum)
+    str(weth)  # '0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2'
+    ```
+
+    Usable as a pydantic field, validated from a hex string or 20 bytes and
+    serialized to the checksummed string in JSON:
+
+    ```python
+    class Holding(BaseModel):
+        token: Address
+        amount: int
+    ```
+
+    :param address: a hex address in any case, or the raw 20 bytes
+    :raises ValueError: if the address is not a valid 20 byte address
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, address: Union[str, bytes, bytearray, memoryview]) -> "Address":
+        if isinstance(address, Address):
+            return address
+        if isinstance(address, str):
+            if len(address) != 42 or address[:2] not in ("0x", "0X"):
+                raise ValueError(f"Invalid address {address!r}")
+            try:
+                raw = bytes.fromhex(address[2:])
+            except ValueError:
+                raise ValueError(f"Invalid address {address!r}") from None
+        else:
+            raw = bytes(address)
+            if len(raw) != 20:
+                raise ValueError(f"Expected a 20 byte address, got {len(raw)} bytes")
+
+        # bytes and addresses hash and compare alike, so `raw` finds the entry
+        interned = _interned.get(raw)  # type: ignore[call-overload]
+        if interned is None:
+            address = super().__new__(cls, raw)
+            interned = _interned.setdefault(address, address)
+        return interned
+
+    @property
+    def checksum(self) -> ChecksumAddress:
+        """The EIP-55 checksummed string, memoized"""
+        return checksum_address(self)
+
+    @property
+    def lowercase(self) -> str:
+        """The lowercase hex string, e.g. for case-insensitive API parameters"""
+        return "0x" + self.hex()
+
+    def __str__(self) -> str:
+        return self.checksum
+
+    def __repr__(self) -> str:
+        return f"Address('{self.checksum}')"
+
+    def __reduce__(self):
+        return (Address, (bytes(self),))
+
+    def __copy__(self) -> "Address":
+        return self
+
+    def __deepcopy__(self, memo) -> "Address":
+        return self
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            cls,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                str, when_used="json"
+            ),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        return {"type": "string", "pattern": "^0[xX][0-9a-fA-F]{40}$"}
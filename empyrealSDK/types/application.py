@@ -29,13 +29,17 @@ class Application(BaseModel):
     app_wallet: Optional[Wallet] = Field(alias="appWallet")
 
     @classmethod
-    async def load(self, api_key: Optional[str] = None):
+    async def load(self, api_key: Optional[str] = None, cached: bool = False):
         """
         Loads an instance of the current empyrealSDK user's application.
         If an `api_key` is provided, this will create a new global client.
         Otherwise, the currently set application from the global context
         is loaded.
 
+        With ``cached``, the application last loaded or restored with
+        :meth:`empyrealSDK.EmpyrealSDK.from_snapshot` is returned without a
+        request, if there is one.
+
         Token :class:`empyrealSDK.types.Token`
         """
         from empyrealSDK import EmpyrealSDK
@@ -46,6 +50,8 @@ class Application(BaseModel):
             return new_client
 
         client: EmpyrealSDK = _force_get_global_client()
+        if cached and client.application is not None:
+            return client.application
         return await client.app.info()
 
     async def update_swap_fee(self, swap_fee: float):
@@ -0,0 +1,106 @@
+from collections.abc import Sequence
+import os
+from typing import TYPE_CHECKING, Union
+
+try:
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "Arrow export requires pyarrow, `pip install empyrealSDK[arrow]`"
+    ) from e
+
+from .ohlc import COLUMNS, OHLCFrame
+
+if TYPE_CHECKING:
+    from .dex import DexPair, SwapHistory
+    from .series import LiquiditySeries
+
+
+def frame_table(frame: OHLCFrame) -> pa.Table:
+    """
+    An :class:`empyrealSDK.types.ohlc.OHLCFrame` as an Arrow table.  The numpy
+    columns are wrapped rather than copied.
+    """
+    return pa.table(
+        {
+            "time": pa.array(frame.time, type=pa.timestamp("s", tz="UTC")),
+            "open": frame.open,
+            "close": frame.close,
+            "min": frame.min,
+            "max": frame.max,
+            "tx_count": frame.tx_count,
+            "prev_close": frame.prev_close,
+        }
+    )
+
+
+def series_table(series: "LiquiditySeries") -> pa.Table:
+    """A :class:`empyrealSDK.types.LiquiditySeries` as an Arrow table, uncopied"""
+    return pa.table(
+        {
+            "block": np.frombuffer(series.blocks, dtype=np.int64),
+            "reserve0": np.frombuffer(series.reserve0, dtype=np.float64),
+            "reserve1": np.frombuffer(series.reserve1, dtype=np.float64),
+            "price0": np.frombuffer(series.price0, dtype=np.float64),
+            "price1": np.frombuffer(series.price1, dtype=np.float64),
+        },
+        metadata={"pair": series.pair.address},
+    )
+
+
+def histories_table(histories: Sequence["SwapHistory"]) -> pa.Table:
+    """
+    Many swap histories as one Arrow table, with a dictionary encoded ``pair``
+    column holding each interval's pair address.
+
+    ```python
+    histories = await asyncio.gather(*(pair.swap_history() for pair in pairs))
+    write_parquet(histories_table(histories), "histories.parquet")
+    ```
+    """
+    if not histories:
+        raise ValueError("No histories to export")
+    frames = [history.frame() for history in histories]
+    lengths = np.fromiter((len(frame) for frame in frames), np.int64, len(frames))
+    merged = OHLCFrame(
+        **{
+            name: np.concatenate([getattr(frame, name) for frame in frames])
+            for name in COLUMNS
+        }
+    )
+    pair = pa.DictionaryArray.from_arrays(
+        np.repeat(np.arange(len(frames), dtype=np.int32), lengths),
+        [history.pair.address for history in histories],
+    )
+    return frame_table(merged).add_column(0, "pair", pair)
+
+
+def pairs_table(pairs: Sequence["DexPair"]) -> pa.Table:
+    """Pairs, e.g. from :meth:`empyrealSDK.types.DexFactory.get_pairs`, one per row"""
+    return pa.table(
+        {
+            "address": [p.address for p in pairs],
+            "factory_address": [p.factory_address for p in pairs],
+            "factory": pa.array([p.factory.name for p in pairs]).dictionary_encode(),
+            "chain_id": pa.array([p.network.value for p in pairs], pa.int64()),
+            "index": pa.array([p.index for p in pairs], pa.int64()),
+            "fee": pa.array([p.fee for p in pairs], pa.float64()),
+            "token0": [p.token0.address for p in pairs],
+            "token0_symbol": [p.token0.symbol for p in pairs],
+            "token0_decimals": pa.array([p.token0.decimals for p in pairs], pa.uint8()),
+            "token1": [p.token1.address for p in pairs],
+            "token1_symbol": [p.token1.symbol for p in pairs],
+            "token1_decimals": pa.array([p.token1.decimals for p in pairs], pa.uint8()),
+            "block_number": pa.array([p.block_number for p in pairs], pa.int64()),
+            "transaction_hash": [p.transaction_hash for p in pairs],
+        }
+    )
+
+
+def write_parquet(
+    table: pa.Table, path: Union[str, os.PathLike], compression: str = "zstd"
+):
+    """Write an exported table to a Parquet file"""
+    pq.write_table(table, path, compression=compression)
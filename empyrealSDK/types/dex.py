@@ -1,16 +1,35 @@
-from collections.abc import Sequence
-from datetime import datetime
+import asyncio
+from collections.abc import AsyncIterator, Mapping, Sequence
+from datetime import datetime, timedelta
 from enum import Enum
 from functools import singledispatchmethod
+import math
+import time
 from typing import Optional, Literal, Union
+from uuid import UUID
 
 from eth_typing import ChecksumAddress, HexAddress, HexStr
 from pydantic import BaseModel
 
 from .token import Token, TokenAmount
+from .transaction import SwapResult
 from .wallet import Wallet
 from .network import Network
+from .series import LiquidityRow, LiquiditySeries, LiquiditySnapshot
 from ..utils.client import _force_get_global_client
+from ..utils.concurrency import gather_bounded, wallet_lock
+from ..utils.deadline import acquire, deadline
+from ..utils.feed import FeedColumns
+
+_EPOCH = datetime(1970, 1, 1)
+# approximate payload sizes, for deciding when decoding is offloaded
+_FEED_ROW_BYTES = 72
+_PAIR_ROW_BYTES = 1024
+# seconds swap taxes are served from the SDK's cache, owners can change them
+TAXES_TTL = 60
+# blocks behind the chain head past which reserves are cached as final, two
+# epochs, after which Ethereum finalizes a block
+REORG_DEPTH = 64
 
 
 class Liquidity(BaseModel):
@@ -103,35 +122,55 @@ class DexFactory(Enum):
         # TODO: handle by chain_id
         return "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
 
+    @property
+    def router(self):
+        # TODO: handle by chain_id
+        return "0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D"
+
     async def get_taxes(
         self,
         token0_address,
         token1_address=None,
         chain_id: int = 1,
+        refresh: bool = False,
     ):
         """
-        Get swap taxes for a token
+        Get swap taxes for a token, cached for `TAXES_TTL` seconds
+
+        :param refresh: skip the cache and request the taxes again
         """
         if not token1_address:
             token1_address = self.weth
         client = _force_get_global_client()
-        taxes = await client.prices.get_taxes(
-            token0_address,
-            token1_address,
-            chain_id=chain_id,
+        key = (
+            f"taxes:{chain_id}:{self.value}:"
+            f"{token0_address.lower()}:{token1_address.lower()}"
         )
+        taxes = None if refresh else client.cache.get(key)
+        if taxes is None:
+            taxes = await client.prices.get_taxes(
+                token0_address,
+                token1_address,
+                chain_id=chain_id,
+            )
+            client.cache.set(key, taxes, ttl=TAXES_TTL)
         return taxes
 
     @singledispatchmethod
     async def get_price(
         self,
         token_address: ChecksumAddress,
+        timeout: Optional[float] = None,
     ):
         """
         Get the price for a token using the best route to WETH/USDC
+
+        :param timeout: seconds allowed for the lookup, raises
+            :class:`empyrealSDK.exc.DeadlineExceeded` when passed
         """
         client = _force_get_global_client()
-        routes = await client.prices.get_routes(token_address)
+        with deadline(timeout):
+            routes = await client.prices.get_routes(token_address)
         return [
             DexRoute(
                 path=row["path"],
@@ -153,8 +192,9 @@ class DexFactory(Enum):
     async def _(
         self,
         token: Token,
+        timeout: Optional[float] = None,
     ):
-        return await self.get_price(token.address)
+        return await self.get_price(token.address, timeout=timeout)
 
     async def get_pair_info(
         self,
@@ -163,9 +203,14 @@ class DexFactory(Enum):
         chain_id: int = 1,
     ):
         """
-        Get metadata for a particular LP Pair.
+        Get metadata for a particular LP Pair.  A pair's metadata never changes,
+        so pairs are kept in the SDK's cache for good.
         """
         client = _force_get_global_client()
+        key = f"pair:{chain_id}:{pair_address.lower()}"
+        pair = client.cache.get(key)
+        if pair is not None:
+            return pair
         pair_info = await client.prices.get_pair_info(
             pair_address,
             force_checksum=force_checksum,
@@ -173,7 +218,7 @@ class DexFactory(Enum):
         )
         token0 = Token(**pair_info["token0"])
         token1 = Token(**pair_info["token1"])
-        return DexPair(
+        pair = DexPair(
             factory_address=pair_info["factoryAddress"],
             token0=token0,
             token1=token1,
@@ -185,6 +230,8 @@ class DexFactory(Enum):
             transaction_hash=pair_info["transactionHash"],
             factory=self,
         )
+        client.cache.set(key, pair)
+        return pair
 
     async def get_pairs(
         self,
@@ -200,21 +247,9 @@ class DexFactory(Enum):
             token_address=token.address,
             chain_id=token.network.value,
         )
-        return [
-            DexPair(
-                factory_address=row["factoryAddress"],
-                token0=Token(**row["token0"]),
-                token1=Token(**row["token1"]),
-                address=row["pairAddress"],
-                index=row["index"],
-                fee=row["feePercentage"],
-                network=Network(row["chainId"]),
-                block_number=row["blockNumber"],
-                transaction_hash=row["transactionHash"],
-                factory=self,
-            )
-            for row in pairs
-        ]
+        return await client.offload(
+            len(pairs) * _PAIR_ROW_BYTES, _pairs_from_rows, self, pairs
+        )
 
     async def simulate_swap(
         self,
@@ -224,20 +259,25 @@ class DexFactory(Enum):
         fees: list[int] = [],
         use_eth: bool = True,
         network: Network = Network.Ethereum,
+        timeout: Optional[float] = None,
     ) -> TokenAmount:
         """
         Simulate a swap on a given path
+
+        :param timeout: seconds allowed for the simulation, raises
+            :class:`empyrealSDK.exc.DeadlineExceeded` when passed
         """
         client = _force_get_global_client()
-        result = await client.swap.simulate(
-            path,
-            amount_in,
-            sender,
-            fees,
-            dex=self.value,
-            chain_id=network.chain_id,
-            use_eth=use_eth,
-        )
+        with deadline(timeout):
+            result = await client.swap.simulate(
+                path,
+                amount_in,
+                sender,
+                fees,
+                dex=self.value,
+                chain_id=network.chain_id,
+                use_eth=use_eth,
+            )
         token = Token(**result["token"])
 
         return TokenAmount(
@@ -257,32 +297,118 @@ class DexFactory(Enum):
         fees: list[int] = [],
         use_eth: bool = True,
         network: Network = Network.Ethereum,
+        timeout: Optional[float] = None,
     ) -> HexStr:
         """
         :param path: swap path, consisting of the token addresses to swap through
         :param from_wallet: :class:`empyrealSDK.Wallet` executing the swap
         :param amount_in: :class:`empyrealSDK.TokenAmount` tokens being spent
         :param fees: only used for uniswapV3, ignore for more pairs
+        :param timeout: seconds allowed for the swap, including waiting on other
+            swaps from the same wallet.  Raises
+            :class:`empyrealSDK.exc.DeadlineExceeded` when passed, in which case
+            the swap may still have been submitted.
         :return: Transaction Hash
         """
         client = _force_get_global_client()
         raw_amount_in: int = (
             amount_in.amount if isinstance(amount_in, TokenAmount) else amount_in
         )
-        result = await client.swap.swap(
-            path,
-            raw_amount_in,
-            wallet.id,
-            slippage_percent=slippage_percent,
-            priority_fee=priority_fee,
-            is_private=is_private,
-            chain_id=network.chain_id,
-            use_eth=use_eth,
-            fees=fees,
-            dex=self.value,
-        )
+        with deadline(timeout):
+            async with acquire(wallet_lock(wallet.id)):
+                result = await client.swap.swap(
+                    path,
+                    raw_amount_in,
+                    wallet.id,
+                    slippage_percent=slippage_percent,
+                    priority_fee=priority_fee,
+                    is_private=is_private,
+                    chain_id=network.chain_id,
+                    use_eth=use_eth,
+                    fees=fees,
+                    dex=self.value,
+                )
         return result
 
+    async def swap_many(
+        self,
+        path: list[ChecksumAddress],
+        wallets: Sequence[Wallet],
+        amount_in: Union[TokenAmount, int],
+        slippage_percent: float,
+        priority_fee: int = 0,
+        priority_fees: Mapping[UUID, int] = {},
+        is_private: bool = False,
+        fees: list[int] = [],
+        use_eth: bool = True,
+        network: Network = Network.Ethereum,
+    ) -> AsyncIterator[SwapResult]:
+        """
+        Submit the same swap from many wallets at once, e.g. for a bundle buy.
+
+        Every submission is started before any response is awaited, to keep
+        the spread between the first and last wallet as small as possible, and
+        results are yielded as they complete.  A failed swap is yielded with
+        its error rather than raised.  Breaking out of the loop early cancels
+        the submissions which have not completed yet.
+
+        ```python
+        async for result in UniswapV2.swap_many(
+            [weth, token.address],
+            wallets,
+            amount_in=10**17,
+            slippage_percent=0.05,
+            priority_fees={sniper_wallet.id: 5 * 10**9},
+        ):
+            print(result.wallet_id, result.tx_hash or result.error)
+        ```
+
+        :param path: swap path shared by every wallet
+        :param wallets: :class:`empyrealSDK.Wallet`'s executing the swap
+        :param amount_in: :class:`empyrealSDK.TokenAmount` spent by each wallet
+        :param priority_fee: default priority fee
+        :param priority_fees: priority fee overrides keyed by wallet id
+        :return: :class:`empyrealSDK.types.transaction.SwapResult` per wallet
+        """
+        raw_amount_in: int = (
+            amount_in.amount if isinstance(amount_in, TokenAmount) else amount_in
+        )
+
+        async def submit(wallet: Wallet) -> SwapResult:
+            fee = priority_fees.get(wallet.id, priority_fee)
+            started = time.monotonic()
+            try:
+                tx_hash = await self.swap(
+                    path,
+                    wallet,
+                    raw_amount_in,
+                    slippage_percent,
+                    priority_fee=fee,
+                    is_private=is_private,
+                    fees=fees,
+                    use_eth=use_eth,
+                    network=network,
+                )
+                error = None
+            except Exception as e:
+                tx_hash, error = None, f"{type(e).__name__}: {e}"
+            return SwapResult(
+                wallet_id=wallet.id,
+                priority_fee=fee,
+                tx_hash=tx_hash,
+                error=error,
+                started=started,
+                completed=time.monotonic(),
+            )
+
+        tasks = [asyncio.ensure_future(submit(wallet)) for wallet in wallets]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            for task in tasks:
+                task.cancel()
+
 
 class SwapInterval(BaseModel):
     start_time: datetime
@@ -298,6 +424,25 @@ class SwapHistory(BaseModel):
     pair: "DexPair"
     intervals: list[SwapInterval]
 
+    def frame(self):
+        """
+        The intervals as numpy columns, for vectorized resampling and
+        indicators.  Requires the ``analytics`` extra.
+
+        :return: :class:`empyrealSDK.types.ohlc.OHLCFrame`
+        """
+        from .ohlc import OHLCFrame
+
+        return OHLCFrame.from_history(self)
+
+    def to_arrow(self):
+        """
+        The intervals as a ``pyarrow.Table``.  Requires the ``arrow`` extra.
+        Use :func:`empyrealSDK.types.arrow.histories_table` to export many
+        histories at once.
+        """
+        return self.frame().to_arrow()
+
     @property
     def timestamps(self):
         return [s.start_time for s in self.intervals]
@@ -363,60 +508,173 @@ class DexPair(BaseModel):
             block=ath["block"],
         )
 
-    async def get_liquidity(self, block_number: Optional[int] = None):
+    async def _liquidity_row(
+        self, block_number: Optional[int], cache: bool = True
+    ) -> LiquidityRow:
         client = _force_get_global_client()
+        # reserves at a past block never change, so those are cached
+        key = (self.network.value, self.address, block_number)
+        if cache and block_number is not None:
+            row = client.liquidity_cache.get(key)
+            if row is not None:
+                return row
         response = await client.prices.get_liquidity(
             token_address=self.address,
             chain_id=self.network.value,
             block_number=block_number,
         )
+        balances = response["balances"]
+        row = (
+            balances["token0"]["amount"],
+            balances["token0"]["price"],
+            balances["token1"]["amount"],
+            balances["token1"]["price"],
+        )
+        if cache and block_number is not None:
+            client.liquidity_cache.set(key, row)
+        return row
+
+    async def get_liquidity(self, block_number: Optional[int] = None):
+        token0_balance, token0_price, token1_balance, token1_price = (
+            await self._liquidity_row(block_number)
+        )
         return Liquidity(
-            token0_balance=response["balances"]["token0"]["amount"],
-            token0_price=response["balances"]["token0"]["price"],
-            token1_balance=response["balances"]["token1"]["amount"],
-            token1_price=response["balances"]["token1"]["price"],
+            token0_balance=token0_balance,
+            token0_price=token0_price,
+            token1_balance=token1_balance,
+            token1_price=token1_price,
             pair=self,
         )
 
-    async def get_taxes(self):
+    async def liquidity_series(
+        self,
+        start_block: int,
+        end_block: int,
+        step: int = 1,
+        concurrency: int = 16,
+        cache: bool = True,
+        head_block: Optional[int] = None,
+        confirmations: int = REORG_DEPTH,
+    ) -> LiquiditySeries:
+        """
+        The pair's reserves at every ``step`` blocks from ``start_block`` to
+        ``end_block`` inclusive.
+
+        Blocks are fetched ``concurrency`` at a time, and if one fails the rest
+        are cancelled and its error raised.  Blocks at least ``confirmations``
+        behind the chain head are kept in the SDK's liquidity cache, so loading
+        an overlapping range again only requests the new blocks.  Blocks which
+        could still be reorganised are always requested.
+
+        ```python
+        series = await pair.liquidity_series(19_000_000, 19_100_000, step=10)
+        for block, reserve0, reserve1, price0, price1 in series:
+            ...
+        ```
+
+        :param cache: read and fill the SDK's liquidity cache
+        :param head_block: the chain head, if known.  Otherwise the last block
+            of the range stands in for it, as the head is at least as high, so
+            the range's last ``confirmations`` blocks are not cached
+        :param confirmations: blocks behind the head after which reserves are
+            considered final
+        :return: :class:`empyrealSDK.types.series.LiquiditySeries`
+        """
+        client = _force_get_global_client()
+        blocks = range(start_block, end_block + 1, step)
+        final_block = max(head_block or 0, blocks[-1] if blocks else 0) - confirmations
+        rows: dict[int, LiquidityRow] = {}
+        missing = []
+        for block in blocks:
+            row = (
+                client.liquidity_cache.get((self.network.value, self.address, block))
+                if cache
+                else None
+            )
+            if row is None:
+                missing.append(block)
+            else:
+                rows[block] = row
+
+        async def fetch(block: int):
+            row = await self._liquidity_row(block, cache=False)
+            rows[block] = row
+            if cache and block <= final_block:
+                client.liquidity_cache.set(
+                    (self.network.value, self.address, block), row
+                )
+
+        await gather_bounded((fetch(block) for block in missing), concurrency)
+        return LiquiditySeries.from_rows(self, blocks, rows)
+
+    @staticmethod
+    async def liquidity_snapshot(
+        pairs: Sequence["DexPair"],
+        block_number: int,
+        concurrency: int = 32,
+        cache: bool = False,
+    ) -> LiquiditySnapshot:
+        """
+        The liquidity of every pair as of the same block.
+
+        Pairs are fetched ``concurrency`` at a time, and a pair whose lookup
+        fails is recorded in the snapshot's ``errors`` rather than raised.  The
+        liquidity endpoint does not report the block it answered at, so the
+        block to pin every pair to has to be given.
+
+        ```python
+        snapshot = await DexPair.liquidity_snapshot(pairs, 19_000_000)
+        print(snapshot.block, snapshot.column("reserve1"))
+        ```
+
+        :param block_number: the block every pair's liquidity is read at
+        :param cache: read and fill the SDK's liquidity cache, worth enabling
+            for blocks too old to be reorganised
+        :return: :class:`empyrealSDK.types.series.LiquiditySnapshot`
+        """
+        rows: dict[str, LiquidityRow] = {}
+        errors: dict[str, str] = {}
+
+        async def fetch(pair: DexPair):
+            try:
+                rows[pair.address] = await pair._liquidity_row(
+                    block_number, cache=cache
+                )
+            except Exception as e:
+                errors[pair.address] = f"{type(e).__name__}: {e}"
+
+        await gather_bounded((fetch(pair) for pair in pairs), concurrency)
+        return LiquiditySnapshot(block_number, pairs, rows, errors)
+
+    async def get_taxes(self, refresh: bool = False):
         return await self.factory.get_taxes(
             self.token0.address,
             self.token1.address,
+            chain_id=self.network.value,
+            refresh=refresh,
+        )
+
+    async def swap_columns(self, use_token0: bool = True) -> FeedColumns:
+        """
+        The pair's price feed as flat columns, without building a model per
+        interval.  Use ``.to_frame()`` on the result for numpy analytics.
+
+        :return: :class:`empyrealSDK.utils.feed.FeedColumns`
+        """
+        client = _force_get_global_client()
+        return await client.prices.load_feed_columns(
+            self.address,
+            use_token0=use_token0,
         )
 
     async def swap_history(
         self, use_token0: bool = True, start_time=None, end_time=None
     ):
         client = _force_get_global_client()
-        feed = await client.prices.load_feed(
-            self.address,
-            use_token0=use_token0,
+        feed = await self.swap_columns(use_token0=use_token0)
+        return await client.offload(
+            len(feed) * _FEED_ROW_BYTES, _swap_history, self, feed
         )
-        response = []
-        for row in sorted(feed.split("\n"))[1:]:
-            (
-                interval,
-                open,
-                close,
-                min,
-                max,
-                min_block,
-                max_block,
-                num_tx,
-                prev_close,
-            ) = row.split(",")
-            response.append(
-                SwapInterval(
-                    start_time=datetime.strptime(interval, "%Y-%m-%d %H:%M:%S+00:00"),
-                    open=float(open),
-                    close=float(close),
-                    min=float(min),
-                    max=float(max),
-                    tx_count=int(num_tx),
-                    prev_close=float(prev_close if prev_close != "None" else open),
-                )
-            )
-        return SwapHistory(pair=self, intervals=response)
 
     async def swap(
         self,
@@ -437,4 +695,39 @@ class DexPair(BaseModel):
     __str__ = __repr__
 
 
+def _pairs_from_rows(factory: DexFactory, rows: list[dict]) -> list[DexPair]:
+    return [
+        DexPair(
+            factory_address=row["factoryAddress"],
+            token0=Token(**row["token0"]),
+            token1=Token(**row["token1"]),
+            address=row["pairAddress"],
+            index=row["index"],
+            fee=row["feePercentage"],
+            network=Network(row["chainId"]),
+            block_number=row["blockNumber"],
+            transaction_hash=row["transactionHash"],
+            factory=factory,
+        )
+        for row in rows
+    ]
+
+
+def _swap_history(pair: DexPair, feed: FeedColumns) -> SwapHistory:
+    # the columns are already typed, so the intervals skip validation
+    intervals = [
+        SwapInterval.model_construct(
+            start_time=_EPOCH + timedelta(seconds=row.time),
+            open=row.open,
+            close=row.close,
+            min=row.min,
+            max=row.max,
+            tx_count=row.tx_count,
+            prev_close=row.open if math.isnan(row.prev_close) else row.prev_close,
+        )
+        for row in feed
+    ]
+    return SwapHistory(pair=pair, intervals=intervals)
+
+
 UniswapV2 = DexFactory.UniswapV2
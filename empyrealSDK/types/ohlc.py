@@ -0,0 +1,177 @@
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Union
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "OHLC analytics require numpy, `pip install empyrealSDK[analytics]`"
+    ) from e
+
+if TYPE_CHECKING:
+    from .dex import SwapHistory
+
+COLUMNS = ("time", "open", "close", "min", "max", "tx_count", "prev_close")
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = _EPOCH.replace(tzinfo=timezone.utc)
+_SECOND = timedelta(seconds=1)
+
+
+def _epoch_seconds(moment: datetime) -> int:
+    epoch = _EPOCH if moment.tzinfo is None else _EPOCH_UTC
+    return (moment - epoch) // _SECOND
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    out = np.full(len(values), np.nan)
+    if window <= len(values):
+        sums = np.cumsum(np.insert(values, 0, 0.0))
+        out[window - 1 :] = (sums[window:] - sums[:-window]) / window
+    return out
+
+
+class OHLCFrame:
+    """
+    A swap history as numpy columns, for resampling and indicators without a
+    Python loop per interval.  Created with
+    :meth:`empyrealSDK.types.SwapHistory.frame`.
+
+    Every indicator returns an array aligned with the intervals, with `nan`
+    until its window is full.
+
+    ```python
+    history = await pair.swap_history()
+    hourly = history.frame().resample(timedelta(hours=1))
+    trend = hourly.sma(24) > hourly.sma(24 * 7)
+    ```
+    """
+
+    __slots__ = COLUMNS
+
+    def __init__(
+        self,
+        time: np.ndarray,
+        open: np.ndarray,
+        close: np.ndarray,
+        min: np.ndarray,
+        max: np.ndarray,
+        tx_count: np.ndarray,
+        prev_close: np.ndarray,
+    ):
+        self.time = time
+        self.open = open
+        self.close = close
+        self.min = min
+        self.max = max
+        self.tx_count = tx_count
+        self.prev_close = prev_close
+
+    @classmethod
+    def from_history(cls, history: "SwapHistory") -> "OHLCFrame":
+        intervals = history.intervals
+        n = len(intervals)
+        # timedelta arithmetic is several times faster than numpy's datetime parsing
+        time = np.fromiter(
+            (_epoch_seconds(s.start_time) for s in intervals), np.int64, n
+        ).astype("datetime64[s]")
+        frame = cls(
+            time=time,
+            open=np.fromiter((s.open for s in intervals), np.float64, n),
+            close=np.fromiter((s.close for s in intervals), np.float64, n),
+            min=np.fromiter((s.min for s in intervals), np.float64, n),
+            max=np.fromiter((s.max for s in intervals), np.float64, n),
+            tx_count=np.fromiter((s.tx_count for s in intervals), np.int64, n),
+            prev_close=np.fromiter((s.prev_close for s in intervals), np.float64, n),
+        )
+        if n and (np.diff(time.astype(np.int64)) < 0).any():
+            order = np.argsort(time, kind="stable")
+            frame = cls(*(getattr(frame, name)[order] for name in COLUMNS))
+        return frame
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def __repr__(self):
+        if not len(self):
+            return "<OHLCFrame: empty>"
+        return f"<OHLCFrame: {self.time[0]}..{self.time[-1]}, {len(self)} intervals>"
+
+    def to_arrow(self):
+        """The columns as a ``pyarrow.Table``, without copying"""
+        from .arrow import frame_table
+
+        return frame_table(self)
+
+    def resample(self, bucket: Union[timedelta, int]) -> "OHLCFrame":
+        """
+        Aggregate into buckets of ``bucket`` seconds, aligned to the unix epoch.
+        Each bucket opens at its first open, closes at its last close, spans
+        the min and max of its intervals and sums their transactions.  Empty
+        buckets are left out.
+        """
+        seconds = int(
+            bucket.total_seconds() if isinstance(bucket, timedelta) else bucket
+        )
+        if seconds <= 0:
+            raise ValueError("Bucket must be at least one second")
+        if not len(self):
+            return self
+
+        keys = self.time.astype(np.int64) // seconds
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(keys)) + 1))
+        ends = np.append(starts[1:], len(keys)) - 1
+        return OHLCFrame(
+            time=(keys[starts] * seconds).astype("datetime64[s]"),
+            open=self.open[starts],
+            close=self.close[ends],
+            min=np.minimum.reduceat(self.min, starts),
+            max=np.maximum.reduceat(self.max, starts),
+            tx_count=np.add.reduceat(self.tx_count, starts),
+            prev_close=self.prev_close[starts],
+        )
+
+    def returns(self) -> np.ndarray:
+        """Each interval's close relative to the previous close"""
+        return self.close / self.prev_close - 1
+
+    def log_returns(self) -> np.ndarray:
+        return np.log(self.close / self.prev_close)
+
+    def sma(self, window: int) -> np.ndarray:
+        """Simple moving average of the close"""
+        return _rolling_mean(self.close, window)
+
+    def volatility(self, window: int) -> np.ndarray:
+        """Rolling standard deviation of the log returns"""
+        out = np.full(len(self), np.nan)
+        if window <= len(self):
+            windows = np.lib.stride_tricks.sliding_window_view(
+                self.log_returns(), window
+            )
+            out[window - 1 :] = windows.std(axis=1, ddof=1)
+        return out
+
+    def rsi(self, window: int = 14) -> np.ndarray:
+        """
+        Relative strength index of the close, from 0 to 100.  Gains and losses
+        are averaged with a simple moving average (Cutler's RSI) rather than
+        Wilder's smoothing, which keeps it free of a sequential loop.
+        """
+        change = self.close - self.prev_close
+        gain = _rolling_mean(np.clip(change, 0, None), window)
+        loss = _rolling_mean(np.clip(-change, 0, None), window)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = 100 - 100 / (1 + gain / loss)
+        # no losses in the window is maximal strength, no movement is neutral
+        rsi[(loss == 0) & (gain > 0)] = 100.0
+        rsi[(loss == 0) & (gain == 0)] = 50.0
+        return rsi
+
+    def drawdown(self) -> np.ndarray:
+        """
+        Fall of the close from the running peak, intra-interval highs included,
+        e.g. ``-0.25`` is 25% below the peak
+        """
+        peak = np.maximum.accumulate(np.maximum(self.close, self.max))
+        return self.close / peak - 1
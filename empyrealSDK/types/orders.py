@@ -0,0 +1,414 @@
+import asyncio
+from datetime import datetime, timezone
+from enum import Enum, auto
+import heapq
+import inspect
+from itertools import count
+import time
+from typing import Any, Awaitable, Callable, Optional, Union, cast
+from uuid import UUID, uuid4
+
+from eth_typing import ChecksumAddress, HexStr
+from pydantic import BaseModel, Field
+
+from .dex import DexFactory, UniswapV2
+from .token import TokenAmount
+from .wallet import Wallet
+
+PriceSource = Callable[[ChecksumAddress], Awaitable[float]]
+
+
+class LimitOrderType(Enum):
+    TrailingStopLoss = auto()
+    StopLoss = auto()
+    TakeProfit = auto()
+
+
+class LimitOrder(BaseModel):
+    """
+    An order executed client side by :class:`OrderEngine` once the price of
+    ``token`` crosses its trigger.
+
+    Prices are quoted in ETH per token, the same as ``DexRoute.eth_price``.
+
+    - ``StopLoss`` triggers when the price falls to ``trigger_price``
+    - ``TakeProfit`` triggers when the price rises to ``trigger_price``
+    - ``TrailingStopLoss`` triggers when the price falls ``trail_percent``
+      below the highest price seen since the order was placed
+    """
+
+    id: UUID = Field(default_factory=uuid4)
+    type: LimitOrderType
+    token: ChecksumAddress
+    """The token whose price is watched"""
+    wallet: Wallet
+    path: list[ChecksumAddress]
+    """Swap path executed when the order triggers"""
+    amount_in: int
+    slippage_percent: float = 0.05
+    priority_fee: int = 0
+    trigger_price: Optional[float] = None
+    trail_percent: Optional[float] = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+    def model_post_init(self, __context: Any):
+        if self.type == LimitOrderType.TrailingStopLoss:
+            if self.trail_percent is None or not 0 < self.trail_percent < 1:
+                raise ValueError("TrailingStopLoss requires 0 < trail_percent < 1")
+        elif self.trigger_price is None:
+            raise ValueError(f"{self.type.name} requires a trigger_price")
+
+    def __repr__(self):
+        trigger = (
+            f"trail {self.trail_percent:.2%}"
+            if self.type == LimitOrderType.TrailingStopLoss
+            else f"@ {self.trigger_price}"
+        )
+        return f"<LimitOrder {self.type.name}: {self.token} {trigger}>"
+
+    __str__ = __repr__
+
+
+class OrderFill(BaseModel):
+    """An order which was triggered, and the result of executing it"""
+
+    order: LimitOrder
+    price: float
+    tx_hash: Optional[HexStr] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+# entries are (key, sequence, order id), the sequence breaks ties
+_Entry = tuple[float, int, UUID]
+
+
+class _TrailingCohort:
+    """Trailing orders sharing the same peak price, in a heap by trail percent"""
+
+    __slots__ = ("peak", "trails", "key")
+
+    def __init__(self, peak: float, trails: list[_Entry]):
+        self.peak = peak
+        self.trails = trails
+        # the cohort's current entry in `_TokenBook.thresholds`
+        self.key: Optional[tuple[float, int, _TrailingCohort]] = None
+
+    def triggers(self, trail: float, price: float) -> bool:
+        return self.peak * (1 - trail) >= price
+
+
+class _TokenBook:
+    """
+    The open orders for one token.
+
+    Stop losses are kept in a heap by highest trigger price and take profits by
+    lowest, so an update pops exactly the orders it triggers.
+
+    Every trailing order's peak is the highest price since it was placed, which
+    always includes the latest price.  So older orders have peaks at least as
+    high as newer ones, and orders are grouped into cohorts sharing a peak on
+    a stack ordered oldest first.  A new high merges the cohorts below it from
+    the top of the stack, pushing the smaller's orders into the larger's heap,
+    and every cohort is in one heap by the price its tightest trail triggers at.
+
+    Cancelled orders and superseded cohort entries are skipped when popped, and
+    the heaps are rebuilt once they hold more garbage than live orders, so an
+    update costs O(log n) per triggered order, merge and new high, amortized.
+    """
+
+    def __init__(self):
+        # a max heap, keyed by negated trigger price
+        self.stop_losses: list[_Entry] = []
+        self.take_profits: list[_Entry] = []
+        self.trailing: list[_TrailingCohort] = []
+        # a max heap of cohorts, keyed by the negated price they next trigger at
+        self.thresholds: list[tuple[float, int, _TrailingCohort]] = []
+        self.last_price: Optional[float] = None
+        self._live: set[UUID] = set()
+        self._garbage = 0
+        self._seq = count()
+
+    def __len__(self):
+        return len(self._live)
+
+    def add(self, order: LimitOrder, seq: int, price: Optional[float]):
+        if order.type == LimitOrderType.TrailingStopLoss:
+            peak = price if price is not None else self.last_price
+            if peak is None:
+                raise ValueError("A trailing stop needs a reference price to start")
+            self._raise_peaks(peak)
+            # both validated by `LimitOrder.model_post_init`
+            entry = (cast(float, order.trail_percent), seq, order.id)
+            if self.trailing and self.trailing[-1].peak == peak:
+                cohort = self.trailing[-1]
+                heapq.heappush(cohort.trails, entry)
+            else:
+                cohort = _TrailingCohort(peak, [entry])
+                self.trailing.append(cohort)
+            self._push(cohort)
+        else:
+            trigger = cast(float, order.trigger_price)
+            if order.type == LimitOrderType.StopLoss:
+                heapq.heappush(self.stop_losses, (-trigger, seq, order.id))
+            else:
+                heapq.heappush(self.take_profits, (trigger, seq, order.id))
+        self._live.add(order.id)
+
+    def cancel(self, order_id: UUID):
+        if order_id in self._live:
+            self._live.remove(order_id)
+            self._garbage += 1
+            self._maybe_compact()
+
+    def _push(self, cohort: _TrailingCohort):
+        """(Re)insert ``cohort`` into `thresholds`, superseding its old entry"""
+        if cohort.key is not None:
+            self._garbage += 1
+        if cohort.trails:
+            trail = cohort.trails[0][0]
+            cohort.key = (-cohort.peak * (1 - trail), next(self._seq), cohort)
+            heapq.heappush(self.thresholds, cohort.key)
+        else:
+            cohort.key = None
+
+    def _raise_peaks(self, price: float):
+        merged: Optional[_TrailingCohort] = None
+        while self.trailing and self.trailing[-1].peak <= price:
+            cohort = self.trailing.pop()
+            if merged is None:
+                merged = cohort
+                continue
+            if len(cohort.trails) > len(merged.trails):
+                merged, cohort = cohort, merged
+            for entry in cohort.trails:
+                heapq.heappush(merged.trails, entry)
+            if cohort.key is not None:
+                cohort.key = None
+                self._garbage += 1
+        if merged is not None:
+            self.trailing.append(merged)
+            if merged.peak != price or merged.key is None:
+                merged.peak = price
+                self._push(merged)
+
+    def _pop(self, heap: list[_Entry], triggered: list[UUID]):
+        order_id = heapq.heappop(heap)[2]
+        if order_id in self._live:
+            self._live.remove(order_id)
+            triggered.append(order_id)
+
+    def update(self, price: float) -> list[UUID]:
+        """Record a new price, and pop the ids of every triggered order"""
+        self.last_price = price
+        triggered: list[UUID] = []
+
+        # stop losses trigger at or above the price
+        while self.stop_losses and -self.stop_losses[0][0] >= price:
+            self._pop(self.stop_losses, triggered)
+
+        # take profits trigger at or below the price
+        while self.take_profits and self.take_profits[0][0] <= price:
+            self._pop(self.take_profits, triggered)
+
+        self._raise_peaks(price)
+        while self.thresholds and -self.thresholds[0][0] >= price:
+            key = heapq.heappop(self.thresholds)
+            cohort = key[2]
+            if cohort.key is not key:
+                continue
+            cohort.key = None
+            # the same test as the cohort's key, so at least one order pops
+            while cohort.trails and cohort.triggers(cohort.trails[0][0], price):
+                self._pop(cohort.trails, triggered)
+            if cohort.trails:
+                self._push(cohort)
+            else:
+                # left on the stack until merged or compacted
+                self._garbage += 1
+
+        self._maybe_compact()
+        return triggered
+
+    def _maybe_compact(self):
+        if self._garbage <= len(self._live):
+            return
+        live = self._live
+        self.stop_losses = [e for e in self.stop_losses if e[2] in live]
+        self.take_profits = [e for e in self.take_profits if e[2] in live]
+        heapq.heapify(self.stop_losses)
+        heapq.heapify(self.take_profits)
+        trailing = []
+        for cohort in self.trailing:
+            cohort.trails = [e for e in cohort.trails if e[2] in live]
+            if cohort.trails:
+                heapq.heapify(cohort.trails)
+                trailing.append(cohort)
+        self.trailing = trailing
+        self.thresholds = []
+        for cohort in trailing:
+            cohort.key = None
+            self._push(cohort)
+        self._garbage = 0
+
+
+class OrderBook:
+    """
+    Open :class:`LimitOrder`'s for many tokens, indexed for fast triggering.
+
+    A price update costs O(log n) per order it triggers, no matter how many
+    orders are open.
+    """
+
+    def __init__(self):
+        self.orders: dict[UUID, LimitOrder] = {}
+        self._books: dict[ChecksumAddress, _TokenBook] = {}
+        self._seq = count()
+
+    def add(self, order: LimitOrder, price: Optional[float] = None) -> LimitOrder:
+        """
+        Add an order.  Trailing stops start from ``price``, or the last price
+        seen for the token if not provided.
+        """
+        book = self._books.setdefault(order.token, _TokenBook())
+        book.add(order, next(self._seq), price)
+        self.orders[order.id] = order
+        return order
+
+    def cancel(self, order_id: UUID) -> Optional[LimitOrder]:
+        order = self.orders.pop(order_id, None)
+        if order is not None:
+            book = self._books[order.token]
+            book.cancel(order_id)
+            if not len(book):
+                del self._books[order.token]
+        return order
+
+    def update(self, token: ChecksumAddress, price: float) -> list[LimitOrder]:
+        """Record a new price for a token and return the orders it triggers"""
+        book = self._books.get(token)
+        if book is None:
+            return []
+        triggered = [self.orders.pop(order_id) for order_id in book.update(price)]
+        if not len(book):
+            del self._books[token]
+        return triggered
+
+    @property
+    def tokens(self) -> list[ChecksumAddress]:
+        """Every token with open orders"""
+        return list(self._books)
+
+    def __len__(self):
+        return len(self.orders)
+
+
+class OrderEngine:
+    """
+    Runs an :class:`OrderBook` from a single process.
+
+    Each tick, prices are fetched concurrently for only the tokens with open
+    orders, the book is updated, and every triggered order is executed with
+    :meth:`empyrealSDK.types.DexFactory.swap`.
+
+    ```python
+    engine = OrderEngine(on_fill=notify_user)
+    engine.place(
+        LimitOrder(
+            type=LimitOrderType.StopLoss,
+            token=token.address,
+            wallet=wallet,
+            path=[token.address, UniswapV2.weth],
+            amount_in=balance.amount,
+            trigger_price=0.00000045,
+        )
+    )
+    await engine.run()
+    ```
+
+    :param factory: dex used to price tokens and execute orders
+    :param poll_interval: seconds between price updates
+    :param price_source: coroutine function returning a token's ETH price,
+        defaults to the factory's best route
+    :param on_fill: called, or awaited, with an :class:`OrderFill` per order
+    """
+
+    def __init__(
+        self,
+        factory: DexFactory = UniswapV2,
+        poll_interval: float = 2.0,
+        price_source: Optional[PriceSource] = None,
+        on_fill: Optional[Callable[[OrderFill], Any]] = None,
+        book: Optional[OrderBook] = None,
+    ):
+        self.factory = factory
+        self.poll_interval = poll_interval
+        self.price_source = price_source or self._route_price
+        self.on_fill = on_fill
+        self.book = book or OrderBook()
+        self._stopped = asyncio.Event()
+
+    async def _route_price(self, token: ChecksumAddress) -> float:
+        routes = await self.factory.get_price(token)
+        eth_price: TokenAmount = routes[0].eth_price
+        return eth_price.amount / 10**eth_price.decimals
+
+    def place(self, order: LimitOrder, price: Optional[float] = None) -> LimitOrder:
+        return self.book.add(order, price)
+
+    def cancel(self, order_id: UUID) -> Optional[LimitOrder]:
+        return self.book.cancel(order_id)
+
+    async def _execute(self, order: LimitOrder, price: float) -> OrderFill:
+        fill = OrderFill(order=order, price=price)
+        try:
+            fill.tx_hash = await self.factory.swap(
+                order.path,
+                order.wallet,
+                order.amount_in,
+                order.slippage_percent,
+                priority_fee=order.priority_fee,
+            )
+        except Exception as e:
+            fill.error = f"{type(e).__name__}: {e}"
+        if self.on_fill is not None:
+            result = self.on_fill(fill)
+            if inspect.isawaitable(result):
+                await result
+        return fill
+
+    async def tick(self) -> list[OrderFill]:
+        """Fetch prices once, and execute every order they trigger"""
+        tokens = self.book.tokens
+        prices: list[Union[float, BaseException]] = await asyncio.gather(
+            *(self.price_source(token) for token in tokens),
+            return_exceptions=True,
+        )
+        executions = []
+        for token, price in zip(tokens, prices):
+            if isinstance(price, BaseException):
+                continue
+            for order in self.book.update(token, price):
+                executions.append(self._execute(order, price))
+        return await asyncio.gather(*executions)
+
+    async def run(self):
+        """Poll and execute orders until :meth:`stop` is called"""
+        self._stopped.clear()
+        while not self._stopped.is_set():
+            started = time.monotonic()
+            if len(self.book):
+                await self.tick()
+            try:
+                await asyncio.wait_for(
+                    self._stopped.wait(),
+                    max(0.0, self.poll_interval - (time.monotonic() - started)),
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    def stop(self):
+        self._stopped.set()
@@ -0,0 +1,199 @@
+import asyncio
+import time
+from typing import Optional, Union
+
+from eth_typing import ChecksumAddress
+from pydantic import BaseModel
+
+from .dex import DexFactory, UniswapV2
+from .security import Security
+from .token import Token, TokenAmount
+from .wallet import Wallet
+from ..utils.client import _force_get_global_client
+from ..utils.deadline import deadline as request_deadline
+
+
+class PretradeReport(BaseModel):
+    """
+    The result of :func:`pretrade_check`.  Any check which failed, timed out or
+    was cancelled after another check disqualified the trade is left as `None`.
+    """
+
+    token: Token
+    amount_in: int
+    path: list[ChecksumAddress]
+    use_eth: bool = False
+    """The trade spends native ETH, which needs no allowance or token balance"""
+
+    security: Optional[Security] = None
+    buy_tax: Optional[float] = None
+    sell_tax: Optional[float] = None
+    expected_out: Optional[TokenAmount] = None
+    allowance: Optional[int] = None
+    balance: Optional[int] = None
+
+    rejected: Optional[str] = None
+    """Reason the trade was disqualified, if any"""
+    errors: dict[str, str] = {}
+    """Checks which raised or did not finish before the deadline"""
+    elapsed: float = 0.0
+
+    @property
+    def allowance_ok(self) -> bool:
+        if self.use_eth:
+            return True
+        return self.allowance is not None and self.allowance >= self.amount_in
+
+    @property
+    def balance_ok(self) -> bool:
+        # there is no native balance lookup, the simulation stands in for it
+        if self.use_eth:
+            return True
+        return self.balance is not None and self.balance >= self.amount_in
+
+    @property
+    def ok(self) -> bool:
+        """The trade can go ahead, every check passed and none were skipped"""
+        return (
+            self.rejected is None
+            and not self.errors
+            and self.security is not None
+            and self.expected_out is not None
+            and self.balance_ok
+        )
+
+    def __repr__(self):
+        status = "ok" if self.ok else (self.rejected or f"errors: {self.errors}")
+        return f"<PretradeReport: {self.token.symbol} | {status}>"
+
+    __str__ = __repr__
+
+
+def _disqualify(report: PretradeReport, max_tax: float) -> Optional[str]:
+    security = report.security
+    if security is not None:
+        if security.is_honeypot:
+            return "token is a honeypot"
+        if security.cannot_buy:
+            return "token cannot be bought"
+        if security.cannot_sell_all:
+            return "token cannot be fully sold"
+    for side in ("buy", "sell"):
+        tax = getattr(report, f"{side}_tax")
+        if tax is not None and tax > max_tax:
+            return f"{side} tax {tax:.2%} exceeds {max_tax:.2%}"
+    if report.balance is not None and not report.balance_ok:
+        return "insufficient balance"
+    return None
+
+
+async def pretrade_check(
+    token: Token,
+    wallet: Wallet,
+    amount_in: Union[TokenAmount, int],
+    path: Optional[list[ChecksumAddress]] = None,
+    spender: Optional[ChecksumAddress] = None,
+    factory: DexFactory = UniswapV2,
+    use_eth: bool = True,
+    max_tax: float = 0.1,
+    timeout: float = 5.0,
+) -> PretradeReport:
+    """
+    Run every check needed before buying ``token`` concurrently.
+
+    The security report, which includes the buy and sell taxes, a simulation
+    of the swap and, when spending an ERC20, its allowance and balance are
+    requested at once under a shared ``timeout``, so the whole check takes
+    about one round trip.  As soon as a result disqualifies the trade, e.g. a
+    honeypot, a tax above ``max_tax`` or an insufficient balance, the remaining
+    checks are cancelled and the report is returned.
+
+    ```python
+    report = await pretrade_check(token, wallet, 10**17)
+    if report.ok:
+        if not report.allowance_ok:
+            await weth.approve(wallet, UniswapV2.router)
+        await UniswapV2.swap(report.path, wallet, 10**17, 0.05)
+    ```
+
+    :param token: :class:`empyrealSDK.Token` being bought
+    :param wallet: :class:`empyrealSDK.Wallet` making the trade
+    :param amount_in: amount of ``path[0]`` spent
+    :param path: swap path, defaults to WETH -> token
+    :param spender: allowance spender, defaults to the factory's router
+    :param use_eth: spend native ETH, which needs no allowance.  The API has no
+        native balance lookup, so the simulation is relied on to fail when the
+        wallet holds too little ETH.  Otherwise ``path[0]`` is spent as an
+        ERC20, and its balance and allowance are checked
+    :param max_tax: highest acceptable buy or sell tax
+    :param timeout: seconds for every check to complete
+    :return: :class:`.PretradeReport`
+    """
+    client = _force_get_global_client()
+    raw_amount_in = (
+        amount_in.amount if isinstance(amount_in, TokenAmount) else amount_in
+    )
+    path = path or [factory.weth, token.address]
+    spender = spender or factory.router
+    chain_id = token.network.chain_id
+    report = PretradeReport(
+        token=token, amount_in=raw_amount_in, path=path, use_eth=use_eth
+    )
+
+    async def security():
+        report.security = await token.security()
+        report.buy_tax = report.security.buy_tax
+        report.sell_tax = report.security.sell_tax
+
+    async def simulate():
+        report.expected_out = await factory.simulate_swap(
+            path,
+            raw_amount_in,
+            wallet.address,
+            use_eth=use_eth,
+            network=token.network,
+        )
+
+    async def allowance():
+        report.allowance = await client.token.allowance(
+            path[0], wallet.address, spender, chain_id
+        )
+
+    async def balance():
+        report.balance = await client.token.balance_of(
+            path[0], wallet.address, chain_id
+        )
+
+    start = time.monotonic()
+    # tasks copy the context, so each check's requests share the deadline
+    with request_deadline(timeout):
+        checks = {
+            asyncio.ensure_future(check()): check.__name__
+            for check in (security, simulate)
+            + (() if use_eth else (balance, allowance))
+        }
+    pending = set(checks)
+    deadline = start + timeout
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=max(0.0, deadline - time.monotonic()),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                for task in pending:
+                    report.errors[checks[task]] = "timed out"
+                break
+            for task in done:
+                if (error := task.exception()) is not None:
+                    report.errors[checks[task]] = f"{type(error).__name__}: {error}"
+            if reason := _disqualify(report, max_tax):
+                report.rejected = reason
+                break
+    finally:
+        for task in pending:
+            task.cancel()
+
+    report.elapsed = time.monotonic() - start
+    return report
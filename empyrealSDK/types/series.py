@@ -0,0 +1,190 @@
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+import math
+from typing import NamedTuple, Optional, TYPE_CHECKING
+
+from ..utils.address import checksum_address
+
+if TYPE_CHECKING:
+    from .dex import DexPair
+
+LiquidityRow = tuple[int, Optional[float], int, Optional[float]]
+"""Raw ``(token0 amount, token0 price, token1 amount, token1 price)`` at a block"""
+
+
+class LiquidityPoint(NamedTuple):
+    block: int
+    reserve0: float
+    reserve1: float
+    price0: float
+    price1: float
+
+
+class LiquiditySeries:
+    """
+    A pair's reserves over a range of blocks, returned by
+    :meth:`empyrealSDK.types.DexPair.liquidity_series`.
+
+    Columns are stored as flat arrays rather than one object per block, so long
+    histories stay small.  Reserves are scaled by the token decimals, and
+    missing prices are `nan`.
+
+    ```python
+    series = await pair.liquidity_series(19_000_000, 19_100_000, step=10)
+    depth = [r0 * p0 for r0, p0 in zip(series.reserve0, series.price0)]
+    ```
+    """
+
+    __slots__ = ("pair", "blocks", "reserve0", "reserve1", "price0", "price1")
+
+    def __init__(self, pair: "DexPair"):
+        self.pair = pair
+        self.blocks = array("q")
+        self.reserve0 = array("d")
+        self.reserve1 = array("d")
+        self.price0 = array("d")
+        self.price1 = array("d")
+
+    @classmethod
+    def from_rows(
+        cls,
+        pair: "DexPair",
+        blocks: Iterable[int],
+        rows: Mapping[int, LiquidityRow],
+    ) -> "LiquiditySeries":
+        series = cls(pair)
+        scale0 = 10**pair.token0.decimals
+        scale1 = 10**pair.token1.decimals
+        for block in blocks:
+            amount0, price0, amount1, price1 = rows[block]
+            series.blocks.append(block)
+            series.reserve0.append(amount0 / scale0)
+            series.reserve1.append(amount1 / scale1)
+            series.price0.append(math.nan if price0 is None else price0)
+            series.price1.append(math.nan if price1 is None else price1)
+        return series
+
+    def __len__(self) -> int:
+        return len(self.blocks)
+
+    def to_arrow(self):
+        """
+        The columns as a ``pyarrow.Table``, without copying.  Requires the
+        ``arrow`` extra.
+        """
+        from .arrow import series_table
+
+        return series_table(self)
+
+    def __getitem__(self, index: int) -> LiquidityPoint:
+        return LiquidityPoint(
+            self.blocks[index],
+            self.reserve0[index],
+            self.reserve1[index],
+            self.price0[index],
+            self.price1[index],
+        )
+
+    def __iter__(self) -> Iterator[LiquidityPoint]:
+        return map(
+            LiquidityPoint,
+            self.blocks,
+            self.reserve0,
+            self.reserve1,
+            self.price0,
+            self.price1,
+        )
+
+    def __repr__(self):
+        if not self.blocks:
+            return f"<LiquiditySeries: {self.pair}, empty>"
+        return (
+            f"<LiquiditySeries: {self.pair}, "
+            f"blocks {self.blocks[0]}..{self.blocks[-1]}, {len(self)} points>"
+        )
+
+
+class LiquiditySnapshot:
+    """
+    The liquidity of many pairs at one block, returned by
+    :meth:`empyrealSDK.types.DexPair.liquidity_snapshot`.
+
+    Rows are indexed by pair address, in any letter case, and kept in the
+    order the pairs were given.  Pairs whose lookup failed are left out of the table and listed in
+    ``errors``.
+
+    ```python
+    snapshot = await DexPair.liquidity_snapshot(pairs, block)
+    liquidity = snapshot[pair.address]
+    deepest = max(snapshot.items(), key=lambda item: item[1].token1_balance)
+    ```
+    """
+
+    __slots__ = ("block", "pairs", "rows", "errors", "_index")
+
+    def __init__(
+        self,
+        block: int,
+        pairs: Iterable["DexPair"],
+        rows: Mapping[str, LiquidityRow],
+        errors: Mapping[str, str] = {},
+    ):
+        self.block = block
+        self.pairs = [pair for pair in pairs if pair.address in rows]
+        self.rows = [rows[pair.address] for pair in self.pairs]
+        self.errors = dict(errors)
+        self._index = {
+            checksum_address(pair.address): i for i, pair in enumerate(self.pairs)
+        }
+
+    def _liquidity(self, i: int):
+        from .dex import Liquidity
+
+        amount0, price0, amount1, price1 = self.rows[i]
+        return Liquidity(
+            token0_balance=amount0,
+            token0_price=price0,
+            token1_balance=amount1,
+            token1_price=price1,
+            pair=self.pairs[i],
+        )
+
+    def __len__(self) -> int:
+        return len(self.pairs)
+
+    def __contains__(self, address: str) -> bool:
+        try:
+            return checksum_address(address) in self._index
+        except ValueError:
+            return False
+
+    def __getitem__(self, address: str):
+        """:class:`empyrealSDK.types.Liquidity` of the pair at ``address``"""
+        return self._liquidity(self._index[checksum_address(address)])
+
+    def items(self) -> Iterator[tuple[str, object]]:
+        for i, pair in enumerate(self.pairs):
+            yield pair.address, self._liquidity(i)
+
+    def column(self, field: str) -> array:
+        """
+        One column across every pair as a flat array, one of ``reserve0``,
+        ``reserve1``, ``price0`` or ``price1``.  Reserves are scaled by the
+        token decimals and missing prices are `nan`.
+        """
+        position = {"reserve0": 0, "price0": 1, "reserve1": 2, "price1": 3}[field]
+        values = array("d")
+        for pair, row in zip(self.pairs, self.rows):
+            value = row[position]
+            if field == "reserve0":
+                value = value / 10**pair.token0.decimals
+            elif field == "reserve1":
+                value = value / 10**pair.token1.decimals
+            values.append(math.nan if value is None else value)
+        return values
+
+    def __repr__(self):
+        return (
+            f"<LiquiditySnapshot: block {self.block}, {len(self)} pairs, "
+            f"{len(self.errors)} errors>"
+        )
@@ -1,4 +1,7 @@
+import asyncio
+from collections.abc import Iterable, Sequence
 from functools import singledispatchmethod
+import time
 from typing import Literal, Optional, Union
 from uuid import UUID
 
@@ -7,8 +10,17 @@ from pydantic import BaseModel, Field
 
 from .network import Network
 from .security import Security
+from .transaction import BulkTransferReport, TransferResult
 from .wallet import Wallet
+from ..utils.address import checksum_address
 from ..utils.client import _force_get_global_client
+from ..utils.concurrency import keyed_lock, wallet_lock
+from ..utils.deadline import acquire, deadline
+
+# seconds a security report is served from the SDK's cache
+SECURITY_TTL = 600
+# seconds an approval is assumed to have succeeded, before it is read onchain
+APPROVAL_TTL = 30
 
 
 class Token(BaseModel):
@@ -27,9 +39,18 @@ class Token(BaseModel):
         address: ChecksumAddress,
         network: Network = Network.Ethereum,
     ):
+        """
+        Look up a token by address.  Token metadata never changes, so tokens are
+        kept in the SDK's cache for good.
+        """
         client = _force_get_global_client()
-        response = await client.token.lookup(address, network.value)
-        return cls(**response.json())
+        key = f"token:{network.value}:{address.lower()}"
+        token = client.cache.get(key)
+        if token is None:
+            response = await client.token.lookup(address, network.value)
+            token = cls(**response.json())
+            client.cache.set(key, token)
+        return token
 
     async def allowance(
         self,
@@ -53,6 +74,8 @@ class Token(BaseModel):
             self.network.value,
             block_num=block_num,
         )
+        if block_num == "latest":
+            client.allowance_cache.set(self._allowance_key(owner, spender), allowance)
         return TokenAmount(
             amount=allowance,
             decimals=self.decimals,
@@ -65,46 +88,140 @@ class Token(BaseModel):
         spender: Union[Wallet, ChecksumAddress],
         amount: int = int(2**256 - 1),
         priority_fee: Optional[int] = None,
+        timeout: Optional[float] = None,
     ) -> HexStr:
         """
         Approve a spender to use a token.
+
+        The approval is only submitted, so the SDK's allowance cache assumes it
+        succeeds for `APPROVAL_TTL` seconds, long enough to spare lookups while
+        it is mined.  A reverted approval is then found by the next lookup.
+
         :param from_wallet: :class:`empyrealSDK.Wallet` making the approval
         :param spender: A checksummed ethereum address
+        :param timeout: seconds allowed for the approval, including waiting on
+            other transactions from the same wallet.  Raises
+            :class:`empyrealSDK.exc.DeadlineExceeded` when passed
         :return: HexStr
 
         """
         client = _force_get_global_client()
-        if isinstance(spender, Wallet):
-            return await client.token.approve(
-                self.id,
-                from_wallet.id,
-                spender.address,
-                chain_id=self.network.chain_id,
-                amount=amount,
+        spender_address = spender.address if isinstance(spender, Wallet) else spender
+        with deadline(timeout):
+            async with acquire(wallet_lock(from_wallet.id)):
+                tx_hash = await client.token.approve(
+                    self.id,
+                    from_wallet.id,
+                    spender_address,
+                    chain_id=self.network.chain_id,
+                    amount=amount,
+                    priority_fee=priority_fee,
+                )
+        client.allowance_cache.set(
+            self._allowance_key(from_wallet.address, spender_address),
+            amount,
+            ttl=APPROVAL_TTL,
+        )
+        return tx_hash
+
+    def _allowance_key(self, owner: str, spender: str):
+        return (self.network.chain_id, self.address, owner.lower(), spender.lower())
+
+    async def ensure_allowance(
+        self,
+        wallet: Wallet,
+        spender: Union[Wallet, ChecksumAddress],
+        amount: Union["TokenAmount", int],
+        approve_amount: int = int(2**256 - 1),
+        priority_fee: Optional[int] = None,
+        refresh: bool = False,
+    ) -> Optional[HexStr]:
+        """
+        Approve a spender only if its current allowance is below ``amount``.
+
+        Allowances are read through the SDK's allowance cache, and the cache
+        is updated optimistically after approving, see :meth:`approve`, so
+        repeated checks cost no round trips.
+        Cached allowances expire after a few minutes, since spending a finite
+        approval lowers it onchain; pass ``refresh=True`` to force a lookup.
+
+        :param wallet: :class:`empyrealSDK.Wallet` owning the tokens
+        :param spender: A checksummed ethereum address, e.g. a router
+        :param amount: the allowance required
+        :param approve_amount: allowance to approve if insufficient
+        :return: the approval's transaction hash, or `None` if no approval
+            was needed
+        """
+        client = _force_get_global_client()
+        owner_address = checksum_address(wallet.address)
+        spender_address = checksum_address(
+            spender.address if isinstance(spender, Wallet) else spender
+        )
+        required = amount.amount if isinstance(amount, TokenAmount) else amount
+        key = self._allowance_key(owner_address, spender_address)
+
+        # concurrent checks of the same allowance would otherwise double approve
+        async with keyed_lock(("allowance", key)):
+            allowance = None if refresh else client.allowance_cache.get(key)
+            if allowance is None:
+                allowance = (
+                    await self.allowance(owner_address, spender_address)
+                ).amount
+            if allowance >= required:
+                return None
+            return await self.approve(
+                wallet,
+                spender_address,
+                amount=max(approve_amount, required),
                 priority_fee=priority_fee,
             )
-        return await client.token.approve(
-            self.id,
-            from_wallet.id,
-            spender,
-            chain_id=self.network.chain_id,
-            amount=amount,
-            priority_fee=priority_fee,
+
+    @staticmethod
+    async def ensure_allowances(
+        wallet: Wallet,
+        approvals: Iterable[
+            tuple["Token", Union[Wallet, ChecksumAddress], Union["TokenAmount", int]]
+        ],
+        priority_fee: Optional[int] = None,
+    ) -> list[Optional[HexStr]]:
+        """
+        :meth:`ensure_allowance` for many ``(token, spender, amount)`` at once.
+
+        Allowances are checked concurrently, while any approvals needed are
+        sent one at a time from ``wallet``.
+
+        :return: a transaction hash or `None` for each approval, in order
+        """
+        return await asyncio.gather(
+            *(
+                token.ensure_allowance(
+                    wallet,
+                    spender,
+                    amount,
+                    priority_fee=priority_fee,
+                )
+                for token, spender, amount in approvals
+            )
         )
 
     async def transfer(
         self,
         from_wallet: Wallet,
         recipient: Union[Wallet, ChecksumAddress],
-        amount: "TokenAmount",
+        amount: Union["TokenAmount", int],
         gas_price: Optional[int] = None,
+        timeout: Optional[float] = None,
     ) -> HexStr:
         """
-        Transfer a token amount to a target address
+        Transfer a token amount to a target address.
+        Transfers from the same wallet are submitted one at a time to avoid
+        nonce clashes.
 
         :param wallet: :class:`empyrealSDK.Wallet`
         :param recipient: The recipient of the transfer
         :param amount: Amount of tokens to transfer
+        :param timeout: seconds allowed for the transfer, including waiting on
+            other transfers from the same wallet
         :return: HexStr of the transaction
         """
         client = _force_get_global_client()
@@ -112,13 +229,89 @@ class Token(BaseModel):
             recipient_address = recipient.address
         else:
             recipient_address = recipient
-        return await client.token.transfer(
-            self.id,
-            from_wallet.id,
-            recipient_address,
-            amount,
-            gas_price=gas_price,
+        raw_amount = amount.amount if isinstance(amount, TokenAmount) else amount
+        with deadline(timeout):
+            async with acquire(wallet_lock(from_wallet.id)):
+                return await client.token.transfer(
+                    self.id,
+                    from_wallet.id,
+                    recipient_address,
+                    raw_amount,
+                    gas_price=gas_price,
+                )
+
+    async def transfer_many(
+        self,
+        from_wallet: Union[Wallet, Sequence[Wallet]],
+        transfers: Iterable[
+            tuple[Union[Wallet, ChecksumAddress], Union["TokenAmount", int]]
+        ],
+        gas_price: Optional[int] = None,
+    ) -> BulkTransferReport:
+        """
+        Transfer to many recipients, e.g. for an airdrop or payout.
+
+        Transfers from a single wallet are submitted back to back without
+        waiting for them to be mined, while separate wallets submit
+        concurrently.  If multiple wallets are provided, transfers are
+        distributed between them round robin.  A failed transfer does not
+        stop the rest, its error is recorded in the report instead.
+
+        ```python
+        report = await token.transfer_many(
+            [hot_wallet_1, hot_wallet_2],
+            [(address, amount) for address, amount in payouts],
         )
+        print(report.throughput, report.errors)
+        ```
+
+        :param from_wallet: one or more :class:`empyrealSDK.Wallet` to send from
+        :param transfers: ``(recipient, amount)`` pairs
+        :return: :class:`.BulkTransferReport` with a result per transfer
+        """
+        wallets = [from_wallet] if isinstance(from_wallet, Wallet) else from_wallet
+        if not wallets:
+            raise ValueError("Must provide at least one wallet to transfer from")
+
+        results: list[TransferResult] = []
+        queues: list[list[tuple[int, Union[Wallet, ChecksumAddress]]]] = [
+            [] for _ in wallets
+        ]
+        for i, (recipient, amount) in enumerate(transfers):
+            wallet = wallets[i % len(wallets)]
+            results.append(
+                TransferResult(
+                    wallet_id=wallet.id,
+                    recipient=(
+                        recipient.address
+                        if isinstance(recipient, Wallet)
+                        else recipient
+                    ),
+                    amount=(
+                        amount.amount if isinstance(amount, TokenAmount) else amount
+                    ),
+                )
+            )
+            queues[i % len(wallets)].append((i, recipient))
+
+        async def drain(wallet: Wallet, queue):
+            for i, recipient in queue:
+                result = results[i]
+                try:
+                    result.tx_hash = await self.transfer(
+                        wallet,
+                        recipient,
+                        result.amount,
+                        gas_price=gas_price,
+                    )
+                except Exception as e:
+                    result.error = f"{type(e).__name__}: {e}"
+
+        start = time.monotonic()
+        await asyncio.gather(
+            *(drain(wallet, queue) for wallet, queue in zip(wallets, queues))
+        )
+        return BulkTransferReport(results=results, elapsed=time.monotonic() - start)
 
     @singledispatchmethod
     async def balance_of(
@@ -146,13 +339,24 @@ class Token(BaseModel):
 
     async def security(
         self,
-    ):
+        refresh: bool = False,
+    ) -> Security:
+        """
+        The token's security report, cached for `SECURITY_TTL` seconds
+
+        :param refresh: skip the cache and request a new report
+        """
         client = _force_get_global_client()
-        security = await client.token.security(
-            self.id,
-            self.network.value,
-        )
-        return Security(**security)
+        key = f"security:{self.network.value}:{self.address.lower()}"
+        report = None if refresh else client.cache.get(key)
+        if report is None:
+            security = await client.token.security(
+                self.id,
+                self.network.value,
+            )
+            report = Security(**security)
+            client.cache.set(key, report, ttl=SECURITY_TTL)
+        return report
 
     @balance_of.register(str)
     async def _(
@@ -1,6 +1,73 @@
+from typing import Optional
+from uuid import UUID
+
 from eth_typing import HexStr
 from pydantic import BaseModel
 
 
 class Transaction(BaseModel):
     hash: HexStr
+
+
+class TransferResult(BaseModel):
+    """The outcome of a single transfer in a bulk transfer"""
+
+    wallet_id: UUID
+    recipient: str
+    amount: int
+    tx_hash: Optional[HexStr] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class BulkTransferReport(BaseModel):
+    """Per-item results of a bulk transfer, in the order they were requested"""
+
+    results: list[TransferResult]
+    elapsed: float
+    """Seconds taken to submit every transfer"""
+
+    @property
+    def tx_hashes(self):
+        return [r.tx_hash for r in self.results if r.ok]
+
+    @property
+    def errors(self):
+        return [r for r in self.results if not r.ok]
+
+    @property
+    def throughput(self) -> float:
+        """Transfers submitted per second"""
+        return len(self.results) / self.elapsed if self.elapsed else 0.0
+
+    def __repr__(self):
+        return (
+            f"<BulkTransferReport: {len(self.results) - len(self.errors)} sent, "
+            f"{len(self.errors)} failed, {self.throughput:.1f}/s>"
+        )
+
+    __str__ = __repr__
+
+
+class SwapResult(BaseModel):
+    """The outcome of one wallet's swap in a fan-out swap"""
+
+    wallet_id: UUID
+    priority_fee: int
+    tx_hash: Optional[HexStr] = None
+    error: Optional[str] = None
+    started: float
+    """``time.monotonic()`` when the swap was submitted"""
+    completed: float
+    """``time.monotonic()`` when the API responded"""
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def elapsed(self) -> float:
+        return self.completed - self.started
@@ -1,13 +1,23 @@
 from enum import IntEnum, auto
-from typing import Any, Optional, Union
+from typing import Any, NamedTuple, Optional, Union
 from uuid import UUID
 
 from eth_typing import HexStr
 from pydantic import BaseModel, Field
 
+from ..exc import NotFoundError
 from ..utils.client import _force_get_global_client
+from ..utils.concurrency import keyed_lock
 from .wallet import Wallet
 
+# seconds an unknown telegram id is remembered, so a burst of messages from
+# someone without a user costs one request, but a new user is found soon after
+NOT_FOUND_TTL = 10
+
+
+class _NotFound(NamedTuple):
+    detail: str
+
 
 class UserType(IntEnum):
     telegram = auto()
@@ -30,21 +40,65 @@ class User(BaseModel):
     metadata: dict[Any, Any] = Field(default={})
 
     @classmethod
-    async def load(cls, telegram_id: Union[str, int]):
+    async def load(cls, telegram_id: Union[str, int], refresh: bool = False):
+        """
+        Load the user with a telegram id.  Users are read through the SDK's
+        user cache, so repeated messages from the same user don't cost a
+        request, and an unknown id is remembered for `NOT_FOUND_TTL` seconds.
+
+        ```python
+        async def on_message(message):
+            user = await User.load(message.from_user.id)
+        ```
+
+        :param refresh: skip the cache and request the user again
+        :raises NotFoundError: if no user has the telegram id
+        """
+        client = _force_get_global_client()
+        key = str(telegram_id)
+        user = None if refresh else client.user_cache.get(key)
+        if user is None:
+            # concurrent messages from a new user share a single request
+            async with keyed_lock(("user", key)):
+                user = None if refresh else client.user_cache.get(key)
+                if user is None:
+                    try:
+                        response = await client.user.get_from_telegram(key)
+                    except NotFoundError as e:
+                        user = _NotFound(str(e))
+                        client.user_cache.set(key, user, ttl=NOT_FOUND_TTL)
+                    else:
+                        user = cls(**response)
+                        client.user_cache.set(key, user)
+        if isinstance(user, _NotFound):
+            raise NotFoundError(user.detail)
+        return user
+
+    @classmethod
+    def invalidate(cls, telegram_id: Optional[Union[str, int]] = None):
+        """
+        Drop a telegram id from the SDK's user cache, e.g. after the user is
+        changed elsewhere, or every cached user if no id is given
+        """
         client = _force_get_global_client()
-        response = await client.user.get_from_telegram(telegram_id)
-        return cls(**response)
+        if telegram_id is None:
+            client.user_cache.clear()
+        else:
+            client.user_cache.delete(str(telegram_id))
 
     @classmethod
     async def create(cls, name: str):
         client = _force_get_global_client()
         response = await client.user.create(name)
-        return cls(**response)
+        user = cls(**response)
+        if user.telegram_id is not None:
+            client.user_cache.set(user.telegram_id, user)
+        return user
 
     async def get_app_wallets(self):
         client = _force_get_global_client()
-        response = await client.wallet.get_user_wallets(self.id)
-        return [Wallet(**row) for row in response.json()]
+        rows = await client.wallet.get_user_wallets(self.id)
+        return [Wallet(**row) for row in rows]
 
     async def make_wallet(self, name: str, private_key: Optional[HexStr] = None):
         client = _force_get_global_client()
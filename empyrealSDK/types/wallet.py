@@ -50,10 +50,19 @@ class Wallet(BaseModel):
     @classmethod
     async def get_all(
         cls,
+        cached: bool = False,
     ):
+        """
+        The app's wallets.  With ``cached``, the wallets last loaded or restored
+        with :meth:`empyrealSDK.EmpyrealSDK.from_snapshot` are returned without
+        a request, if there are any.
+        """
         client = _force_get_global_client()
+        if cached and client.app_wallets is not None:
+            return list(client.app_wallets)
         wallets = await client.wallet.get_app_wallets()
-        return [cls(**w) for w in wallets]
+        client.app_wallets = [cls(**w) for w in wallets]
+        return client.app_wallets
 
     @classmethod
     async def create(
@@ -0,0 +1,203 @@
+import asyncio
+from collections.abc import AsyncIterator
+import heapq
+from itertools import count
+import time
+from typing import Any, Literal, Union
+
+from eth_typing import ChecksumAddress
+from pydantic import BaseModel
+
+from .dex import DexFactory, DexPair, Liquidity, UniswapV2
+from .token import Token
+from ..utils.ratelimit import TokenBucket
+
+
+class WatchEvent(BaseModel):
+    """Emitted by :class:`PriceWatcher` when a watched value changes"""
+
+    key: str
+    """The pair address for liquidity, or token address for prices"""
+    kind: Literal["liquidity", "price"]
+    value: Any
+    """:class:`empyrealSDK.types.Liquidity` or the token's ETH price"""
+    previous: Any = None
+    timestamp: float
+    """``time.time()`` when the change was observed"""
+
+
+class _Watch:
+    __slots__ = ("key", "kind", "target", "interval", "value", "fetching", "generation")
+
+    def __init__(self, key: str, kind: str, target: Any, interval: float):
+        self.key = key
+        self.kind = kind
+        self.target = target
+        self.interval = interval
+        self.value: Any = None
+        self.fetching = False
+        # matches only the latest schedule entry pushed for this watch
+        self.generation = -1
+
+
+class PriceWatcher:
+    """
+    Watches the liquidity of many pairs and prices of many tokens from one
+    scheduler, emitting only changes.
+
+    Each watch is polled on its own interval.  It halves whenever the value
+    changes, so hot pairs refresh quickly, and grows by ``backoff`` while the
+    value stays the same, so idle pairs cost little.  Every poll is drawn from
+    a global budget of ``requests_per_second``.
+
+    ```python
+    watcher = PriceWatcher(requests_per_second=20)
+    for pair in pairs:
+        watcher.watch_liquidity(pair)
+    async for event in watcher.events():
+        print(event.key, event.previous, "->", event.value)
+    ```
+
+    :param min_interval: fastest a single watch is polled, in seconds
+    :param max_interval: slowest a single watch is polled, in seconds
+    :param backoff: interval multiplier after an unchanged poll
+    :param requests_per_second: global request budget
+    :param max_concurrency: most polls in flight at once
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 1.0,
+        max_interval: float = 60.0,
+        backoff: float = 1.5,
+        requests_per_second: float = 10.0,
+        max_concurrency: int = 16,
+        factory: DexFactory = UniswapV2,
+    ):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.factory = factory
+        self._budget = TokenBucket(requests_per_second)
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._watches: dict[tuple[str, str], _Watch] = {}
+        # (due, generation, watch key)
+        self._schedule: list[tuple[float, int, tuple[str, str]]] = []
+        self._seq = count()
+        self._wakeup = asyncio.Event()
+        self._events: asyncio.Queue[WatchEvent] = asyncio.Queue()
+        self._tasks: set[asyncio.Task] = set()
+
+    def _add(self, key: str, kind: str, target: Any):
+        if (kind, key) in self._watches:
+            return
+        watch = _Watch(key, kind, target, self.min_interval)
+        self._watches[(kind, key)] = watch
+        self._push(watch, time.monotonic())
+
+    def _push(self, watch: _Watch, due: float):
+        # entries left behind by an unwatched or rescheduled watch no longer
+        # match its generation, and are skipped when they come due
+        watch.generation = next(self._seq)
+        heapq.heappush(self._schedule, (due, watch.generation, (watch.kind, watch.key)))
+        self._wakeup.set()
+
+    def watch_liquidity(self, pair: DexPair):
+        """Emit an event whenever a pair's reserves change"""
+        self._add(pair.address, "liquidity", pair)
+
+    def watch_price(self, token: Union[Token, ChecksumAddress]):
+        """Emit an event whenever a token's best route ETH price changes"""
+        address = token.address if isinstance(token, Token) else token
+        self._add(address, "price", address)
+
+    def unwatch(self, key: str):
+        """Stop watching a pair or token address"""
+        for kind in ("liquidity", "price"):
+            self._watches.pop((kind, key), None)
+
+    def __len__(self):
+        return len(self._watches)
+
+    async def _fetch(self, watch: _Watch) -> Any:
+        if watch.kind == "liquidity":
+            liquidity: Liquidity = await watch.target.get_liquidity()
+            return liquidity
+        routes = await self.factory.get_price(watch.target)
+        return routes[0].eth_price.amount / 10 ** routes[0].eth_price.decimals
+
+    @staticmethod
+    def _same(previous: Any, value: Any) -> bool:
+        if isinstance(value, Liquidity) and isinstance(previous, Liquidity):
+            return (previous.token0_balance, previous.token1_balance) == (
+                value.token0_balance,
+                value.token1_balance,
+            )
+        return previous == value
+
+    async def _poll(self, watch: _Watch):
+        try:
+            value = await self._fetch(watch)
+            failed = False
+        except Exception:
+            # treat errors as unchanged, so a failing watch backs off
+            value, failed = watch.value, True
+        finally:
+            self._slots.release()
+            watch.fetching = False
+
+        if failed or (watch.value is not None and self._same(watch.value, value)):
+            watch.interval = min(self.max_interval, watch.interval * self.backoff)
+        else:
+            watch.interval = max(self.min_interval, watch.interval / 2)
+            self._events.put_nowait(
+                WatchEvent(
+                    key=watch.key,
+                    kind=watch.kind,  # type: ignore
+                    value=value,
+                    previous=watch.value,
+                    timestamp=time.time(),
+                )
+            )
+            watch.value = value
+
+        if self._watches.get((watch.kind, watch.key)) is watch:
+            self._push(watch, time.monotonic() + watch.interval)
+
+    async def run(self):
+        """Run the scheduler.  Usually started by iterating :meth:`events`"""
+        while True:
+            self._wakeup.clear()
+            if not self._schedule:
+                await self._wakeup.wait()
+                continue
+            due = self._schedule[0][0]
+            delay = due - time.monotonic()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            _, generation, key = heapq.heappop(self._schedule)
+            watch = self._watches.get(key)
+            if watch is None or watch.generation != generation or watch.fetching:
+                continue
+            await self._budget.acquire()
+            await self._slots.acquire()
+            watch.fetching = True
+            task = asyncio.ensure_future(self._poll(watch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def events(self) -> AsyncIterator[WatchEvent]:
+        """Run the scheduler and yield every change as it is observed"""
+        runner = asyncio.ensure_future(self.run())
+        try:
+            while True:
+                yield await self._events.get()
+        finally:
+            runner.cancel()
+            for task in list(self._tasks):
+                task.cancel()
@@ -0,0 +1,34 @@
+from typing import Union
+
+from eth_typing import ChecksumAddress
+from eth_utils.address import to_checksum_address
+
+from .cache import LRUCache
+
+_checksums = LRUCache(maxsize=65_536)
+
+
+def checksum_address(address: Union[str, bytes]) -> ChecksumAddress:
+    """
+    ``eth_utils.to_checksum_address``, memoized.
+
+    Checksumming hashes the address with keccak, which adds up for scanners
+    looking up the same pairs and tokens over and over.  Results are kept in a
+    bounded LRU cache under both the input and the checksummed form, so
+    addresses which are already checksummed are returned without hashing.
+
+    :param address: a hex address in any case, or the raw 20 bytes
+    :raises ValueError: if the address is not a valid 20 byte address
+    """
+    if isinstance(address, (bytes, bytearray)):
+        if len(address) != 20:
+            raise ValueError(f"Expected a 20 byte address, got {len(address)} bytes")
+        address = "0x" + address.hex()
+
+    cached = _checksums.get(address)
+    if cached is not None:
+        return cached
+    checksummed = to_checksum_address(address)
+    _checksums.set(address, checksummed)
+    _checksums.set(checksummed, checksummed)
+    return checksummed
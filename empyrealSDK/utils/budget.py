@@ -0,0 +1,153 @@
+from collections import deque
+from datetime import datetime, timedelta, timezone
+import time
+from typing import Optional
+
+from empyrealSDK.exc import QuotaExhaustedError
+
+from .client import _force_get_global_client
+from .priority import Priority
+from .ratelimit import TokenBucket
+
+
+def _month_bounds(now: datetime) -> tuple[datetime, datetime]:
+    start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    if start.month == 12:
+        return start, start.replace(year=start.year + 1, month=1)
+    return start, start.replace(month=start.month + 1)
+
+
+class RequestBudget:
+    """
+    Tracks the app's request quota over its billing window.
+
+    The count starts from the server's ``request_count`` and every request sent
+    afterwards is counted locally.  Once ``throttle_at`` of the quota is used,
+    requests at ``throttle`` priority or below are paced to the rate which
+    spreads the remaining quota over the rest of the window, and once only
+    ``reserve`` requests remain they raise
+    :class:`empyrealSDK.exc.QuotaExhaustedError`, leaving the reserve for
+    trades.
+
+    ```python
+    sdk.budget = await RequestBudget.from_app(quota=1_000_000)
+    print(sdk.budget.remaining, sdk.budget.projected_exhaustion)
+    ```
+
+    :param quota: requests allowed per billing window
+    :param used: requests already used in the current window
+    :param window_start: start of the billing window, the current calendar
+        month (UTC) by default
+    :param window_end: end of the billing window
+    :param throttle_at: fraction of the quota after which low priority requests
+        are paced, `None` to never throttle
+    :param throttle: highest priority class which is throttled
+    :param reserve: requests held back for higher priority classes
+    :param rate_window: seconds of history used to estimate the request rate
+    """
+
+    def __init__(
+        self,
+        quota: int,
+        used: int = 0,
+        window_start: Optional[datetime] = None,
+        window_end: Optional[datetime] = None,
+        throttle_at: Optional[float] = 0.8,
+        throttle: Priority = Priority.low,
+        reserve: int = 0,
+        rate_window: float = 300.0,
+        tier: Optional[str] = None,
+    ):
+        month_start, month_end = _month_bounds(datetime.now(timezone.utc))
+        self.quota = quota
+        self.used = used
+        self.window_start = window_start or month_start
+        self.window_end = window_end or month_end
+        self.throttle_at = throttle_at
+        self.throttle = throttle
+        self.reserve = reserve
+        self.rate_window = rate_window
+        self.tier = tier
+        self._history: deque[list[int]] = deque()
+        self._pacer: Optional[TokenBucket] = None
+
+    @classmethod
+    async def from_app(cls, quota: int, **kwargs) -> "RequestBudget":
+        """Start a budget from the current app's ``request_count`` and ``tier``"""
+        budget = cls(quota, **kwargs)
+        await budget.sync()
+        return budget
+
+    async def sync(self):
+        """Reset the local count to the server's ``request_count``"""
+        client = _force_get_global_client()
+        app = await client.app.info()
+        self.used = app.request_count
+        self.tier = app.tier
+
+    @property
+    def remaining(self) -> int:
+        return max(0, self.quota - self.used)
+
+    @property
+    def seconds_left(self) -> float:
+        now = datetime.now(timezone.utc)
+        return max(0.0, (self.window_end - now).total_seconds())
+
+    @property
+    def target_rate(self) -> float:
+        """Requests per second which would use the quota exactly by the window end"""
+        return self.remaining / max(self.seconds_left, 1.0)
+
+    @property
+    def rate(self) -> float:
+        """Requests per second over the last ``rate_window`` seconds"""
+        self._prune(int(time.monotonic()))
+        return sum(n for _, n in self._history) / self.rate_window
+
+    @property
+    def projected_exhaustion(self) -> Optional[datetime]:
+        """When the quota runs out at the current rate, `None` if it lasts the window"""
+        rate = self.rate
+        if rate == 0:
+            return None
+        exhausted = datetime.now(timezone.utc) + timedelta(
+            seconds=self.remaining / rate
+        )
+        return exhausted if exhausted < self.window_end else None
+
+    def _prune(self, second: int):
+        while self._history and self._history[0][0] <= second - self.rate_window:
+            self._history.popleft()
+
+    def record(self, count: int = 1):
+        """Count requests against the budget, e.g. ones sent outside the SDK"""
+        second = int(time.monotonic())
+        if self._history and self._history[-1][0] == second:
+            self._history[-1][1] += count
+        else:
+            self._history.append([second, count])
+            self._prune(second)
+        self.used += count
+
+    def _throttled(self, level: Priority) -> bool:
+        return (
+            self.throttle_at is not None
+            and level >= self.throttle
+            and self.used >= self.throttle_at * self.quota
+        )
+
+    async def acquire(self, level: Priority = Priority.normal):
+        """Wait until a request at ``level`` fits the budget, then count it"""
+        if self._throttled(level):
+            if self.remaining <= self.reserve:
+                raise QuotaExhaustedError(
+                    f"{self.used} of {self.quota} requests used, "
+                    f"{self.reserve} reserved for higher priority requests"
+                )
+            rate = self.target_rate
+            if self._pacer is None:
+                self._pacer = TokenBucket(rate, capacity=1)
+            self._pacer.rate = rate
+            await self._pacer.acquire()
+        self.record()
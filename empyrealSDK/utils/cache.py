@@ -0,0 +1,278 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Hashable, Iterator, Optional, Union
+
+_MISSING = object()
+
+
+def _pickle(value: Any) -> bytes:
+    return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+
+class CacheBackend(ABC):
+    """
+    Storage behind the SDK's shared caches of tokens, pairs, taxes and security
+    reports, see :attr:`empyrealSDK.EmpyrealSDK.cache`.
+
+    Keys are strings such as ``"token:1:0x6982..."`` and values are SDK models
+    or plain JSON, so a backend shared between processes has to serialize them,
+    e.g. with pickle.  A custom backend, e.g. over Redis, implements `get`,
+    `set`, `delete` and `clear`:
+
+    ```python
+    class RedisCache(CacheBackend):
+        def __init__(self, redis: redis.Redis):
+            self.redis = redis
+
+        def get(self, key, default=None):
+            value = self.redis.get(key)
+            return default if value is None else pickle.loads(value)
+
+        def set(self, key, value, ttl=None):
+            self.redis.set(key, pickle.dumps(value), ex=ttl and math.ceil(ttl))
+
+        def delete(self, key):
+            self.redis.delete(key)
+
+        def clear(self):
+            self.redis.flushdb()
+
+    EmpyrealSDK(api_key, cache=RedisCache(redis.Redis()))
+    ```
+
+    The methods are synchronous and called from the event loop, so a backend
+    should answer in well under a millisecond.
+    """
+
+    @abstractmethod
+    def get(self, key: str, default: Any = None) -> Any:
+        """The value stored under ``key``, or ``default`` if missing or expired"""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """Store ``value``, expiring after ``ttl`` seconds or the backend default"""
+
+    @abstractmethod
+    def delete(self, key: str):
+        """Remove ``key`` if present"""
+
+    @abstractmethod
+    def clear(self):
+        """Remove every entry"""
+
+    def items(self, prefix: str = "") -> Iterator[tuple[str, Any]]:
+        """
+        Every unexpired entry whose key starts with ``prefix``, e.g. for
+        :meth:`empyrealSDK.EmpyrealSDK.save_snapshot`.  Backends which can't
+        list their entries yield nothing.
+        """
+        return iter(())
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+
+class LRUCache(CacheBackend):
+    """
+    A bounded, least recently used cache with an optional time to live.
+
+    Being in process, keys can be any hashable rather than only strings, e.g.
+    the ``(chain, pair, block)`` tuples of the SDK's liquidity cache.
+
+    :param maxsize: entries kept before the least recently used is evicted
+    :param ttl: default seconds an entry stays valid, ``None`` to never expire
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[Optional[float], Any]] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry: Optional[tuple[Optional[float], Any]] = self._data.get(key)
+        if entry is None:
+            return default
+        expires, value = entry
+        if expires is not None and expires < time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        ttl = self.ttl if ttl is None else ttl
+        expires = None if ttl is None else time.monotonic() + ttl
+        self._data[key] = (expires, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Hashable):
+        self._data.pop(key, None)
+
+    def clear(self):
+        self._data.clear()
+
+    def items(self, prefix: str = "") -> Iterator[tuple[str, Any]]:
+        now = time.monotonic()
+        for key, (expires, value) in list(self._data.items()):
+            if (
+                isinstance(key, str)
+                and key.startswith(prefix)
+                and (expires is None or expires >= now)
+            ):
+                yield key, value
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteCache(CacheBackend):
+    """
+    A cache in a local SQLite file, shared by every process on the host which
+    opens the same ``path``.  Values are pickled, so only share the file with
+    processes you trust.
+
+    Once more than ``maxsize`` entries are stored the oldest written are
+    evicted, which spares reads from writing an access time.  Eviction runs
+    every ``maxsize // 100`` writes, so the table can briefly run over.
+
+    ```python
+    EmpyrealSDK(api_key, cache=SQLiteCache("/var/cache/empyreal.sqlite"))
+    ```
+
+    :param path: the database file, created if missing
+    :param maxsize: entries kept before the oldest are evicted
+    :param ttl: default seconds an entry stays valid, ``None`` to never expire
+    :param dumps: serializes values, :func:`pickle.dumps` by default
+    :param loads: deserializes values, :func:`pickle.loads` by default
+    :param timeout: seconds to wait for another process's write lock
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        maxsize: int = 100_000,
+        ttl: Optional[float] = None,
+        dumps: Callable[[Any], bytes] = _pickle,
+        loads: Callable[[bytes], Any] = pickle.loads,
+        timeout: float = 5.0,
+    ):
+        self.path = path
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.dumps = dumps
+        self.loads = loads
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._pid = -1
+        self._connection()
+
+    def _connection(self) -> sqlite3.Connection:
+        # a connection must not cross a fork, so each worker opens its own
+        if self._pid != os.getpid():
+            self._db = sqlite3.connect(
+                self.path,
+                timeout=self.timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                "expires REAL, stored REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS cache_stored ON cache (stored)"
+            )
+            self._pid = os.getpid()
+        return self._db
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            row = (
+                self._connection()
+                .execute("SELECT value, expires FROM cache WHERE key = ?", (key,))
+                .fetchone()
+            )
+        if row is None:
+            return default
+        value, expires = row
+        # wall clock rather than monotonic, as entries are shared between processes
+        now = time.time()
+        if expires is not None and expires < now:
+            with self._lock:
+                self._connection().execute(
+                    "DELETE FROM cache WHERE key = ? AND expires < ?", (key, now)
+                )
+            return default
+        return self.loads(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        expires = None if ttl is None else now + ttl
+        data = self.dumps(value)
+        with self._lock:
+            self._connection().execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires, stored) "
+                "VALUES (?, ?, ?, ?)",
+                (key, data, expires, now),
+            )
+            self._writes += 1
+            if self._writes >= max(1, self.maxsize // 100):
+                self._writes = 0
+                self._evict()
+
+    def _evict(self):
+        (count,) = self._connection().execute("SELECT COUNT(*) FROM cache").fetchone()
+        if count > self.maxsize:
+            self._db.execute(
+                "DELETE FROM cache WHERE key IN "
+                "(SELECT key FROM cache ORDER BY stored LIMIT ?)",
+                (count - self.maxsize,),
+            )
+        self._db.execute("DELETE FROM cache WHERE expires < ?", (time.time(),))
+
+    def delete(self, key: str):
+        with self._lock:
+            self._connection().execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def clear(self):
+        with self._lock:
+            self._connection().execute("DELETE FROM cache")
+
+    def items(self, prefix: str = "") -> Iterator[tuple[str, Any]]:
+        with self._lock:
+            rows = (
+                self._connection()
+                .execute(
+                    "SELECT key, value FROM cache WHERE substr(key, 1, ?) = ? "
+                    "AND (expires IS NULL OR expires >= ?)",
+                    (len(prefix), prefix, time.time()),
+                )
+                .fetchall()
+            )
+        for key, value in rows:
+            yield key, self.loads(value)
+
+    def close(self):
+        self._db.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = (
+                self._connection().execute("SELECT COUNT(*) FROM cache").fetchone()
+            )
+        return count
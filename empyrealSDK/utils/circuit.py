@@ -0,0 +1,108 @@
+import asyncio
+from collections import deque
+from enum import Enum
+import time
+from typing import Awaitable, Callable
+
+import httpx
+
+from empyrealSDK.exc import CircuitOpenError
+
+
+class CircuitState(Enum):
+    closed = "closed"
+    open = "open"
+    half_open = "half_open"
+
+
+class _Circuit:
+    __slots__ = ("state", "outcomes", "opened_at", "probing")
+
+    def __init__(self, window: int):
+        self.state = CircuitState.closed
+        self.outcomes: deque[bool] = deque(maxlen=window)
+        self.opened_at = 0.0
+        self.probing = False
+
+
+class CircuitBreaker:
+    """
+    Fails fast on endpoints whose error rate spikes.
+
+    Each endpoint keeps the outcome of its last ``window`` requests.  Once at
+    least ``min_requests`` have been made and the share of failures (transport
+    errors, timeouts and 5xx responses) reaches ``failure_rate``, the circuit
+    opens and calls raise :class:`empyrealSDK.exc.CircuitOpenError` without a
+    request.  After ``cooldown`` seconds one probe request is let through, and
+    its success closes the circuit again.
+
+    ```python
+    sdk = EmpyrealSDK(api_key, circuit_breaker=CircuitBreaker(cooldown=5))
+    ```
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        window: int = 20,
+        min_requests: int = 10,
+        cooldown: float = 10.0,
+    ):
+        self.failure_rate = failure_rate
+        self.window = window
+        self.min_requests = min_requests
+        self.cooldown = cooldown
+        self._circuits: dict[str, _Circuit] = {}
+
+    def state(self, path: str) -> CircuitState:
+        circuit = self._circuits.get(path)
+        return circuit.state if circuit else CircuitState.closed
+
+    def _acquire(self, path: str) -> _Circuit:
+        circuit = self._circuits.get(path)
+        if circuit is None:
+            circuit = self._circuits[path] = _Circuit(self.window)
+        if circuit.state == CircuitState.open:
+            if time.monotonic() - circuit.opened_at < self.cooldown:
+                raise CircuitOpenError(f"Circuit open for {path}")
+            circuit.state = CircuitState.half_open
+        if circuit.state == CircuitState.half_open:
+            if circuit.probing:
+                raise CircuitOpenError(f"Circuit half open for {path}, probing")
+            circuit.probing = True
+        return circuit
+
+    def _record(self, circuit: _Circuit, success: bool):
+        if circuit.state == CircuitState.half_open:
+            circuit.probing = False
+            if success:
+                circuit.state = CircuitState.closed
+                circuit.outcomes.clear()
+            else:
+                circuit.state = CircuitState.open
+                circuit.opened_at = time.monotonic()
+            return
+
+        circuit.outcomes.append(success)
+        if len(circuit.outcomes) >= self.min_requests:
+            failures = circuit.outcomes.count(False)
+            if failures / len(circuit.outcomes) >= self.failure_rate:
+                circuit.state = CircuitState.open
+                circuit.opened_at = time.monotonic()
+
+    async def call(
+        self, path: str, send: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        circuit = self._acquire(path)
+        try:
+            response = await send()
+        except asyncio.CancelledError:
+            # a cancelled call says nothing about the endpoint's health
+            if circuit.state == CircuitState.half_open:
+                circuit.probing = False
+            raise
+        except Exception:
+            self._record(circuit, False)
+            raise
+        self._record(circuit, response.status_code < 500)
+        return response
@@ -0,0 +1,78 @@
+import asyncio
+import inspect
+from typing import Awaitable, Hashable, Iterable, Literal, TypeVar, Union, overload
+from uuid import UUID
+import weakref
+
+T = TypeVar("T")
+
+_locks: "weakref.WeakValueDictionary[Hashable, asyncio.Lock]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def keyed_lock(key: Hashable) -> asyncio.Lock:
+    """A lock shared by every caller using the same ``key``"""
+    lock = _locks.get(key)
+    if lock is None:
+        lock = asyncio.Lock()
+        _locks[key] = lock
+    return lock
+
+
+def wallet_lock(wallet_id: UUID) -> asyncio.Lock:
+    """
+    The lock serializing transactions sent from a wallet.
+
+    Transactions from the same wallet must be submitted one at a time, or
+    they may be assigned the same nonce.  Holding this lock while submitting
+    makes that safe while still allowing different wallets to run concurrently.
+    """
+    return keyed_lock(("wallet", wallet_id))
+
+
+@overload
+async def gather_bounded(
+    awaitables: Iterable[Awaitable[T]],
+    limit: int,
+    return_exceptions: Literal[False] = False,
+) -> list[T]: ...
+
+
+@overload
+async def gather_bounded(
+    awaitables: Iterable[Awaitable[T]],
+    limit: int,
+    return_exceptions: bool,
+) -> list[Union[T, BaseException]]: ...
+
+
+async def gather_bounded(
+    awaitables: Iterable[Awaitable[T]],
+    limit: int,
+    return_exceptions: bool = False,
+) -> Union[list[T], list[Union[T, BaseException]]]:
+    """
+    ``asyncio.gather``, with at most ``limit`` awaitables running at once.
+
+    Unless ``return_exceptions`` is set, the first exception cancels every
+    awaitable still running or waiting for its turn, rather than leaving them
+    to finish in the background.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(awaitable: Awaitable[T]) -> T:
+        try:
+            async with semaphore:
+                return await awaitable
+        finally:
+            # an awaitable cancelled before its turn was never started
+            if inspect.iscoroutine(awaitable):
+                awaitable.close()
+
+    tasks = [asyncio.ensure_future(run(a)) for a in awaitables]
+    try:
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,68 @@
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+import time
+from typing import AsyncIterator, Iterator, Optional
+
+from empyrealSDK.exc import DeadlineExceeded
+
+_deadline: ContextVar[Optional[float]] = ContextVar("_deadline", default=None)
+
+
+@contextmanager
+def deadline(timeout: Optional[float]) -> Iterator[None]:
+    """
+    Bound every SDK request made inside the block to ``timeout`` seconds in total.
+
+    Deadlines nest, the earliest one wins, and they follow the context into any
+    task started inside the block.  Requests which would start after the
+    deadline, or are still running when it passes, raise
+    :class:`empyrealSDK.exc.DeadlineExceeded`.  A ``timeout`` of `None` leaves
+    the current deadline unchanged.
+
+    ```python
+    with deadline(2.0):
+        routes = await UniswapV2.get_price(token)
+        await UniswapV2.swap(routes[0].path, wallet, amount, 0.05)
+    ```
+    """
+    if timeout is None:
+        yield
+        return
+    expires = time.monotonic() + timeout
+    current = _deadline.get()
+    token = _deadline.set(expires if current is None else min(current, expires))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds until the current deadline, or `None` if there isn't one"""
+    expires = _deadline.get()
+    if expires is None:
+        return None
+    return expires - time.monotonic()
+
+
+@asynccontextmanager
+async def acquire(lock: asyncio.Lock) -> AsyncIterator[None]:
+    """
+    Hold ``lock`` for the block, waiting for it no longer than the current
+    deadline, so time queued behind other holders counts against it.
+
+    :raises empyrealSDK.exc.DeadlineExceeded: if the deadline passes first
+    """
+    timeout = remaining()
+    if timeout is None:
+        await lock.acquire()
+    else:
+        try:
+            await asyncio.wait_for(lock.acquire(), max(0.0, timeout))
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded("Deadline passed waiting for a lock") from None
+    try:
+        yield
+    finally:
+        lock.release()
@@ -0,0 +1,176 @@
+"""
+Columnar encoding of the ``price/`` feed.
+
+The feed is served as gzip compressed CSV, one
+``interval,open,close,min,max,min_block,max_block,num_tx,prev_close`` row per
+interval.  Clients which send ``Accept: application/vnd.empyreal.feed`` may
+instead receive the same data as fixed width little endian columns::
+
+    header   4s magic "EMPF", u16 version, u16 column count, u32 rows, u32 reserved
+    columns  rows x int64 or float64 each, in the order of `FEED_COLUMNS`
+
+A missing ``prev_close`` is NaN.  Both encodings decode to :class:`FeedColumns`.
+"""
+
+from array import array
+from datetime import datetime, timedelta, timezone
+import gzip
+import math
+import struct
+import sys
+from typing import Iterator, NamedTuple
+
+FEED_MEDIA_TYPE = "application/vnd.empyreal.feed"
+FEED_MAGIC = b"EMPF"
+FEED_VERSION = 1
+FEED_COLUMNS = (
+    ("time", "q"),
+    ("open", "d"),
+    ("close", "d"),
+    ("min", "d"),
+    ("max", "d"),
+    ("min_block", "q"),
+    ("max_block", "q"),
+    ("tx_count", "q"),
+    ("prev_close", "d"),
+)
+_HEADER = struct.Struct("<4sHHII")
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_SECOND = timedelta(seconds=1)
+
+
+class FeedRow(NamedTuple):
+    time: int
+    open: float
+    close: float
+    min: float
+    max: float
+    min_block: int
+    max_block: int
+    tx_count: int
+    prev_close: float
+
+
+class FeedColumns:
+    """
+    A price feed as one flat array per column, ordered by ``time`` (unix
+    seconds at the start of each interval).
+    """
+
+    __slots__ = tuple(name for name, _ in FEED_COLUMNS)
+
+    def __init__(self):
+        for name, typecode in FEED_COLUMNS:
+            setattr(self, name, array(typecode))
+
+    def __len__(self) -> int:
+        return len(self.time)  # type: ignore[attr-defined]
+
+    def __iter__(self) -> Iterator[FeedRow]:
+        return map(FeedRow, *(getattr(self, name) for name in self.__slots__))
+
+    def append(self, row: FeedRow):
+        for name, value in zip(self.__slots__, row):
+            getattr(self, name).append(value)
+
+    def to_frame(self):
+        """
+        The feed as an :class:`empyrealSDK.types.ohlc.OHLCFrame`, sharing the
+        column buffers.  A missing ``prev_close`` is filled with the open, as in
+        :meth:`empyrealSDK.types.DexPair.swap_history`.  Requires numpy.
+        """
+        from empyrealSDK.types.ohlc import OHLCFrame
+
+        import numpy as np
+
+        def column(name: str, dtype) -> np.ndarray:
+            return np.frombuffer(getattr(self, name), dtype=dtype)
+
+        open = column("open", np.float64)
+        prev_close = column("prev_close", np.float64)
+        return OHLCFrame(
+            time=column("time", np.int64).view("datetime64[s]"),
+            open=open,
+            close=column("close", np.float64),
+            min=column("min", np.float64),
+            max=column("max", np.float64),
+            tx_count=column("tx_count", np.int64),
+            prev_close=np.where(np.isnan(prev_close), open, prev_close),
+        )
+
+
+def encode_feed(columns: FeedColumns) -> bytes:
+    """Encode a feed in the columnar format"""
+    parts = [_HEADER.pack(FEED_MAGIC, FEED_VERSION, len(FEED_COLUMNS), len(columns), 0)]
+    for name, _ in FEED_COLUMNS:
+        values = getattr(columns, name)
+        if sys.byteorder == "big":  # pragma: no cover
+            values = array(values.typecode, values)
+            values.byteswap()
+        parts.append(values.tobytes())
+    return b"".join(parts)
+
+
+def decode_feed(data: bytes) -> FeedColumns:
+    """Decode a feed in the columnar format"""
+    magic, version, count, rows, _ = _HEADER.unpack_from(data)
+    if magic != FEED_MAGIC:
+        raise ValueError("Not a columnar price feed")
+    if version != FEED_VERSION or count != len(FEED_COLUMNS):
+        raise ValueError(f"Unsupported price feed version {version}")
+    if len(data) != _HEADER.size + rows * 8 * count:
+        raise ValueError("Truncated price feed")
+
+    columns = FeedColumns()
+    view = memoryview(data)
+    offset = _HEADER.size
+    for name, _ in FEED_COLUMNS:
+        values = getattr(columns, name)
+        values.frombytes(view[offset : offset + rows * 8])
+        if sys.byteorder == "big":  # pragma: no cover
+            values.byteswap()
+        offset += rows * 8
+    return columns
+
+
+def _epoch_seconds(interval: str) -> int:
+    moment = datetime.fromisoformat(interval)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return (moment - _EPOCH) // _SECOND
+
+
+def _float(value: str) -> float:
+    return math.nan if value == "None" else float(value)
+
+
+def parse_feed_csv(feed: str) -> FeedColumns:
+    """Parse the CSV encoding of a feed, skipping blank lines"""
+    columns = FeedColumns()
+    time, open, close, low, high, min_block, max_block, tx_count, prev_close = (
+        getattr(columns, name) for name in FeedColumns.__slots__
+    )
+    for line in sorted(feed.split("\n")):
+        if not line:
+            continue
+        fields = line.split(",")
+        time.append(_epoch_seconds(fields[0]))
+        open.append(float(fields[1]))
+        close.append(float(fields[2]))
+        low.append(float(fields[3]))
+        high.append(float(fields[4]))
+        min_block.append(int(fields[5]))
+        max_block.append(int(fields[6]))
+        tx_count.append(int(fields[7]))
+        prev_close.append(_float(fields[8]))
+    return columns
+
+
+def decompress_feed(feed: bytes) -> str:
+    """The CSV text of a gzip compressed feed"""
+    return gzip.decompress(feed).decode("utf-8")
+
+
+def parse_gzip_feed(feed: bytes) -> FeedColumns:
+    """Decompress and parse a CSV feed in one step, e.g. on a worker process"""
+    return parse_feed_csv(decompress_feed(feed))
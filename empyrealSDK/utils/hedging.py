@@ -0,0 +1,149 @@
+import asyncio
+from collections import deque
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+HEDGEABLE = frozenset(
+    {
+        ("GET", "app/"),
+        ("GET", "dex/ath"),
+        ("GET", "dex/pair"),
+        ("GET", "dex/pairs"),
+        ("GET", "dex/routes"),
+        ("GET", "infrastructure/ping"),
+        ("GET", "price/"),
+        ("GET", "security/"),
+        ("GET", "token/allowance"),
+        ("GET", "token/lookup"),
+        ("GET", "users/telegram"),
+        ("GET", "vault/"),
+        ("GET", "vault/positions"),
+        ("GET", "wallets/app"),
+        ("GET", "wallets/user"),
+        ("PUT", "dex/liquidity"),
+        ("PUT", "dex/simulate"),
+        ("PUT", "token/balance"),
+        ("PUT", "token/taxes"),
+    }
+)
+"""Idempotent reads which are safe to send twice.  Note that the API's verbs do
+not imply idempotency, e.g. ``token/transfer`` is a GET and ``token/balance``
+a PUT, so hedging is opt in per endpoint."""
+
+NEVER_HEDGE = frozenset({"dex/swap", "token/approve", "token/transfer"})
+
+
+class _LatencyWindow:
+    def __init__(self, size: int):
+        self.samples: deque[float] = deque(maxlen=size)
+        self._sorted: list[float] = []
+        self._stale = 0
+
+    def add(self, seconds: float):
+        self.samples.append(seconds)
+        self._stale += 1
+
+    def percentile(self, pct: float) -> float:
+        # re-sorting every few samples keeps this cheap on the hot path
+        if self._stale >= 10 or not self._sorted:
+            self._sorted = sorted(self.samples)
+            self._stale = 0
+        index = min(len(self._sorted) - 1, int(pct * len(self._sorted)))
+        return self._sorted[index]
+
+
+class HedgePolicy:
+    """
+    Hedges idempotent reads to cut tail latency.
+
+    If a read has not responded within the ``percentile`` latency of recent
+    calls to the same endpoint, a duplicate is sent and whichever returns first
+    is used, the other is cancelled.  Extra load is capped at ``max_extra_load``
+    hedges per request, e.g. ``0.05`` allows at most 5% more requests.
+
+    Only endpoints in :data:`HEDGEABLE` are hedged.  Mutating calls such as
+    ``dex/swap`` and ``token/transfer`` never are.
+
+    ```python
+    sdk = EmpyrealSDK(api_key, hedging=HedgePolicy(percentile=0.95))
+    ```
+
+    :param percentile: latency percentile to wait before hedging
+    :param max_extra_load: hedged requests allowed per request
+    :param min_delay: never hedge sooner than this many seconds
+    :param window: recent latencies kept per endpoint
+    :param min_samples: latencies needed before an endpoint is hedged
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        max_extra_load: float = 0.05,
+        min_delay: float = 0.01,
+        window: int = 200,
+        min_samples: int = 20,
+        endpoints: frozenset[tuple[str, str]] = HEDGEABLE,
+    ):
+        self.percentile = percentile
+        self.max_extra_load = max_extra_load
+        self.min_delay = min_delay
+        self.window = window
+        self.min_samples = min_samples
+        self.endpoints = endpoints - {
+            (method, path) for method, path in endpoints if path in NEVER_HEDGE
+        }
+        self._latencies: dict[str, _LatencyWindow] = {}
+        self._credit = 0.0
+        self.requests = 0
+        self.hedges = 0
+
+    def allows(self, method: str, path: str) -> bool:
+        return (method, path) in self.endpoints
+
+    def _delay(self, path: str) -> Optional[float]:
+        window = self._latencies.get(path)
+        if window is None or len(window.samples) < self.min_samples:
+            return None
+        return max(self.min_delay, window.percentile(self.percentile))
+
+    def _record(self, path: str, seconds: float):
+        window = self._latencies.get(path)
+        if window is None:
+            window = self._latencies[path] = _LatencyWindow(self.window)
+        window.add(seconds)
+
+    def _spend_credit(self) -> bool:
+        if self._credit >= 1:
+            self._credit -= 1
+            self.hedges += 1
+            return True
+        return False
+
+    async def run(self, path: str, send: Callable[[], Awaitable[T]]) -> T:
+        """Call ``send``, and call it again if the first is slow"""
+        self.requests += 1
+        # credit accrues per request, bounded so idle periods can't bank a burst
+        self._credit = min(self._credit + self.max_extra_load, 10.0)
+        start = time.monotonic()
+        delay = self._delay(path)
+
+        primary = asyncio.ensure_future(send())
+        pending = {primary}
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(pending, timeout=delay)
+                if not done and self._spend_credit():
+                    pending.add(asyncio.ensure_future(send()))
+            while True:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                succeeded = [task for task in done if task.exception() is None]
+                if succeeded or not pending:
+                    self._record(path, time.monotonic() - start)
+                    return (succeeded or list(done))[0].result()
+        finally:
+            for task in pending:
+                task.cancel()
@@ -0,0 +1,156 @@
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+import heapq
+from itertools import count
+import time
+from typing import AsyncIterator, Iterator, Optional
+
+from .ratelimit import TokenBucket
+
+
+class Priority(IntEnum):
+    """Request classes, drained lowest value first"""
+
+    critical = 0
+    high = 1
+    normal = 2
+    low = 3
+
+
+ENDPOINT_PRIORITY: dict[str, Priority] = {
+    "dex/swap": Priority.critical,
+    "token/approve": Priority.critical,
+    "token/transfer": Priority.critical,
+    "dex/simulate": Priority.high,
+    "token/allowance": Priority.high,
+    "token/balance": Priority.high,
+    "dex/ath": Priority.low,
+    "dex/pairs": Priority.low,
+    "price/": Priority.low,
+    "security/": Priority.low,
+    "vault/positions": Priority.low,
+    "wallets/archive": Priority.low,
+}
+"""Default class per endpoint, anything missing is :attr:`Priority.normal`"""
+
+_priority: ContextVar[Optional[Priority]] = ContextVar("_priority", default=None)
+
+
+@contextmanager
+def priority(level: Priority) -> Iterator[None]:
+    """
+    Send every SDK request made inside the block, including from tasks started
+    inside it, as ``level`` rather than its endpoint's default class.
+
+    ```python
+    with priority(Priority.low):
+        history = await pair.swap_history(start, end)
+    ```
+    """
+    token = _priority.set(level)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def request_priority(path: str) -> Priority:
+    """The class a request to ``path`` is sent as in the current context"""
+    level = _priority.get()
+    if level is not None:
+        return level
+    return ENDPOINT_PRIORITY.get(path, Priority.normal)
+
+
+class PriorityLimiter:
+    """
+    Caps requests in flight, and optionally per second, handing free slots to
+    the most urgent waiting request first.
+
+    Waiters are ordered by their arrival time plus ``aging`` seconds per class
+    below critical, so a queued low priority request is eventually served ahead
+    of newer critical ones and is never starved.
+
+    ```python
+    sdk = EmpyrealSDK(
+        api_key,
+        limiter=PriorityLimiter(max_concurrency=8, requests_per_second=20),
+    )
+    ```
+
+    :param max_concurrency: most requests in flight at once
+    :param requests_per_second: optional request rate cap, with bursts of up to
+        one second's worth
+    :param aging: seconds a request waits before it outranks the next class up
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        requests_per_second: Optional[float] = None,
+        aging: float = 2.0,
+    ):
+        self.max_concurrency = max_concurrency
+        self.aging = aging
+        self._bucket = TokenBucket(requests_per_second) if requests_per_second else None
+        self._waiters: list[tuple[float, int, asyncio.Future]] = []
+        self._seq = count()
+        self._active = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def waiting(self) -> int:
+        return sum(not future.done() for _, _, future in self._waiters)
+
+    def _wake(self):
+        self._timer = None
+        while self._waiters and self._active < self.max_concurrency:
+            future = self._waiters[0][2]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if self._bucket is not None and not self._bucket.try_acquire():
+                self._timer = asyncio.get_running_loop().call_later(
+                    self._bucket.delay(), self._wake
+                )
+                return
+            heapq.heappop(self._waiters)
+            self._active += 1
+            future.set_result(None)
+
+    async def acquire(self, level: Priority = Priority.normal):
+        if (
+            not self._waiters
+            and self._active < self.max_concurrency
+            and (self._bucket is None or self._bucket.try_acquire())
+        ):
+            self._active += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        rank = time.monotonic() + level * self.aging
+        heapq.heappush(self._waiters, (rank, next(self._seq), future))
+        if self._timer is None:
+            self._wake()
+        try:
+            await future
+        except asyncio.CancelledError:
+            # the slot may have been handed over just before the cancellation
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self):
+        self._active -= 1
+        if self._timer is None:
+            self._wake()
+
+    @asynccontextmanager
+    async def slot(self, level: Priority = Priority.normal) -> AsyncIterator[None]:
+        await self.acquire(level)
+        try:
+            yield
+        finally:
+            self.release()
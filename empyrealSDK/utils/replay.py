@@ -0,0 +1,295 @@
+"""
+Record and replay httpx transports.
+
+A :class:`RecordingTransport` wraps a real transport and appends every
+request/response pair to a gzip-compressed JSON-lines file.  A
+:class:`ReplayTransport` serves those responses back without touching the
+network, either as fast as possible or with the recorded latencies, which makes
+it possible to profile, load-test and backtest against captured traffic.
+
+Secrets (the ``API-KEY`` header, api keys, private keys and mnemonics in query
+strings or JSON bodies) are redacted before anything is written to disk.
+
+Examples
+--------
+>>> recorder = RecordingTransport("session.jsonl.gz")
+>>> sdk = EmpyrealSDK(api_key, transport=recorder)
+>>> ...
+>>> sdk = EmpyrealSDK("replay", transport=ReplayTransport("session.jsonl.gz"))
+"""
+
+import asyncio
+import base64
+import gzip
+import json
+import time
+from collections import defaultdict, deque
+from typing import Any, Iterator, Optional, Union
+from urllib.parse import parse_qsl, urlencode
+
+import httpx
+from pydantic import BaseModel
+
+from empyrealSDK.exc import ReplayMissError
+
+REDACTED = "<redacted>"
+
+SECRET_FIELDS = frozenset(
+    key.lower()
+    for key in (
+        "API-KEY",
+        "apiKey",
+        "api_key",
+        "privateKey",
+        "private_key",
+        "mnemonic",
+        "seed",
+    )
+)
+"""Header, query and JSON keys whose values are never written to a recording"""
+
+RECORDED_HEADERS = ("content-type",)
+
+FORMAT_HEADER = {"format": "empyreal-replay", "version": 1}
+
+
+class RecordedExchange(BaseModel):
+    """A single request/response pair"""
+
+    method: str
+    path: str
+    query: str = ""
+    request_body: Optional[str] = None
+    status_code: int
+    headers: dict[str, str] = {}
+    body: Optional[str] = None
+    """Response body as text if it was JSON, otherwise base64"""
+    body_is_base64: bool = False
+    started: float
+    """Seconds since the recording started"""
+    elapsed: float
+    """Seconds until the response was received"""
+
+    @property
+    def key(self) -> tuple[str, str, str, Optional[str]]:
+        return (self.method, self.path, self.query, self.request_body)
+
+    def content(self) -> bytes:
+        if self.body is None:
+            return b""
+        if self.body_is_base64:
+            return base64.b64decode(self.body)
+        return self.body.encode("utf-8")
+
+
+def redact(value: Any) -> Any:
+    """Recursively replace secret fields in decoded JSON"""
+    if isinstance(value, dict):
+        return {
+            k: (REDACTED if k.lower() in SECRET_FIELDS else redact(v))
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [redact(v) for v in value]
+    return value
+
+
+def _redact_query(query: bytes) -> str:
+    pairs = parse_qsl(query.decode("ascii"), keep_blank_values=True)
+    return urlencode(
+        sorted((k, REDACTED if k.lower() in SECRET_FIELDS else v) for k, v in pairs)
+    )
+
+
+def _redact_body(body: bytes) -> Optional[str]:
+    if not body:
+        return None
+    try:
+        decoded = json.loads(body)
+    except ValueError:
+        return base64.b64encode(body).decode("ascii")
+    return json.dumps(redact(decoded), sort_keys=True, separators=(",", ":"))
+
+
+def _request_key(
+    request: httpx.Request, body: bytes
+) -> tuple[str, str, str, Optional[str]]:
+    return (
+        request.method,
+        request.url.path,
+        _redact_query(request.url.query),
+        _redact_body(body),
+    )
+
+
+def load_recording(path: str) -> Iterator[RecordedExchange]:
+    """Iterate through the exchanges stored in a recording file"""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            row = json.loads(line)
+            if row.get("format") == FORMAT_HEADER["format"]:
+                continue
+            yield RecordedExchange(**row)
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """
+    Forwards requests to ``transport`` and appends each exchange to ``path``.
+
+    Every exchange is written as its own gzip member as soon as it completes,
+    so a recording survives the process being killed mid-session.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.path = path
+        self.transport = transport or httpx.AsyncHTTPTransport()
+        self._start = time.monotonic()
+        self._write(FORMAT_HEADER)
+
+    def _write(self, row: dict):
+        with gzip.open(self.path, "at", encoding="utf-8") as f:
+            f.write(json.dumps(row, separators=(",", ":")) + "\n")
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request_body = await request.aread()
+        started = time.monotonic()
+        response = await self.transport.handle_async_request(request)
+        # `aread` undoes any Content-Encoding, so JSON bodies can be redacted
+        content = await response.aread()
+        elapsed = time.monotonic() - started
+        await response.aclose()
+
+        content_type = response.headers.get("content-type", "")
+        headers = {
+            k: v for k, v in response.headers.items() if k.lower() in RECORDED_HEADERS
+        }
+        if "json" in content_type:
+            body = _redact_body(content)
+            body_is_base64 = False
+        else:
+            body = base64.b64encode(content).decode("ascii")
+            body_is_base64 = True
+
+        method, path, query, redacted_request = _request_key(request, request_body)
+        exchange = RecordedExchange(
+            method=method,
+            path=path,
+            query=query,
+            request_body=redacted_request,
+            status_code=response.status_code,
+            headers=headers,
+            body=body,
+            body_is_base64=body_is_base64,
+            started=started - self._start,
+            elapsed=elapsed,
+        )
+        self._write(exchange.model_dump())
+
+        # the body is already decoded, so the client must not decode it again
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=[
+                (k, v)
+                for k, v in response.headers.multi_items()
+                if k.lower() not in ("content-encoding", "content-length")
+            ],
+            content=content,
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        # the wrapped transport may back several clients, keep it open until `close`
+        pass
+
+    async def close(self) -> None:
+        await self.transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """
+    Serves responses from a recording made by :class:`RecordingTransport`.
+
+    Requests are matched on method, path, query and JSON body, falling back to
+    method and path alone, and repeated requests are served in recorded order.
+
+    :param realtime: reproduce the recorded timing, each response is sent at its
+        recorded start, relative to the first replayed request, plus its latency
+    :param speed: time divisor when ``realtime`` is set, e.g. ``2.0`` for 2x
+    :param loop: start from the beginning once a request's responses run out,
+        instead of raising :class:`empyrealSDK.exc.ReplayMissError`
+    """
+
+    def __init__(
+        self,
+        source: Union[str, list[RecordedExchange]],
+        realtime: bool = False,
+        speed: float = 1.0,
+        loop: bool = False,
+    ):
+        self.exchanges = (
+            list(load_recording(source)) if isinstance(source, str) else source
+        )
+        self.realtime = realtime
+        self.speed = speed
+        self.loop = loop
+        self.reset()
+
+    def reset(self):
+        """Rewind to the start of the recording"""
+        # monotonic time of the recording's zero, set by the first request
+        self._origin: Optional[float] = None
+        self._exact: dict[tuple, deque[RecordedExchange]] = defaultdict(deque)
+        self._loose: dict[tuple, deque[RecordedExchange]] = defaultdict(deque)
+        for exchange in self.exchanges:
+            self._exact[exchange.key].append(exchange)
+            self._loose[(exchange.method, exchange.path)].append(exchange)
+
+    def _next(self, queue: deque[RecordedExchange]) -> RecordedExchange:
+        exchange = queue.popleft()
+        if self.loop:
+            queue.append(exchange)
+        return exchange
+
+    def _match(self, key: tuple) -> RecordedExchange:
+        if queue := self._exact.get(key):
+            exchange = self._next(queue)
+            if not self.loop:
+                self._loose[key[:2]].remove(exchange)
+            return exchange
+        if queue := self._loose.get(key[:2]):
+            exchange = self._next(queue)
+            if not self.loop:
+                self._exact[exchange.key].remove(exchange)
+            return exchange
+        raise ReplayMissError(f"No recorded response for {key[0]} {key[1]}")
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        exchange = self._match(_request_key(request, body))
+        if self.realtime:
+            now = time.monotonic()
+            if self._origin is None:
+                self._origin = now - exchange.started / self.speed
+            respond_at = (
+                self._origin + (exchange.started + exchange.elapsed) / self.speed
+            )
+            if respond_at > now:
+                await asyncio.sleep(respond_at - now)
+        return httpx.Response(
+            status_code=exchange.status_code,
+            headers=exchange.headers,
+            content=exchange.content(),
+        )
+
+
+__all__ = [
+    "RecordedExchange",
+    "RecordingTransport",
+    "ReplayTransport",
+    "load_recording",
+    "redact",
+]
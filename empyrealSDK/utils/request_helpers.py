@@ -1,10 +1,15 @@
+import asyncio
+import json
 from typing import Any, Mapping, Optional, TYPE_CHECKING
 
 import httpx
 from httpx import Response
 from httpx._types import PrimitiveData
 
-from empyrealSDK.exc import handle_response_error
+from empyrealSDK.exc import DeadlineExceeded, handle_response_error
+
+from .deadline import deadline, remaining
+from .priority import request_priority
 
 if TYPE_CHECKING:
     from .. import EmpyrealSDK
@@ -23,51 +28,91 @@ class RequestHelpers:
     def api_key(self):
         return self.sdk.api_key
 
-    async def _get(
-        self, path: str, params: Optional[Mapping[str, PrimitiveData]] = None
+    @property
+    def transport(self):
+        return self.sdk.transport
+
+    def _client(self) -> httpx.AsyncClient:
+        return self.sdk.http_client()
+
+    async def _dispatch(
+        self,
+        method: str,
+        path: str,
+        headers: Optional[Mapping[str, str]] = None,
+        **kwargs,
     ) -> Response:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
+        async def send() -> Response:
+            return await self._client().request(
+                method,
                 f"{self.rpc_url}/{self.version}/{path}",
                 headers={
                     "API-KEY": self.api_key,
+                    **(headers or {}),
                 },
-                params=params,
+                **kwargs,
             )
+
+        level = request_priority(path)
+        if self.sdk.budget is not None:
+            await self.sdk.budget.acquire(level)
+        limiter = self.sdk.limiter
+        if limiter is None:
+            return await send()
+        async with limiter.slot(level):
+            return await send()
+
+    async def _send(self, method: str, path: str, **kwargs) -> Response:
+        timeout = remaining()
+        if timeout is not None and timeout <= 0:
+            raise DeadlineExceeded(f"Deadline passed before {method} {path}")
+        # time queued behind the limiter counts against the deadline
+        request = self._dispatch(method, path, **kwargs)
+        if timeout is None:
+            return await request
+        # httpx timeouts bound each phase, `wait_for` bounds the whole request
+        try:
+            return await asyncio.wait_for(request, timeout)
+        except (asyncio.TimeoutError, httpx.TimeoutException) as e:
+            raise DeadlineExceeded(f"Deadline passed during {method} {path}") from e
+
+    async def _request(self, method: str, path: str, **kwargs) -> Response:
+        async def send() -> Response:
+            hedging = self.sdk.hedging
+            if hedging is not None and hedging.allows(method, path):
+                return await hedging.run(
+                    path, lambda: self._send(method, path, **kwargs)
+                )
+            return await self._send(method, path, **kwargs)
+
+        with deadline(self.sdk.timeout):
+            breaker = self.sdk.circuit_breaker
+            if breaker is not None:
+                response = await breaker.call(path, send)
+            else:
+                response = await send()
         handle_response_error(response)
         return response
 
+    async def _json(self, response: Response) -> Any:
+        """Decode a JSON body, off the event loop if it is large"""
+        return await self.sdk.offload(
+            len(response.content), json.loads, response.content
+        )
+
+    async def _get(
+        self,
+        path: str,
+        params: Optional[Mapping[str, PrimitiveData]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Response:
+        return await self._request("GET", path, params=params, headers=headers)
+
     async def _post(self, path: str, json: Any) -> Response:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.rpc_url}/{self.version}/{path}",
-                json=json,
-                headers={
-                    "API-KEY": self.api_key,
-                },
-            )
-        handle_response_error(response)
-        return response
+        return await self._request("POST", path, json=json)
 
     async def _put(self, path: str, json: Any = {}) -> Response:
-        async with httpx.AsyncClient() as client:
-            response = await client.put(
-                f"{self.rpc_url}/{self.version}/{path}",
-                json=json,
-                headers={
-                    "API-KEY": self.api_key,
-                },
-            )
-        handle_response_error(response)
-        return response
+        return await self._request("PUT", path, json=json)
 
     async def _delete(self, path: str) -> Response:
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                f"{self.rpc_url}/{self.version}/{path}",
-                headers={
-                    "API-KEY": self.api_key,
-                },
-            )
-        handle_response_error(response)
-        return response
+        return await self._request("DELETE", path)
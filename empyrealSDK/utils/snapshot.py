@@ -0,0 +1,116 @@
+"""
+Warm-start snapshots of the SDK's state, so a new worker can serve its first
+request without reloading the application, its wallets, tokens and pairs.
+
+A snapshot is a pickle of::
+
+    version      SNAPSHOT_VERSION, snapshots of another version are rejected
+    created_at   unix time the snapshot was written
+    rpc_url      the API the state was loaded from
+    key_digest   sha256 of the API key, the key itself is never written
+    application  the last loaded `Application`, ``api_key`` blanked and its
+                 wallet's private key removed
+    wallets      the last loaded app wallets, private keys removed
+    cache        token and pair entries from the SDK's cache
+
+Pickles can run code when loaded, so only load snapshots you wrote.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from typing import TYPE_CHECKING, Optional, Union
+
+if TYPE_CHECKING:
+    from empyrealSDK.sdk import EmpyrealSDK
+    from empyrealSDK.types import Wallet
+
+SNAPSHOT_VERSION = 1
+# cache entries which never expire, and so are safe to restore at any age
+SNAPSHOT_PREFIXES = ("token:", "pair:")
+
+
+def _key_digest(api_key: str) -> str:
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+def _redact_wallet(wallet: "Wallet") -> "Wallet":
+    return wallet.model_copy(update={"private_key": None})
+
+
+def save_snapshot(sdk: "EmpyrealSDK", path: Union[str, os.PathLike]):
+    """Write ``sdk``'s state to ``path``, replacing it atomically"""
+    application = sdk.application
+    if application is not None:
+        app_wallet = application.app_wallet
+        application = application.model_copy(
+            update={
+                "api_key": "",
+                "app_wallet": app_wallet and _redact_wallet(app_wallet),
+            }
+        )
+    wallets = sdk.app_wallets
+    if wallets is not None:
+        wallets = [_redact_wallet(w) for w in wallets]
+    state = {
+        "version": SNAPSHOT_VERSION,
+        "created_at": time.time(),
+        "rpc_url": sdk.rpc_url,
+        "key_digest": _key_digest(sdk.api_key),
+        "application": application,
+        "wallets": wallets,
+        "cache": [
+            entry for prefix in SNAPSHOT_PREFIXES for entry in sdk.cache.items(prefix)
+        ],
+    }
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".snapshot-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(state, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def load_snapshot(
+    sdk: "EmpyrealSDK",
+    path: Union[str, os.PathLike],
+    max_age: Optional[float] = None,
+) -> float:
+    """
+    Restore a snapshot written by :func:`save_snapshot` into ``sdk``.
+
+    Tokens and pairs are always restored.  The application and wallets are
+    skipped if the snapshot is older than ``max_age`` seconds, or was written
+    for another API key or environment, and are then loaded from the API as
+    usual.
+
+    :return: the snapshot's ``created_at``
+    :raises ValueError: if the file is not a snapshot of a supported version
+    """
+    with open(path, "rb") as f:
+        state = pickle.load(f)
+    if not isinstance(state, dict) or state.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported SDK snapshot {path}")
+
+    for key, value in state["cache"]:
+        sdk.cache.set(key, value)
+
+    created_at = state["created_at"]
+    fresh = max_age is None or time.time() - created_at <= max_age
+    if (
+        fresh
+        and state["rpc_url"] == sdk.rpc_url
+        and state["key_digest"] == _key_digest(sdk.api_key)
+    ):
+        application = state["application"]
+        if application is not None:
+            application = application.model_copy(update={"api_key": sdk.api_key})
+        sdk.application = application
+        sdk.app_wallets = state["wallets"]
+    return created_at
@@ -7,6 +7,13 @@ with open("README.md") as f:
     readme = f.read()
 
 extras_require = {
+    "analytics": [
+        "numpy>=1.20.0",
+    ],
+    "arrow": [
+        "numpy>=1.20.0",
+        "pyarrow>=10.0.0",
+    ],
     "linter": [
         "black>=22.1.0",
         "flake8==3.8.3",
@@ -0,0 +1,14 @@
+import pytest
+
+from benchmarks import fixtures as fx
+from empyrealSDK import EmpyrealSDK
+
+
+@pytest.fixture
+def api() -> fx.MockAPI:
+    return fx.MockAPI(feed_rows=60)
+
+
+@pytest.fixture
+def sdk(api: fx.MockAPI) -> EmpyrealSDK:
+    return EmpyrealSDK("test-api-key", transport=api.transport())
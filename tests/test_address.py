@@ -0,0 +1,37 @@
+import os
+import tracemalloc
+
+from empyrealSDK.types.address import Address
+
+
+def _allocated(build) -> tuple[int, list[Address]]:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = build()
+        return tracemalloc.get_traced_memory()[0] - before, kept
+    finally:
+        tracemalloc.stop()
+
+
+def test_interned():
+    weth = Address("0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2")
+    assert Address(weth.checksum) is weth
+    assert Address(bytes(weth)) is weth
+    assert str(weth) == "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+    assert weth.lowercase == "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2"
+
+
+def test_size_per_address():
+    count = 20_000
+    hexes = ["0x" + os.urandom(20).hex() for _ in range(count)]
+
+    size, addresses = _allocated(lambda: [Address(h) for h in hexes])
+    # the address, its intern table entry and the list's reference, well under
+    # an address keyed in the table by a separate copy of its bytes (~185)
+    assert size / count < 140
+
+    size, repeats = _allocated(lambda: [Address(h) for h in hexes])
+    # repeats are the interned instances, only the list's references are new
+    assert all(a is b for a, b in zip(addresses, repeats))
+    assert size / count < 16
@@ -0,0 +1,32 @@
+import asyncio
+
+from benchmarks import fixtures as fx
+from empyrealSDK.types import Token, Wallet
+from empyrealSDK.types import token as token_module
+
+
+def test_ensure_allowance_approves_once(api, sdk):
+    api.routes[("GET", "token/allowance")] = lambda r: fx._json({"allowance": 0})
+    token = Token(**fx.TOKEN_JSON)
+    wallet = Wallet(**fx.WALLET_JSON)
+
+    async def run():
+        return await asyncio.gather(
+            *(token.ensure_allowance(wallet, fx.ROUTER, 10**18) for _ in range(5))
+        )
+
+    tx_hashes = asyncio.run(run())
+    assert tx_hashes.count(None) == 4
+    assert api.calls == 2  # one lookup, one approval
+
+
+def test_approval_is_cached_optimistically(api, sdk, monkeypatch):
+    monkeypatch.setattr(token_module, "APPROVAL_TTL", 0.0)
+    api.routes[("GET", "token/allowance")] = lambda r: fx._json({"allowance": 0})
+    token = Token(**fx.TOKEN_JSON)
+    wallet = Wallet(**fx.WALLET_JSON)
+
+    asyncio.run(token.approve(wallet, fx.ROUTER))
+    # the approval expired unconfirmed, so the allowance is read onchain again
+    asyncio.run(token.ensure_allowance(wallet, fx.ROUTER, 10**18))
+    assert api.calls == 3
@@ -0,0 +1,83 @@
+import pytest
+
+from empyrealSDK.utils import cache as cache_module
+from empyrealSDK.utils.cache import LRUCache, SQLiteCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture(params=["lru", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "lru":
+        yield LRUCache(maxsize=100, ttl=10)
+    else:
+        backend = SQLiteCache(tmp_path / "cache.sqlite", maxsize=100, ttl=10)
+        yield backend
+        backend.close()
+
+
+def test_get_set_delete(backend):
+    assert backend.get("token:1:a") is None
+    assert backend.get("token:1:a", "default") == "default"
+    backend.set("token:1:a", {"symbol": "PEPE"})
+    assert backend.get("token:1:a") == {"symbol": "PEPE"}
+    assert "token:1:a" in backend
+    backend.delete("token:1:a")
+    assert "token:1:a" not in backend
+
+
+def test_ttl(backend, clock):
+    backend.set("default", 1)
+    backend.set("short", 2, ttl=1)
+    clock[0] += 5
+    assert backend.get("short") is None
+    assert backend.get("default") == 1
+    clock[0] += 10
+    assert backend.get("default") is None
+
+
+def test_items_by_prefix(backend, clock):
+    backend.set("token:1:a", 1)
+    backend.set("token:1:b", 2, ttl=1)
+    backend.set("pair:1:c", 3)
+    clock[0] += 5
+    assert dict(backend.items("token:")) == {"token:1:a": 1}
+    assert len(dict(backend.items())) == 2
+
+
+def test_maxsize(backend):
+    for i in range(150):
+        backend.set(f"k{i}", i)
+    assert len(backend) <= 101
+    assert backend.get("k149") == 149
+    assert backend.get("k0") is None
+
+
+def test_lru_evicts_least_recently_used():
+    lru = LRUCache(maxsize=2)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    lru.get("a")
+    lru.set("c", 3)
+    assert "b" not in lru
+    assert lru.get("a") == 1
+    # keys of the in-process caches are not only strings
+    lru.set((1, "0xpair", 19_000_000), (1, 2.0, 3, 4.0))
+    assert (1, "0xpair", 19_000_000) in lru
+
+
+def test_sqlite_shared_between_instances(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    writer, reader = SQLiteCache(path), SQLiteCache(path)
+    writer.set("pair:1:a", {"fee": 0.003})
+    assert reader.get("pair:1:a") == {"fee": 0.003}
+    reader.clear()
+    assert writer.get("pair:1:a") is None
+    writer.close()
+    reader.close()
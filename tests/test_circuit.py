@@ -0,0 +1,87 @@
+import asyncio
+
+import httpx
+import pytest
+
+from empyrealSDK.exc import CircuitOpenError
+from empyrealSDK.utils import circuit as circuit_module
+from empyrealSDK.utils.circuit import CircuitBreaker, CircuitState
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(circuit_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _call(breaker: CircuitBreaker, status: int = 200) -> httpx.Response:
+    async def send():
+        return httpx.Response(status)
+
+    return asyncio.run(breaker.call("dex/routes", send))
+
+
+def test_opens_on_failure_rate_and_recovers(clock):
+    breaker = CircuitBreaker(failure_rate=0.5, window=4, min_requests=4, cooldown=5)
+    for status in (200, 200, 500):
+        _call(breaker, status)
+    assert breaker.state("dex/routes") == CircuitState.closed
+    _call(breaker, 503)
+    assert breaker.state("dex/routes") == CircuitState.open
+
+    with pytest.raises(CircuitOpenError):
+        _call(breaker)
+    # other endpoints are unaffected
+    assert breaker.state("dex/pair") == CircuitState.closed
+
+    clock[0] += 5
+    _call(breaker)
+    assert breaker.state("dex/routes") == CircuitState.closed
+
+
+def test_failed_probe_reopens(clock):
+    breaker = CircuitBreaker(window=2, min_requests=2, cooldown=5)
+    _call(breaker, 500)
+    _call(breaker, 500)
+    clock[0] += 5
+    _call(breaker, 500)
+    assert breaker.state("dex/routes") == CircuitState.open
+    with pytest.raises(CircuitOpenError):
+        _call(breaker)
+
+
+def test_one_probe_at_a_time(clock):
+    breaker = CircuitBreaker(window=2, min_requests=2, cooldown=5)
+    _call(breaker, 500)
+    _call(breaker, 500)
+    clock[0] += 5
+
+    async def run():
+        release = asyncio.Event()
+
+        async def slow():
+            await release.wait()
+            return httpx.Response(200)
+
+        probe = asyncio.ensure_future(breaker.call("dex/routes", slow))
+        await asyncio.sleep(0)
+        with pytest.raises(CircuitOpenError):
+            await breaker.call("dex/routes", slow)
+        release.set()
+        return await probe
+
+    assert asyncio.run(run()).status_code == 200
+    assert breaker.state("dex/routes") == CircuitState.closed
+
+
+def test_transport_errors_count_as_failures(clock):
+    breaker = CircuitBreaker(window=2, min_requests=2)
+
+    async def fail():
+        raise httpx.ConnectError("refused")
+
+    for _ in range(2):
+        with pytest.raises(httpx.ConnectError):
+            asyncio.run(breaker.call("dex/routes", fail))
+    assert breaker.state("dex/routes") == CircuitState.open
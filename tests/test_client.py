@@ -0,0 +1,25 @@
+import asyncio
+
+from benchmarks import fixtures as fx
+from empyrealSDK.types import Token
+
+
+def test_client_is_closed_with_its_loop(sdk):
+    async def run():
+        await Token.load(fx.TOKEN)
+        return sdk.http_client()
+
+    clients = [asyncio.run(run()) for _ in range(2)]
+    # each loop opened its own client and closed it on shutdown, without aclose
+    assert clients[0] is not clients[1]
+    assert all(client.is_closed for client in clients)
+
+
+def test_aclose_closes_the_running_loops_client(sdk):
+    async def run():
+        client = sdk.http_client()
+        await sdk.aclose()
+        assert client.is_closed
+        assert sdk.http_client() is not client
+
+    asyncio.run(run())
@@ -0,0 +1,37 @@
+import asyncio
+import time
+
+import pytest
+
+from benchmarks import fixtures as fx
+from empyrealSDK.exc import DeadlineExceeded
+from empyrealSDK.types import Token, UniswapV2, Wallet
+from empyrealSDK.utils.concurrency import wallet_lock
+
+
+def test_timeout_covers_waiting_for_the_wallet(api, sdk):
+    wallet = Wallet(**fx.WALLET_JSON)
+
+    async def run():
+        lock = wallet_lock(wallet.id)
+        await lock.acquire()
+        try:
+            start = time.monotonic()
+            with pytest.raises(DeadlineExceeded):
+                await UniswapV2.swap(
+                    [fx.WETH, fx.TOKEN], wallet, 10**17, 0.01, timeout=0.05
+                )
+            with pytest.raises(DeadlineExceeded):
+                await Token(**fx.TOKEN_JSON).transfer(
+                    wallet, fx.WALLET_ADDRESS, 10**18, timeout=0.05
+                )
+            elapsed = time.monotonic() - start
+        finally:
+            lock.release()
+        # the lock is usable again once the timed out waiters gave up
+        await UniswapV2.swap([fx.WETH, fx.TOKEN], wallet, 10**17, 0.01, timeout=1)
+        return elapsed
+
+    assert asyncio.run(run()) < 0.5
+    assert api.calls == 1
+    assert not wallet_lock(wallet.id).locked()
@@ -0,0 +1,42 @@
+import asyncio
+import math
+
+import pytest
+
+from benchmarks import fixtures as fx
+from empyrealSDK import EmpyrealSDK
+from empyrealSDK.utils.feed import decode_feed, encode_feed, parse_feed_csv
+
+
+def _rows(columns) -> list[tuple]:
+    # nan != nan, so compare missing values as None
+    return [
+        tuple(None if isinstance(v, float) and math.isnan(v) else v for v in row)
+        for row in columns
+    ]
+
+
+def test_columnar_round_trip():
+    columns = parse_feed_csv(fx.make_feed_csv(100))
+    assert _rows(decode_feed(encode_feed(columns))) == _rows(columns)
+    # the first interval has no previous close
+    assert _rows(columns)[0][-1] is None
+
+
+def test_decode_rejects_truncated_feed():
+    data = encode_feed(parse_feed_csv(fx.make_feed_csv(10)))
+    with pytest.raises(ValueError, match="Truncated"):
+        decode_feed(data[:-8])
+    with pytest.raises(ValueError, match="Not a columnar"):
+        decode_feed(b"\0" * len(data))
+
+
+def test_columnar_and_csv_feeds_decode_the_same():
+    def load(columnar_feed: bool):
+        api = fx.MockAPI(feed_rows=60, columnar_feed=columnar_feed)
+        sdk = EmpyrealSDK("test-api-key", transport=api.transport())
+        return asyncio.run(sdk.prices.load_feed_columns(fx.PAIR))
+
+    columnar, csv = load(True), load(False)
+    assert len(columnar) == 60
+    assert _rows(columnar) == _rows(csv)
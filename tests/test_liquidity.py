@@ -0,0 +1,88 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from benchmarks import fixtures as fx
+from empyrealSDK import EmpyrealSDK
+from empyrealSDK.exc import UnknownError
+from empyrealSDK.types import DexPair, Network, Token, UniswapV2
+from empyrealSDK.types.dex import REORG_DEPTH
+
+PAIR_B = "0x0d4a11d5EEaaC28EC3F61d100daF4d40471f1852"
+
+
+def _pair(address: str) -> DexPair:
+    return DexPair(
+        factory_address=fx.FACTORY,
+        token0=Token(**fx.TOKEN_JSON),
+        token1=Token(**fx.WETH_JSON),
+        address=address,
+        index=1,
+        fee=0.003,
+        network=Network.Ethereum,
+        block_number=17_046_833,
+        transaction_hash=fx.TX_HASH,
+        factory=UniswapV2,
+    )
+
+
+def test_snapshot_pins_every_pair_to_one_block(api, sdk):
+    requests = []
+
+    def liquidity(request):
+        requests.append(json.loads(request.content))
+        return fx._json(fx.LIQUIDITY_JSON)
+
+    api.routes[("PUT", "dex/liquidity")] = liquidity
+    pairs = [_pair(fx.PAIR), _pair(PAIR_B.lower())]
+
+    snapshot = asyncio.run(DexPair.liquidity_snapshot(pairs, 19_000_000))
+
+    assert snapshot.block == 19_000_000
+    assert len(snapshot) == 2 and not snapshot.errors
+    assert [r["blockNumber"] for r in requests] == [19_000_000] * 2
+    # addresses are checksummed before they are sent
+    assert {r["pairAddress"] for r in requests} == {fx.PAIR, PAIR_B}
+    reserve0 = fx.LIQUIDITY_JSON["balances"]["token0"]["amount"]
+    assert snapshot[fx.PAIR].token0_balance == reserve0
+    # lookups do not depend on the letter case of the address
+    assert snapshot[PAIR_B].token0_balance == reserve0
+    assert fx.PAIR.lower() in snapshot and "0xnot-an-address" not in snapshot
+
+
+def test_series_caches_only_confirmed_blocks(api, sdk):
+    pair = _pair(fx.PAIR)
+    asyncio.run(pair.liquidity_series(1_000, 1_099))
+    assert api.calls == 100
+    # the last REORG_DEPTH blocks of the range may still be reorganised
+    asyncio.run(pair.liquidity_series(1_000, 1_099))
+    assert api.calls == 100 + REORG_DEPTH
+
+    api.calls = 0
+    asyncio.run(pair.liquidity_series(2_000, 2_099, head_block=2_099 + REORG_DEPTH))
+    asyncio.run(pair.liquidity_series(2_000, 2_099))
+    assert api.calls == 100
+
+
+def test_series_cancels_the_rest_on_error():
+    calls = []
+
+    async def liquidity(request):
+        calls.append(request)
+        await asyncio.sleep(0.001)
+        if json.loads(request.content)["blockNumber"] == 1_001:
+            return fx._json({"detail": "boom"}, 500)
+        return fx._json(fx.LIQUIDITY_JSON)
+
+    EmpyrealSDK("test-api-key", transport=httpx.MockTransport(liquidity))
+
+    async def run():
+        with pytest.raises(UnknownError):
+            await _pair(fx.PAIR).liquidity_series(1_000, 1_999, concurrency=4)
+        # fetches left running would keep sending requests
+        await asyncio.sleep(0.1)
+
+    asyncio.run(run())
+    assert len(calls) < 20
@@ -0,0 +1,84 @@
+import random
+
+from benchmarks import fixtures as fx
+from empyrealSDK.types import Wallet
+from empyrealSDK.types.orders import LimitOrder, LimitOrderType, OrderBook
+
+TOKEN = fx.TOKEN_JSON["address"]
+
+
+def _order(type: LimitOrderType, **kwargs) -> LimitOrder:
+    return LimitOrder(
+        type=type,
+        token=TOKEN,
+        wallet=Wallet(**fx.WALLET_JSON),
+        path=[TOKEN],
+        amount_in=1,
+        **kwargs,
+    )
+
+
+def test_triggers():
+    book = OrderBook()
+    stop = book.add(_order(LimitOrderType.StopLoss, trigger_price=0.8))
+    take = book.add(_order(LimitOrderType.TakeProfit, trigger_price=1.5))
+    trail = book.add(_order(LimitOrderType.TrailingStopLoss, trail_percent=0.1), 1.0)
+
+    assert book.update(TOKEN, 1.0) == []
+    assert book.update(TOKEN, 2.0) == [take]
+    # trailing from a peak of 2.0
+    assert book.update(TOKEN, 1.85) == []
+    assert book.update(TOKEN, 1.8) == [trail]
+    assert book.update(TOKEN, 0.5) == [stop]
+    assert len(book) == 0
+    assert book.tokens == []
+
+
+def test_cancel_removes_token():
+    book = OrderBook()
+    order = book.add(_order(LimitOrderType.StopLoss, trigger_price=0.8))
+    assert book.cancel(order.id) is order
+    assert book.cancel(order.id) is None
+    assert book.tokens == []
+    assert book.update(TOKEN, 0.1) == []
+
+
+def test_matches_brute_force():
+    rng = random.Random(0)
+    book = OrderBook()
+    # order id -> (order, peak)
+    open_orders: dict = {}
+    price = 1.0
+    for _ in range(3000):
+        action = rng.random()
+        if action < 0.3:
+            kind = rng.choice(list(LimitOrderType))
+            if kind == LimitOrderType.TrailingStopLoss:
+                order = _order(kind, trail_percent=rng.choice([0.05, 0.1, 0.2]))
+            else:
+                order = _order(kind, trigger_price=price * rng.uniform(0.7, 1.3))
+            book.add(order, price)
+            open_orders[order.id] = (order, price)
+        elif action < 0.4 and open_orders:
+            order_id = rng.choice(list(open_orders))
+            assert book.cancel(order_id) is open_orders.pop(order_id)[0]
+        else:
+            price *= rng.uniform(0.9, 1.1)
+            expected = set()
+            for order_id, (order, peak) in list(open_orders.items()):
+                peak = max(peak, price)
+                open_orders[order_id] = (order, peak)
+                if _triggered(order, price, peak):
+                    expected.add(order_id)
+                    del open_orders[order_id]
+            assert {o.id for o in book.update(TOKEN, price)} == expected
+        assert len(book) == len(open_orders)
+        assert book.tokens == ([TOKEN] if open_orders else [])
+
+
+def _triggered(order: LimitOrder, price: float, peak: float) -> bool:
+    if order.type == LimitOrderType.StopLoss:
+        return price <= order.trigger_price
+    if order.type == LimitOrderType.TakeProfit:
+        return price >= order.trigger_price
+    return price <= peak * (1 - order.trail_percent)
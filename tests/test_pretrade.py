@@ -0,0 +1,51 @@
+import asyncio
+
+from benchmarks import fixtures as fx
+from empyrealSDK.types import Token, Wallet, pretrade_check
+
+
+def _check(**kwargs):
+    return asyncio.run(
+        pretrade_check(
+            Token(**fx.TOKEN_JSON), Wallet(**fx.WALLET_JSON), 10**17, **kwargs
+        )
+    )
+
+
+def test_native_eth_needs_no_balance_or_allowance(api, sdk):
+    requested = []
+
+    def record(response):
+        def handler(request):
+            requested.append(request.url.path)
+            return response
+
+        return handler
+
+    api.routes[("PUT", "token/balance")] = record(fx._json({"balance": 0}))
+    api.routes[("GET", "token/allowance")] = record(fx._json({"allowance": 0}))
+
+    report = _check()
+
+    assert report.ok, report
+    assert requested == []
+    assert report.balance is None and report.allowance is None
+    assert report.buy_tax == 0.0 and report.sell_tax == 0.0
+
+
+def test_erc20_input_checks_token_balance(api, sdk):
+    api.routes[("PUT", "token/balance")] = lambda r: fx._json({"balance": 0})
+
+    report = _check(use_eth=False)
+
+    assert report.rejected == "insufficient balance"
+
+
+def test_taxes_come_from_the_security_report(api, sdk):
+    security = {**fx.SECURITY_JSON, "sellTax": 0.25}
+    api.routes[("GET", "security/")] = lambda r: fx._json({"report": security})
+
+    report = _check(max_tax=0.1)
+
+    assert report.sell_tax == 0.25
+    assert report.rejected == "sell tax 25.00% exceeds 10.00%"
@@ -0,0 +1,32 @@
+import pytest
+
+from empyrealSDK.utils import ratelimit
+from empyrealSDK.utils.ratelimit import TokenBucket
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(ratelimit.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_bursts_up_to_capacity(clock):
+    bucket = TokenBucket(rate=2, capacity=5)
+    assert [bucket.try_acquire() for _ in range(6)] == [True] * 5 + [False]
+    assert bucket.delay() == pytest.approx(0.5)
+
+
+def test_refills_at_rate_without_exceeding_capacity(clock):
+    bucket = TokenBucket(rate=2, capacity=5)
+    while bucket.try_acquire():
+        pass
+    clock[0] += 1
+    assert [bucket.try_acquire() for _ in range(3)] == [True, True, False]
+    clock[0] += 60
+    assert sum(bucket.try_acquire() for _ in range(10)) == 5
+
+
+def test_capacity_defaults_to_rate(clock):
+    bucket = TokenBucket(rate=3)
+    assert sum(bucket.try_acquire() for _ in range(10)) == 3
@@ -0,0 +1,90 @@
+import asyncio
+import gzip
+import json
+import time
+
+import httpx
+
+from empyrealSDK.utils.replay import (
+    REDACTED,
+    RecordedExchange,
+    RecordingTransport,
+    ReplayTransport,
+    load_recording,
+)
+
+
+class _Stream(httpx.AsyncByteStream):
+    """A response body as a server sends it, read lazily off the wire"""
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    async def __aiter__(self):
+        yield self.data
+
+
+def _gzip_handler(request: httpx.Request) -> httpx.Response:
+    body = json.dumps({"balance": 5, "privateKey": "0xSECRET"}).encode()
+    return httpx.Response(
+        200,
+        headers={"content-type": "application/json", "content-encoding": "gzip"},
+        stream=_Stream(gzip.compress(body)),
+    )
+
+
+async def _get(transport: httpx.AsyncBaseTransport, path: str) -> httpx.Response:
+    async with httpx.AsyncClient(transport=transport) as client:
+        return await client.get(f"http://api.test/{path}", headers={"API-KEY": "k"})
+
+
+def test_recording_gzip_response(tmp_path):
+    path = str(tmp_path / "session.jsonl.gz")
+    recorder = RecordingTransport(path, httpx.MockTransport(_gzip_handler))
+
+    response = asyncio.run(_get(recorder, "token/balance"))
+
+    assert response.json() == {"balance": 5, "privateKey": "0xSECRET"}
+    assert "content-encoding" not in response.headers
+    (exchange,) = load_recording(path)
+    assert json.loads(exchange.body) == {"balance": 5, "privateKey": REDACTED}
+    assert "content-encoding" not in exchange.headers
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "session.jsonl.gz")
+    recorder = RecordingTransport(path, httpx.MockTransport(_gzip_handler))
+    asyncio.run(_get(recorder, "token/balance"))
+
+    response = asyncio.run(_get(ReplayTransport(path), "token/balance"))
+    assert response.json() == {"balance": 5, "privateKey": REDACTED}
+
+
+def _exchange(started: float, elapsed: float) -> RecordedExchange:
+    return RecordedExchange(
+        method="GET",
+        path="/ping",
+        status_code=200,
+        headers={"content-type": "application/json"},
+        body="{}",
+        started=started,
+        elapsed=elapsed,
+    )
+
+
+def test_realtime_replay_keeps_gaps():
+    replay = ReplayTransport(
+        [_exchange(10.0, 0.01), _exchange(10.5, 0.01)], realtime=True
+    )
+
+    async def run():
+        async with httpx.AsyncClient(transport=replay) as client:
+            start = time.monotonic()
+            await client.get("http://api.test/ping")
+            first = time.monotonic() - start
+            await client.get("http://api.test/ping")
+            return first, time.monotonic() - start
+
+    first, total = asyncio.run(run())
+    assert first < 0.2
+    assert 0.5 <= total < 0.8
@@ -0,0 +1,66 @@
+import asyncio
+
+from benchmarks import fixtures as fx
+from empyrealSDK import EmpyrealSDK
+from empyrealSDK.types import Token, Wallet
+from empyrealSDK.types.application import Application
+
+PRIVATE_KEY = "0x" + "5eed" * 16
+
+
+def _save(api, sdk, path):
+    wallet = {**fx.WALLET_JSON, "privateKey": PRIVATE_KEY}
+    api.routes[("GET", "app/")] = lambda r: fx._json(
+        {**fx.APP_JSON, "appWallet": wallet}
+    )
+    api.routes[("GET", "wallets/app")] = lambda r: fx._json([wallet] * 2)
+
+    async def load():
+        application = await Application.load()
+        wallets = await Wallet.get_all()
+        await Token.load(fx.TOKEN)
+        return application, wallets
+
+    application, wallets = asyncio.run(load())
+    # the live objects keep their secrets, only the snapshot is redacted
+    assert application.app_wallet.private_key == PRIVATE_KEY
+    assert wallets[0].private_key == PRIVATE_KEY
+    sdk.save_snapshot(path)
+
+
+def test_snapshot_writes_no_secrets(api, sdk, tmp_path):
+    path = tmp_path / "sdk.snapshot"
+    _save(api, sdk, path)
+
+    data = path.read_bytes()
+    assert PRIVATE_KEY.encode() not in data
+    assert sdk.api_key.encode() not in data
+    assert fx.APP_JSON["apiKey"].encode() not in data
+
+
+def test_snapshot_restores_without_requests(api, sdk, tmp_path):
+    path = tmp_path / "sdk.snapshot"
+    _save(api, sdk, path)
+    calls = api.calls
+
+    restored = EmpyrealSDK.from_snapshot(path, sdk.api_key, transport=api.transport())
+
+    async def load():
+        application = await Application.load(cached=True)
+        token = await Token.load(fx.TOKEN)
+        return application, token
+
+    application, token = asyncio.run(load())
+    assert api.calls == calls
+    assert application.api_key == restored.api_key
+    assert application.app_wallet.private_key is None
+    assert token.address == fx.TOKEN
+
+
+def test_snapshot_for_another_key_keeps_only_the_cache(api, sdk, tmp_path):
+    path = tmp_path / "sdk.snapshot"
+    _save(api, sdk, path)
+
+    restored = EmpyrealSDK.from_snapshot(path, "other-key", transport=api.transport())
+    assert restored.application is None
+    assert any(key.startswith("token:") for key, _ in restored.cache.items())
@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+
+from benchmarks import fixtures as fx
+from empyrealSDK import EmpyrealSDK
+from empyrealSDK.exc import NotFoundError
+from empyrealSDK.types import User
+from empyrealSDK.utils import cache as cache_module
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_load_is_cached(api, sdk):
+    user = asyncio.run(User.load(fx.USER_JSON["telegramId"]))
+    assert asyncio.run(User.load(int(fx.USER_JSON["telegramId"]))) is user
+    assert api.calls == 1
+    User.invalidate(user.telegram_id)
+    asyncio.run(User.load(user.telegram_id))
+    assert api.calls == 2
+
+
+def test_not_found_is_cached(api, sdk):
+    api.routes[("GET", "users/telegram")] = lambda r: fx._json({"detail": "no"}, 400)
+    for _ in range(2):
+        with pytest.raises(NotFoundError):
+            asyncio.run(User.load("1"))
+    assert api.calls == 1
+
+
+@pytest.mark.parametrize("ttl, calls", [(60, 2), (None, 1)])
+def test_user_cache_ttl(api, clock, ttl, calls):
+    EmpyrealSDK("test-api-key", transport=api.transport(), user_cache_ttl=ttl)
+    asyncio.run(User.load("123456789"))
+    clock[0] += 3600 * 24
+    asyncio.run(User.load("123456789"))
+    assert api.calls == calls
@@ -0,0 +1,31 @@
+import asyncio
+
+from benchmarks import fixtures as fx
+from empyrealSDK.types import PriceWatcher
+
+
+def test_rewatch_is_polled_on_one_timer():
+    polls = []
+
+    async def run():
+        watcher = PriceWatcher(
+            min_interval=0.05, max_interval=0.05, requests_per_second=1000
+        )
+
+        async def fetch(watch):
+            polls.append(watch.key)
+            return 1.0
+
+        watcher._fetch = fetch  # type: ignore[method-assign]
+        runner = asyncio.ensure_future(watcher.run())
+        watcher.watch_price(fx.TOKEN)
+        await asyncio.sleep(0.02)
+        # re-watching before the old schedule entry comes due
+        watcher.unwatch(fx.TOKEN)
+        watcher.watch_price(fx.TOKEN)
+        await asyncio.sleep(0.5)
+        runner.cancel()
+
+    asyncio.run(run())
+    # ~11 polls on one timer, ~21 if the old entry kept its own timer running
+    assert 8 <= len(polls) <= 15